@@ -24,6 +24,7 @@ setup(
     version=meta["__version__"],
     packages=find_packages(exclude=["tests"]),
     package_data={"": ["LICENSE"]},
+    extras_require={"batch": ["numpy"]},
     entry_points={"console_scripts": [f"{PACKAGE} = {PACKAGE}.__main__:main"]},
     license=meta["__license__"],
 )
@@ -1,37 +1,160 @@
+from __future__ import annotations
+
+import importlib
+
 from .__meta__ import __author__, __description__, __license__, __title__, __version__
-from .boards import Board, Piece
-from .enums import Direction, MoveType, PlayState, Team
-from .games import Game, GameState
-from .journals import Journal
-from .moves import Move
-from .players import ConsolePlayer, Player
-from .rules import Rule, all_rules
-from .utils import Description, in_middle, to_char, to_int
-from .verifiers import Result, Verifier
+
+#: True for static type checkers only, so that typing is not imported at runtime.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from .boards import Board, Piece
+    from .books import Book
+    from .enums import (
+        Bound,
+        Direction,
+        Hypothesis,
+        MoveType,
+        Outcome,
+        PlayState,
+        Replacement,
+        Schedule,
+        Stage,
+        Team,
+    )
+    from .games import AsyncGame, Game, GameState
+    from .journals import Journal
+    from .metrics import Metrics
+    from .moves import Move
+    from .players import (
+        AsyncPlayer,
+        ConsolePlayer,
+        EnginePlayer,
+        MonteCarloPlayer,
+        Player,
+        ProcessPlayer,
+        ThreadPlayer,
+    )
+    from .rules import Rule, all_rules
+    from .tablebases import Tablebase
+    from .transpositions import TranspositionTable
+    from .utils import Description, in_middle, to_char, to_int
+    from .verifiers import Result, Verifier
+
+#: The submodule that defines each public name. Submodules are only imported when
+#: one of their names is first used, so that importing the package stays cheap.
+_EXPORTS = {
+    "AsyncGame": "games",
+    "AsyncPlayer": "players",
+    "Board": "boards",
+    "Book": "books",
+    "Bound": "enums",
+    "ConsolePlayer": "players",
+    "Description": "utils",
+    "Direction": "enums",
+    "EnginePlayer": "players",
+    "Game": "games",
+    "GameState": "games",
+    "Hypothesis": "enums",
+    "Journal": "journals",
+    "Metrics": "metrics",
+    "MonteCarloPlayer": "players",
+    "Move": "moves",
+    "MoveType": "enums",
+    "Outcome": "enums",
+    "Piece": "boards",
+    "PlayState": "enums",
+    "Player": "players",
+    "ProcessPlayer": "players",
+    "Replacement": "enums",
+    "Result": "verifiers",
+    "Rule": "rules",
+    "Schedule": "enums",
+    "Stage": "enums",
+    "Tablebase": "tablebases",
+    "Team": "enums",
+    "ThreadPlayer": "players",
+    "TranspositionTable": "transpositions",
+    "Verifier": "verifiers",
+    "all_rules": "rules",
+    "in_middle": "utils",
+    "to_char": "utils",
+    "to_int": "utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public name from its submodule on first use.
+
+    :param name: a public name
+    :return: the named object
+    :raise: AttributeError if the name is not public
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the names of the package, including those that are not imported yet.
+
+    :return: a sorted list of names
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 """
 # Generate all script
 import supercheckers as sc
 whitelist = ["__author__", "__description__", "__license__", "__title__", "__version__"]
-print(sorted(i for i in dir(sc) if callable(getattr(sc, i)) or i in whitelist))
+print(
+    sorted(
+        i
+        for i in dir(sc)
+        if (callable(getattr(sc, i)) and not i.startswith("_")) or i in whitelist
+    )
+)
 """
 
 __all__ = [
+    "AsyncGame",
+    "AsyncPlayer",
     "Board",
+    "Book",
+    "Bound",
     "ConsolePlayer",
     "Description",
     "Direction",
+    "EnginePlayer",
     "Game",
     "GameState",
+    "Hypothesis",
     "Journal",
+    "Metrics",
+    "MonteCarloPlayer",
     "Move",
     "MoveType",
+    "Outcome",
     "Piece",
     "PlayState",
     "Player",
+    "ProcessPlayer",
+    "Replacement",
     "Result",
     "Rule",
+    "Schedule",
+    "Stage",
+    "Tablebase",
     "Team",
+    "ThreadPlayer",
+    "TranspositionTable",
     "Verifier",
     "__author__",
     "__description__",
@@ -1,18 +1,364 @@
+import time
+
 import click
 
 import supercheckers as sc
 
 
-@click.command()
-def main():
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx):
+    """Play a game of Supercheckers on the console."""
+    if ctx.invoked_subcommand is None:
+        ctx.invoke(play)
+
+
+@main.command()
+@click.option("-m", "--metrics", type=click.Path(dir_okay=False), help="Metrics file.")
+@click.option(
+    "--metrics-format",
+    type=click.Choice(["json", "prometheus"]),
+    default="json",
+    show_default=True,
+)
+@click.option("--size", default=8, show_default=True, help="Rows and columns.")
+@click.option("--court", type=int, help="Court rows and columns.  [default: size-4]")
+def play(metrics, metrics_format, size, court):
+    """Play a game between two players on the console."""
+    from supercheckers import geometry
+    from supercheckers import metrics as metrics_
+
+    try:
+        board_geometry = geometry.get(size, size, court)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--size")
+
     player_1 = sc.ConsolePlayer(sc.Team.ONE)
     player_2 = sc.ConsolePlayer(sc.Team.TWO)
 
-    state = sc.GameState(player_1, player_2, sc.Journal(sc.Board()))
-    verifier = sc.Verifier(sc.all_rules())
-    with sc.Game(state, verifier) as game:
-        while game.in_progress:
-            game.take_turn()
+    game_metrics = metrics_.Metrics() if metrics else None
+    board = sc.Board(geometry=board_geometry)
+    state = sc.GameState(player_1, player_2, sc.Journal(board))
+    verifier = sc.Verifier(sc.all_rules(), game_metrics)
+    try:
+        with sc.Game(state, verifier, metrics=game_metrics) as game:
+            while game.in_progress:
+                game.take_turn()
+    finally:
+        if game_metrics is not None:
+            game_metrics.export(metrics, metrics_format)
+
+
+@main.command()
+@click.option("-n", "--games", "games_count", default=100, show_default=True)
+@click.option("-w", "--workers", default=0, show_default=True, help="0 for none.")
+@click.option("-s", "--seed", default=0, show_default=True, help="Seed of game 1.")
+@click.option("-d", "--depth", default=2, show_default=True, help="Engine depth.")
+@click.option("--nodes", type=int, help="Engine node budget per move.")
+@click.option("--max-turns", default=500, show_default=True)
+@click.option("--random-turns", default=4, show_default=True)
+@click.option("-o", "--output", type=click.File("w"), default="-")
+@click.option("-a", "--archive", type=click.Path(), help="Append to a game archive.")
+@click.option(
+    "-t", "--tablebase", type=click.Path(exists=True), help="Endgame tablebase file."
+)
+@click.option("-b", "--book", type=click.Path(exists=True), help="Opening book file.")
+def selfplay(
+    games_count,
+    workers,
+    seed,
+    depth,
+    nodes,
+    max_turns,
+    random_turns,
+    output,
+    archive,
+    tablebase,
+    book,
+):
+    """Play engine games without console output, writing JSON lines or an archive."""
+    import json
+
+    from supercheckers import archives, books, selfplay as selfplay_, tablebases
+
+    table = tablebases.Tablebase(tablebase) if tablebase else None
+    opening_book = books.Book(book) if book else None
+    player_1, player_2 = (
+        sc.EnginePlayer(
+            team,
+            max_depth=depth,
+            node_limit=nodes,
+            tablebase=table,
+            book=opening_book,
+        )
+        for team in sc.Team
+    )
+    writer = archives.ArchiveWriter(archive, append=True) if archive else None
+
+    def sink(index, record):
+        if writer:
+            writer.append(record)
+        else:
+            output.write(json.dumps(dict(game=index, **record.to_dict())) + "\n")
+
+    start = time.perf_counter()
+    try:
+        results = selfplay_.run_to_sink(
+            player_1,
+            player_2,
+            games_count,
+            sink,
+            workers=workers,
+            seed=seed,
+            max_turns=max_turns,
+            random_turns=random_turns,
+        )
+    finally:
+        if writer:
+            writer.close()
+    elapsed = time.perf_counter() - start
+    summary = ", ".join(
+        f"{team.value if team else 'none'}: {count}" for team, count in results.items()
+    )
+    click.echo(
+        f"{games_count} games in {elapsed:.1f}s "
+        f"({games_count / elapsed:.1f} games/s), wins {summary}",
+        err=True,
+    )
+
+
+@main.command()
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.argument("destination", type=click.Path(dir_okay=False))
+def convert(source, destination):
+    """Convert games between the text notation and the binary archive format.
+
+    A SOURCE archive is written to DESTINATION as text, anything else is read as
+    text and appended to the DESTINATION archive.
+    """
+    from supercheckers import archives, notation
+
+    start = time.perf_counter()
+    try:
+        archives.Archive(source).close()
+    except archives.ArchiveError:
+        with open(source) as file:
+            try:
+                count = notation.to_archive(file, destination, append=True)
+            except notation.NotationError as e:
+                raise click.ClickException(str(e))
+    else:
+        with open(destination, "w") as file:
+            count = notation.from_archive(source, file)
+    elapsed = time.perf_counter() - start
+    click.echo(f"{count} games in {elapsed:.1f}s", err=True)
+
+
+@main.command()
+@click.argument("path", type=click.Path(dir_okay=False))
+@click.option("-p", "--pieces", default=3, show_default=True, help="Maximum pieces.")
+def tablebase(path, pieces):
+    """Solve every endgame with up to --pieces pieces into a tablebase file."""
+    from supercheckers import tablebases
+
+    start = time.perf_counter()
+    try:
+        size = tablebases.generate(path, pieces)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--pieces")
+    elapsed = time.perf_counter() - start
+    click.echo(f"{size} positions in {elapsed:.1f}s", err=True)
+
+
+@main.command()
+@click.argument("path", type=click.Path(dir_okay=False))
+@click.option("-t", "--turns", default=4, show_default=True, help="Turns to cover.")
+@click.option("-d", "--depth", default=4, show_default=True, help="Engine depth.")
+@click.option(
+    "-w", "--workers", type=int, help="Processes, 0 for none. [default: CPUs]"
+)
+@click.option("-e", "--extend", is_flag=True, help="Keep the existing book entries.")
+def book(path, turns, depth, workers, extend):
+    """Search every opening position up to --turns into an opening book file."""
+    from supercheckers import books
+
+    start = time.perf_counter()
+    count = books.build(path, turns, depth, workers, extend)
+    elapsed = time.perf_counter() - start
+    click.echo(f"{count} positions in {elapsed:.1f}s", err=True)
+
+
+@main.command()
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option("-d", "--depth", default=3, show_default=True, help="Engine depth.")
+@click.option("--nodes", type=int, help="Engine node budget per position.")
+@click.option(
+    "-w", "--workers", type=int, help="Processes, 0 for none. [default: CPUs]"
+)
+@click.option(
+    "--blunder", default=0.3, show_default=True, help="Win chance a blunder loses."
+)
+@click.option(
+    "--swing", default=0.25, show_default=True, help="Win chance a swing changes."
+)
+@click.option(
+    "--resume/--restart",
+    default=True,
+    show_default=True,
+    help="Skip the games already in OUTPUT.",
+)
+def analyze(source, output, depth, nodes, workers, blunder, swing, resume):
+    """Search every position of recorded games for blunders, swings and accuracy.
+
+    SOURCE is a game archive or a text notation file, and one JSON line per game is
+    appended to OUTPUT as soon as the game is analyzed.
+    """
+    from supercheckers import analysis, notation
+
+    if depth < 2:
+        raise click.BadParameter("must be at least 2", param_hint="--depth")
+    start = time.perf_counter()
+    try:
+        count, skipped = analysis.analyze_to_file(
+            source,
+            output,
+            resume,
+            blunder,
+            swing,
+            workers=workers,
+            max_depth=depth,
+            node_limit=nodes,
+        )
+    except notation.NotationError as e:
+        raise click.ClickException(str(e))
+    elapsed = time.perf_counter() - start
+    click.echo(f"{count} games in {elapsed:.1f}s, {skipped} already analyzed", err=True)
+
+
+@main.command()
+@click.option(
+    "-p",
+    "--player",
+    "specs",
+    multiple=True,
+    required=True,
+    help="NAME=KIND[:KEY=VALUE,...] with KIND engine or montecarlo, e.g. "
+    "deep=engine:max_depth=4.",
+)
+@click.option("-r", "--rounds", default=10, show_default=True)
+@click.option("--gauntlet", is_flag=True, help="Only pair the first player.")
+@click.option(
+    "-w", "--workers", type=int, help="Processes, 0 for none. [default: CPUs]"
+)
+@click.option("-s", "--seed", default=0, show_default=True, help="Seed of game 1.")
+@click.option("--max-turns", default=500, show_default=True)
+@click.option("--random-turns", default=4, show_default=True)
+@click.option(
+    "--sprt",
+    nargs=2,
+    type=float,
+    metavar="ELO0 ELO1",
+    help="Stop once the Elo difference of the first player is ELO0 or ELO1.",
+)
+@click.option("--alpha", default=0.05, show_default=True, help="SPRT alpha.")
+@click.option("--beta", default=0.05, show_default=True, help="SPRT beta.")
+@click.option("-o", "--output", type=click.File("w"), help="JSON lines game file.")
+def tournament(
+    specs,
+    rounds,
+    gauntlet,
+    workers,
+    seed,
+    max_turns,
+    random_turns,
+    sprt,
+    alpha,
+    beta,
+    output,
+):
+    """Play a round robin or gauntlet tournament and estimate Elo differences."""
+    import json
+
+    from supercheckers import enums, tournaments
+
+    try:
+        factories = dict(tournaments.parse_player(spec) for spec in specs)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--player")
+    if len(factories) < 2:
+        raise click.BadParameter(
+            "at least two players are needed", param_hint="--player"
+        )
+    test = tournaments.SPRT(*sprt, alpha, beta) if sprt else None
+
+    def sink(pairing, record):
+        if output:
+            line = dict(pairing._asdict(), **record.to_dict())
+            output.write(json.dumps(line) + "\n")
+
+    start = time.perf_counter()
+    result = tournaments.run(
+        factories,
+        rounds,
+        enums.Schedule.GAUNTLET if gauntlet else enums.Schedule.ROUND_ROBIN,
+        workers,
+        seed,
+        max_turns,
+        random_turns,
+        test,
+        sink,
+    )
+    elapsed = time.perf_counter() - start
+    click.echo(result.standings.report())
+    if test:
+        lower, upper = test.bounds
+        verdict = result.hypothesis.value if result.hypothesis else "undecided"
+        click.echo(
+            f"\nSPRT: llr {result.llr or 0.0:.2f} [{lower:.2f}, {upper:.2f}], "
+            f"{verdict}"
+        )
+    click.echo(f"{result.standings.games} games in {elapsed:.1f}s", err=True)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("-p", "--port", default=7878, show_default=True)
+@click.option("--move-timeout", type=float, default=60.0, show_default=True)
+@click.option("--match-timeout", type=float, help="Seconds to wait for an opponent.")
+def serve(host, port, move_timeout, match_timeout):
+    """Host games over TCP until interrupted."""
+    import asyncio
+
+    from supercheckers import servers
+
+    click.echo(f"Serving on {host}:{port}", err=True)
+    server = asyncio.run(servers.serve(host, port, move_timeout, match_timeout))
+    summary = ", ".join(
+        f"{reason.value}: {count}" for reason, count in server.results.items()
+    )
+    click.echo(f"Shut down, games {summary or 'none'}", err=True)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("-p", "--port", default=7878, show_default=True)
+@click.option("-n", "--games", "games_count", default=100, show_default=True)
+@click.option("--max-turns", default=200, show_default=True)
+@click.option("-s", "--seed", default=0, show_default=True)
+def loadtest(host, port, games_count, max_turns, seed):
+    """Play concurrent random games against a server and report its latency."""
+    import asyncio
+
+    from supercheckers import servers
+
+    result = asyncio.run(servers.load_test(host, port, games_count, max_turns, seed))
+    click.echo(
+        f"{result.games} games, {result.moves} moves in {result.elapsed:.1f}s "
+        f"({result.moves_per_second:.0f} moves/s), latency "
+        f"p50 {result.percentile(50) * 1000:.1f}ms, "
+        f"p99 {result.percentile(99) * 1000:.1f}ms"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,385 @@
+import concurrent.futures
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from . import archives, boards, enums, games, journals, moves, notation, search
+
+#: Evaluations are capped at this value before they are turned into win chances.
+EVAL_CAP = 40.0
+
+#: The evaluation that gives a 73% win chance, one piece in the court.
+WIN_CHANCE_SCALE = search.COURT_WEIGHT
+
+#: A move that loses at least this much win chance against the best move is a blunder.
+DEFAULT_BLUNDER = 0.3
+
+#: A change of at least this much win chance over a full turn is a swing.
+DEFAULT_SWING = 0.25
+
+
+@dataclass
+class PlyAnalysis:
+    """The Analysis of a single Move of a game."""
+
+    ply: int
+    team: enums.Team
+    move: moves.Move
+    best_move: Optional[moves.Move]
+    value: float
+    played_value: float
+
+    @property
+    def loss(self) -> float:
+        """
+        Return the win chance lost by playing this Move instead of the best Move.
+
+        :return: a win chance between 0 and 1
+        """
+        return max(0.0, win_chance(self.value) - win_chance(self.played_value))
+
+    @property
+    def accuracy(self) -> float:
+        """
+        Return the accuracy of this Move, from 0 for a lost game to 100 for the best.
+
+        :return: a percentage
+        """
+        accuracy = 103.1668 * math.exp(-4.354 * self.loss) - 3.1669
+        return min(100.0, max(0.0, accuracy))
+
+
+@dataclass
+class GameAnalysis:
+    """The Analysis of every Move of a game."""
+
+    index: int
+    record: games.GameRecord
+    plies: List[PlyAnalysis] = field(default_factory=list)
+    evaluations: List[float] = field(default_factory=list)
+
+    def accuracy(self, team: enums.Team) -> Optional[float]:
+        """
+        Return the mean accuracy of the Moves of a team.
+
+        :param team: a Team
+        :return: a percentage, or None if the team did not move
+        """
+        accuracies = [ply.accuracy for ply in self.plies if ply.team == team]
+        return sum(accuracies) / len(accuracies) if accuracies else None
+
+    def blunders(self, threshold: float = DEFAULT_BLUNDER) -> List[PlyAnalysis]:
+        """
+        Return the Moves that lost at least threshold win chance.
+
+        :param threshold: a win chance between 0 and 1
+        :return: a list of PlyAnalysis
+        """
+        return [ply for ply in self.plies if ply.loss >= threshold]
+
+    def swings(self, threshold: float = DEFAULT_SWING) -> List[int]:
+        """
+        Return the plies that changed the win chance of Team.ONE by at least threshold.
+
+        A position is compared with the position two plies earlier, with the same team
+        to move, because the team to move is usually ahead in the court.
+
+        :param threshold: a win chance between 0 and 1
+        :return: a list of ply numbers, starting at 1
+        """
+        chances = [win_chance(value) for value in self.evaluations]
+        return [
+            ply
+            for ply in range(2, len(chances))
+            if abs(chances[ply] - chances[ply - 2]) >= threshold
+        ]
+
+    def to_dict(
+        self, blunder: float = DEFAULT_BLUNDER, swing: float = DEFAULT_SWING
+    ) -> Dict[str, Any]:
+        """
+        Return a JSON serializable summary of this analysis.
+
+        Evaluations are for Team.ONE, before every Move and after the last one.
+
+        :param blunder: the win chance a blunder loses
+        :param swing: the win chance a swing changes
+        :return: a dict
+        """
+        return {
+            "game": self.index,
+            "result": notation.RESULT_TOKENS[archives.to_result(self.record)],
+            "turns": len(self.plies),
+            "accuracy": {
+                team.value: _round(self.accuracy(team), 1) for team in enums.Team
+            },
+            "blunders": [
+                {
+                    "ply": ply.ply,
+                    "team": ply.team.value,
+                    "move": notation.format_move(ply.move),
+                    "best": (
+                        notation.format_move(ply.best_move) if ply.best_move else None
+                    ),
+                    "loss": round(ply.loss, 4),
+                }
+                for ply in self.blunders(blunder)
+            ],
+            "swings": self.swings(swing),
+            "evaluations": [round(value, 2) + 0.0 for value in self.evaluations],
+        }
+
+
+def win_chance(value: float) -> float:
+    """
+    Turn an evaluation into the chance that the team it is for wins.
+
+    :param value: an evaluation, see search.evaluate
+    :return: a win chance between 0 and 1
+    """
+    value = min(EVAL_CAP, max(-EVAL_CAP, value))
+    return 1 / (1 + math.exp(-value / WIN_CHANCE_SCALE))
+
+
+def _for_team_one(value: float, team: enums.Team) -> float:
+    """
+    Turn an evaluation for a team into an evaluation for Team.ONE, capped.
+
+    :param value: an evaluation for team
+    :param team: a Team
+    :return: an evaluation for Team.ONE
+    """
+    value = min(EVAL_CAP, max(-EVAL_CAP, value))
+    return value if team == enums.Team.ONE else -value
+
+
+def _round(value: Optional[float], digits: int) -> Optional[float]:
+    """
+    Round a value that may be None.
+
+    :param value: a value, or None
+    :param digits: the number of decimal digits
+    :return: the rounded value, or None
+    """
+    return None if value is None else round(value, digits)
+
+
+def _evaluate(
+    searcher: search.Searcher, journal: journals.Journal
+) -> Tuple[float, Optional[moves.Move]]:
+    """
+    Evaluate the current position of a journal for the team to move.
+
+    :param searcher: a Searcher
+    :param journal: a Journal
+    :return: a (value, best Move or None) tuple
+    """
+    board = journal.current_board
+    team = journal.current_team
+    turn_number = journal.current_turn_number
+    game_over, winning_team = search.winner(board, turn_number)
+    if game_over:
+        if winning_team is None:
+            return 0.0, None
+        return (search.WIN_SCORE if winning_team == team else -search.WIN_SCORE), None
+    searcher.table.clear()
+    try:
+        result = searcher.search(board, team, turn_number)
+    except ValueError:
+        return search.evaluate(board, team), None
+    return result.value, result.move
+
+
+def analyze_game(
+    index: int, record: games.GameRecord, searcher: search.Searcher
+) -> GameAnalysis:
+    """
+    Replay a game and search every position of it.
+
+    Every position is searched to the depth of the searcher for its best Move, and one
+    ply shallower for the value of the Move that led to it, so that the played and the
+    best Move of a turn are valued at the same horizon. Each search starts from an
+    empty transposition table, so deeper results of earlier searches do not leak in.
+    The evaluation of a position comes from the search with an even depth, where both
+    teams move as often before the board is evaluated.
+
+    :param index: the index of the game
+    :param record: a GameRecord
+    :param searcher: a Searcher with a max_depth of at least 2
+    :return: a GameAnalysis
+    :raise: ValueError if the searcher is too shallow
+    """
+    if searcher.max_depth < 2:
+        raise ValueError(f"Invalid analysis depth: {searcher.max_depth!r}")
+    shallow = search.Searcher(
+        searcher.max_depth - 1,
+        searcher.time_limit,
+        searcher.node_limit,
+        tablebase=searcher.tablebase,
+    )
+    even_deep = searcher.max_depth % 2 == 0
+    analysis = GameAnalysis(index, record)
+    journal = journals.Journal(boards.Board())
+    for ply in range(len(record.moves) + 1):
+        team = journal.current_team
+        value, best_move = _evaluate(searcher, journal)
+        shallow_value, _ = _evaluate(shallow, journal)
+        even_value = value if even_deep else shallow_value
+        analysis.evaluations.append(_for_team_one(even_value, team))
+        if ply:
+            analysis.plies[-1].played_value = -shallow_value
+        if ply < len(record.moves):
+            move = record.moves[ply]
+            analysis.plies.append(
+                PlyAnalysis(ply + 1, team, move, best_move, value, -value)
+            )
+            journal.apply(move)
+    return analysis
+
+
+def read_records(path: str) -> Iterator[games.GameRecord]:
+    """
+    Read the games of a game archive, or of a file in the text notation.
+
+    :param path: the file path
+    :return: an Iterator of GameRecords
+    """
+    try:
+        archive = archives.Archive(path)
+    except archives.ArchiveError:
+        with open(path) as file:
+            yield from notation.read_games(file)
+    else:
+        with archive:
+            yield from archive
+
+
+def completed(path: str) -> Set[int]:
+    """
+    Find the games already analyzed in an output file, and drop any partial line.
+
+    :param path: the JSON lines output path
+    :return: a set of game indexes
+    """
+    if not os.path.exists(path):
+        return set()
+    result = set()
+    with open(path, "rb+") as file:
+        end = 0
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            result.add(json.loads(line)["game"])
+            end += len(line)
+        file.truncate(end)
+    return result
+
+
+_worker_searcher: Dict[str, search.Searcher] = {}
+
+
+def _init_worker(max_depth: int, node_limit: Optional[int]) -> None:
+    """
+    Create the Searcher of this worker process.
+
+    :param max_depth: the search depth in plies
+    :param node_limit: an optional node budget per position
+    """
+    _worker_searcher["searcher"] = search.Searcher(max_depth, node_limit=node_limit)
+
+
+def _analyze_worker_game(index: int, record: games.GameRecord) -> GameAnalysis:
+    """
+    Analyze a game with the Searcher of this worker process.
+
+    :param index: the index of the game
+    :param record: a GameRecord
+    :return: a GameAnalysis
+    """
+    return analyze_game(index, record, _worker_searcher["searcher"])
+
+
+def run(
+    records: Iterable[Tuple[int, games.GameRecord]],
+    workers: Optional[int] = None,
+    max_depth: int = 3,
+    node_limit: Optional[int] = None,
+) -> Iterator[GameAnalysis]:
+    """
+    Analyze many games, yielding each analysis as soon as it finishes.
+
+    Games are spread over a process pool one game at a time, and at most a few games
+    per worker are queued, so memory does not grow with the number of games. Finished
+    analyses may be yielded out of order.
+
+    :param records: (index, GameRecord) tuples
+    :param workers: the number of worker processes, 0 for none, None for one per CPU
+    :param max_depth: the search depth in plies
+    :param node_limit: an optional node budget per position
+    :return: an Iterator of GameAnalysis
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not workers:
+        _init_worker(max_depth, node_limit)
+        for index, record in records:
+            yield _analyze_worker_game(index, record)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(max_depth, node_limit)
+    ) as executor:
+        pending: Set[concurrent.futures.Future] = set()
+        iterator = iter(records)
+        exhausted = False
+        while not exhausted or pending:
+            while not exhausted and len(pending) < workers * 4:
+                item = next(iterator, None)
+                if item is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(_analyze_worker_game, *item))
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+
+
+def analyze_to_file(
+    source: str,
+    path: str,
+    resume: bool = True,
+    blunder: float = DEFAULT_BLUNDER,
+    swing: float = DEFAULT_SWING,
+    **kwargs: Any,
+) -> Tuple[int, int]:
+    """
+    Analyze the games of a file and append one JSON line per game to an output file.
+
+    Every line is flushed as soon as its game is analyzed. When resuming, the games
+    already in the output file are skipped, so a crashed run can be started again.
+
+    :param source: a game archive, or a file in the text notation
+    :param path: the JSON lines output path
+    :param resume: False to start over and replace the output file
+    :param blunder: the win chance a blunder loses
+    :param swing: the win chance a swing changes
+    :param kwargs: the keyword arguments of run
+    :return: a (games analyzed, games skipped) tuple
+    """
+    done = completed(path) if resume else set()
+    records = (
+        (index, record)
+        for index, record in enumerate(read_records(source))
+        if index not in done
+    )
+    count = 0
+    with open(path, "a" if resume else "w") as file:
+        for analysis in run(records, **kwargs):
+            file.write(json.dumps(analysis.to_dict(blunder, swing)) + "\n")
+            file.flush()
+            count += 1
+    return count, len(done)
@@ -0,0 +1,388 @@
+import bisect
+import mmap
+import os
+import struct
+from typing import IO, Iterator, List, NamedTuple, Optional, Tuple
+
+from . import enums, games, geometry, journals, moves
+
+MAGIC = b"SCARCHV\0"
+VERSION = 2
+
+#: magic, version, game count, offset of the last index segment
+HEADER = struct.Struct("<8sHxxxxxxQQ")
+#: offset of the previous index segment (0 for none), record count
+SEGMENT = struct.Struct("<QQ")
+#: move stream offset, seed (-1 for none), move stream size, plies, result
+RECORD = struct.Struct("<QqIHBx")
+
+#: The number of games an ArchiveWriter appends between checkpoints.
+CHECKPOINT_GAMES = 1024
+
+RESULT_UNFINISHED = 0
+RESULT_WIN_1 = 1
+RESULT_WIN_2 = 2
+RESULT_DRAW = 3
+RESULT_ERROR = 4
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive file is invalid."""
+
+
+class RecordInfo(NamedTuple):
+    """The fixed-width index Record of a single game in an archive."""
+
+    offset: int
+    seed: Optional[int]
+    size: int
+    plies: int
+    result: int
+
+
+def to_result(record: games.GameRecord) -> int:
+    """
+    Return the archive result code of a game.
+
+    :param record: a GameRecord
+    :return: one of the RESULT_* codes
+    """
+    if record.play_state == enums.PlayState.ERROR:
+        return RESULT_ERROR
+    if record.play_state != enums.PlayState.COMPLETE:
+        return RESULT_UNFINISHED
+    if record.winner == enums.Team.ONE:
+        return RESULT_WIN_1
+    if record.winner == enums.Team.TWO:
+        return RESULT_WIN_2
+    return RESULT_DRAW
+
+
+_PLAY_STATES = {
+    RESULT_UNFINISHED: (enums.PlayState.IN_PROGRESS, None),
+    RESULT_WIN_1: (enums.PlayState.COMPLETE, enums.Team.ONE),
+    RESULT_WIN_2: (enums.PlayState.COMPLETE, enums.Team.TWO),
+    RESULT_DRAW: (enums.PlayState.COMPLETE, None),
+    RESULT_ERROR: (enums.PlayState.ERROR, None),
+}
+
+
+def pack_moves(move_list: List[moves.Move]) -> bytes:
+    """
+    Pack Moves into a move stream.
+
+    Each Move is one byte with the team in the high bit and the number of locations
+    in the low bits, followed by one byte per location with its square index.
+
+    :param move_list: a list of Moves
+    :return: the packed move stream
+    :raise: ValueError if a Move can not be packed
+    """
+    result = bytearray()
+    for move in move_list:
+        code = moves.encode(move)
+        count = moves.length(code)
+        result.append((code & 1) << 7 | count)
+        code >>= moves.HEADER_BITS
+        for _ in range(count):
+            result.append(code & (1 << moves.SQUARE_BITS) - 1)
+            code >>= moves.SQUARE_BITS
+    return bytes(result)
+
+
+def unpack_moves(stream: bytes) -> List[moves.Move]:
+    """
+    Unpack a move stream into Moves.
+
+    :param stream: a packed move stream
+    :return: a list of Moves
+    :raise: ArchiveError if the move stream is invalid
+    """
+    result = []
+    position = 0
+    while position < len(stream):
+        header = stream[position]
+        count = header & 0x7F
+        squares = stream[position + 1 : position + 1 + count]
+        if len(squares) != count or count > moves.MAX_LOCATIONS:
+            raise ArchiveError(f"Truncated move at byte {position}")
+        code = header >> 7 | count << 1
+        shift = moves.HEADER_BITS
+        for square in squares:
+            if square >= geometry.SQUARES:
+                raise ArchiveError(f"Invalid square at byte {position}")
+            code |= square << shift
+            shift += moves.SQUARE_BITS
+        result.append(moves.decode(code))
+        position += 1 + count
+    return result
+
+
+class ArchiveWriter:
+    """
+    A writer that appends finished games to an archive file.
+
+    An archive file has a fixed-size header, then the packed move streams of every
+    game, interleaved with index segments. Each index segment holds one fixed-width
+    record per game written since the previous segment, and points back to it. The
+    header points to the last segment.
+
+    Games are committed at each checkpoint, every checkpoint games and when the
+    writer is closed: the pending records are written as a new segment after the
+    move streams, synced to disk, and only then is the header pointed at it. A crash
+    loses the games since the last checkpoint, and leaves their move streams as
+    unused bytes. Segments are never rewritten, so appending never leaves stale
+    copies of the index behind.
+    """
+
+    def __init__(
+        self, path: str, append: bool = False, checkpoint: int = CHECKPOINT_GAMES
+    ):
+        """
+        Open an archive file for writing.
+
+        :param path: the archive file path
+        :param append: True to add games to an existing archive
+        :param checkpoint: the number of games between checkpoints
+        :raise: ArchiveError if appending to an invalid archive
+        """
+        self.path = path
+        self.checkpoint_games = checkpoint
+        self.count = 0
+        self._segment_offset = 0
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._created = not (append and os.path.exists(path))
+        if not self._created:
+            Archive(path).close()
+            self._file: IO[bytes] = open(path, "r+b")
+            self.count, self._segment_offset = _read_header(self._file)
+            self._start = (
+                self.count,
+                self._segment_offset,
+                self._file.seek(0, os.SEEK_END),
+            )
+        else:
+            self._file = open(path, "w+b")
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+            self.checkpoint()
+
+    def append(self, record: games.GameRecord) -> int:
+        """
+        Append a finished game to the archive.
+
+        :param record: a GameRecord
+        :return: the index of the game in the archive
+        """
+        stream = pack_moves(record.moves)
+        offset = self._file.tell()
+        self._file.write(stream)
+        seed = -1 if record.seed is None else record.seed
+        self._pending += RECORD.pack(
+            offset, seed, len(stream), len(record.moves), to_result(record)
+        )
+        self._pending_count += 1
+        self.count += 1
+        if self._pending_count >= self.checkpoint_games:
+            self.checkpoint()
+        return self.count - 1
+
+    def checkpoint(self) -> None:
+        """
+        Commit the games appended so far.
+
+        The new index segment is synced to disk before the header points to it.
+        """
+        offset = self._file.tell()
+        self._file.write(SEGMENT.pack(self._segment_offset, self._pending_count))
+        self._file.write(self._pending)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.count, offset))
+        self._file.flush()
+        self._file.seek(0, os.SEEK_END)
+        self._segment_offset = offset
+        self._pending.clear()
+        self._pending_count = 0
+
+    def close(self) -> None:
+        """Commit any pending games, and close the archive file."""
+        if self._file.closed:
+            return
+        if self._pending_count:
+            self.checkpoint()
+        self._file.close()
+
+    def abort(self) -> None:
+        """
+        Discard every game appended since the writer was opened, and close it.
+
+        An archive created by the writer is removed. An archive that was appended to
+        is pointed back at its original index before its new bytes are truncated.
+        """
+        if self._file.closed:
+            return
+        if self._created:
+            self._file.close()
+            os.remove(self.path)
+            return
+        count, segment_offset, size = self._start
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, count, segment_offset))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.truncate(size)
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _read_header(file: IO[bytes]) -> Tuple[int, int]:
+    """
+    Read and check the header of an archive file.
+
+    :param file: an archive file opened in binary mode
+    :return: a (game count, last index segment offset) tuple
+    :raise: ArchiveError if the header is invalid
+    """
+    file.seek(0)
+    data = file.read(HEADER.size)
+    if len(data) != HEADER.size:
+        raise ArchiveError("Truncated archive header")
+    magic, version, count, segment_offset = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ArchiveError("Not a supported archive file")
+    if segment_offset < HEADER.size:
+        raise ArchiveError("Archive was not closed")
+    return count, segment_offset
+
+
+class Archive:
+    """
+    A reader of an archive file.
+
+    The file is memory mapped, and only the index segment headers are read when it
+    is opened, so reading any single game only touches its own index record and
+    move stream, regardless of the number of games.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open an archive file for reading.
+
+        :param path: the archive file path
+        :raise: ArchiveError if the file is not a valid archive
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._count, segment_offset = _read_header(file)
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._starts, self._segments = self._read_segments(segment_offset)
+        except ArchiveError:
+            self.close()
+            raise
+
+    def _read_segments(self, segment_offset: int) -> Tuple[List[int], List[int]]:
+        """
+        Read the chain of index segments, from the last one back to the first.
+
+        :param segment_offset: the offset of the last index segment
+        :return: the index of the first game and the offset of the first record of
+            each segment, in file order
+        :raise: ArchiveError if a segment is invalid
+        """
+        segments = []
+        counts = []
+        while True:
+            if segment_offset + SEGMENT.size > len(self._mmap):
+                raise ArchiveError("Truncated archive index")
+            previous, count = SEGMENT.unpack_from(self._mmap, segment_offset)
+            records_offset = segment_offset + SEGMENT.size
+            if records_offset + count * RECORD.size > len(self._mmap):
+                raise ArchiveError("Truncated archive index")
+            segments.append(records_offset)
+            counts.append(count)
+            if not previous:
+                break
+            if not HEADER.size <= previous < segment_offset:
+                raise ArchiveError("Invalid archive index")
+            segment_offset = previous
+        segments.reverse()
+        counts.reverse()
+        starts = [0]
+        for count in counts:
+            starts.append(starts[-1] + count)
+        if starts.pop() != self._count:
+            raise ArchiveError("Invalid archive index")
+        return starts, segments
+
+    def info(self, index: int) -> RecordInfo:
+        """
+        Return the index Record of a game.
+
+        :param index: the index of the game
+        :return: a RecordInfo
+        :raise: IndexError if there is no such game
+        """
+        if index < 0:
+            index += self._count
+        if not (0 <= index < self._count):
+            raise IndexError(f"Invalid game index: {index!r}")
+        segment = bisect.bisect_right(self._starts, index) - 1
+        offset, seed, size, plies, result = RECORD.unpack_from(
+            self._mmap,
+            self._segments[segment] + (index - self._starts[segment]) * RECORD.size,
+        )
+        return RecordInfo(offset, None if seed < 0 else seed, size, plies, result)
+
+    def __getitem__(self, index: int) -> games.GameRecord:
+        """
+        Read a game.
+
+        :param index: the index of the game
+        :return: a GameRecord
+        :raise: IndexError if there is no such game
+        """
+        info = self.info(index)
+        move_list = unpack_moves(self._mmap[info.offset : info.offset + info.size])
+        if len(move_list) != info.plies:
+            raise ArchiveError(f"Corrupt move stream for game {index}")
+        if info.result not in _PLAY_STATES:
+            raise ArchiveError(f"Invalid result for game {index}")
+        play_state, winner = _PLAY_STATES[info.result]
+        return games.GameRecord(move_list, play_state, winner, info.seed)
+
+    def journal(self, index: int) -> journals.Journal:
+        """
+        Replay a game into a Journal.
+
+        :param index: the index of the game
+        :return: a Journal
+        """
+        return self[index].replay()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[games.GameRecord]:
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self) -> None:
+        """Close the memory map."""
+        self._mmap.close()
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
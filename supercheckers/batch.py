@@ -0,0 +1,227 @@
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from . import boards, enums, geometry
+
+SQUARES = geometry.SQUARES
+DIRECTIONS = (
+    enums.Direction.NORTH,
+    enums.Direction.SOUTH,
+    enums.Direction.EAST,
+    enums.Direction.WEST,
+)
+
+
+def _destinations(table: Iterable[Iterable[int]]) -> np.ndarray:
+    """
+    Index the destination squares of a geometry table by direction.
+
+    :param table: the destination squares of each square, e.g. geometry.SLIDES
+    :return: a (SQUARES, 4) array of square indexes, with -1 if off the board
+    """
+    result = np.full((SQUARES, len(DIRECTIONS)), -1, dtype=np.int64)
+    for square, destinations in enumerate(table):
+        for dst in destinations:
+            direction = geometry.DESCRIPTIONS[square][dst].direction
+            result[square, DIRECTIONS.index(direction)] = dst
+    return result
+
+
+SLIDE_DST = _destinations(geometry.SLIDES)
+JUMP_DST = _destinations([dst for _, dst in jumps] for jumps in geometry.JUMPS)
+MIDDLE = np.array(geometry.MIDDLE)
+
+EMPTY = 0
+TEAM_VALUES = {team: team_id + 1 for team_id, team in enumerate(boards.Board.TEAMS)}
+
+
+class BoardBatch:
+    """
+    A batch of K boards stored as a (K, 64) int8 array of square values.
+
+    A square value is 0 if the square is empty, 1 for a Team.ONE piece and 2 for a
+    Team.TWO piece. Team arrays hold one team value per board. Only the default 8x8
+    board is supported.
+
+    The moves of a batch are slides and single jumps. Jump chains are neither
+    generated nor continued, so a game played with a batch is a simplified game,
+    suited to fast random playouts but not to move generation, see movegen.
+
+    This module requires NumPy, which is installed with the "batch" extra.
+    """
+
+    def __init__(self, cells: np.ndarray):
+        """
+        Create a batch from an array of square values.
+
+        :param cells: a (K, 64) array of square values
+        """
+        self.cells = np.asarray(cells, dtype=np.int8)
+
+    @classmethod
+    def from_boards(cls, board_list: Iterable[boards.Board]) -> "BoardBatch":
+        """
+        Create a batch from Boards.
+
+        :param board_list: an Iterable of Boards
+        :return: a BoardBatch
+        :raise: ValueError if a Board is not on the default 8x8 board
+        """
+        rows = []
+        for board in board_list:
+            if board.geometry is not geometry.DEFAULT:
+                raise ValueError(f"Batches only support the default board: {board!r}")
+            row = np.zeros(SQUARES, dtype=np.int8)
+            for team_id, mask in enumerate(board.masks):
+                bits = np.unpackbits(
+                    np.frombuffer(mask.to_bytes(SQUARES // 8, "little"), np.uint8),
+                    bitorder="little",
+                )
+                row[bits.astype(bool)] = team_id + 1
+            rows.append(row)
+        return cls(np.array(rows, dtype=np.int8).reshape(-1, SQUARES))
+
+    def to_boards(self) -> List[boards.Board]:
+        """
+        Convert this batch to Boards.
+
+        :return: a list of K Boards
+        """
+        result = []
+        for row in self.cells:
+            masks = []
+            for team_id in range(len(boards.Board.TEAMS)):
+                bits = np.packbits(row == team_id + 1, bitorder="little")
+                masks.append(int.from_bytes(bits.tobytes(), "little"))
+            result.append(boards.Board.from_masks(masks[0], masks[1]))
+        return result
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def copy(self) -> "BoardBatch":
+        """
+        Return a copy of this batch.
+
+        :return: a BoardBatch
+        """
+        return BoardBatch(self.cells.copy())
+
+    def middle_teams(self) -> np.ndarray:
+        """
+        Return which teams are in the middle of each board.
+
+        :return: a (K, 2) bool array, True if Team.ONE or Team.TWO is in the middle
+        """
+        middle = self.cells[:, MIDDLE]
+        return np.stack(
+            [(middle == value).any(axis=1) for value in TEAM_VALUES.values()], axis=1
+        )
+
+    def slides(
+        self, teams: np.ndarray, opening: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Return every legal slide on each board.
+
+        :param teams: a (K,) array of the team value to move on each board
+        :param opening: an optional (K,) bool array, True for boards in the opening
+            phase, where slides must end in the middle
+        :return: a (K, 64, 4) bool array, True if the piece on a square can slide in
+            a direction
+        """
+        own = self.cells == np.asarray(teams, dtype=np.int8)[:, None]
+        valid = SLIDE_DST >= 0
+        dst = np.where(valid, SLIDE_DST, 0)
+        empty = self.cells[:, dst] == EMPTY
+        legal = own[:, :, None] & valid[None] & empty
+        if opening is not None:
+            legal &= ~np.asarray(opening)[:, None, None] | MIDDLE[dst][None]
+        return legal
+
+    def jumps(
+        self, teams: np.ndarray, opening: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Return every legal single jump on each board.
+
+        A jump may be over a piece of either team, and no jumps are legal during the
+        opening phase.
+
+        :param teams: a (K,) array of the team value to move on each board
+        :param opening: an optional (K,) bool array, True for boards in the opening
+            phase
+        :return: a (K, 64, 4) bool array, True if the piece on a square can jump in a
+            direction
+        """
+        own = self.cells == np.asarray(teams, dtype=np.int8)[:, None]
+        valid = JUMP_DST >= 0
+        dst = np.where(valid, JUMP_DST, 0)
+        over = np.where(valid, SLIDE_DST, 0)
+        legal = (
+            own[:, :, None]
+            & valid[None]
+            & (self.cells[:, dst] == EMPTY)
+            & (self.cells[:, over] != EMPTY)
+        )
+        if opening is not None:
+            legal &= ~np.asarray(opening)[:, None, None]
+        return legal
+
+    def random_moves(
+        self,
+        teams: np.ndarray,
+        rng: np.random.Generator,
+        opening: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Choose a random legal slide or single jump on each board.
+
+        :param teams: a (K,) array of the team value to move on each board
+        :param rng: a NumPy random Generator
+        :param opening: an optional (K,) bool array of boards in the opening phase
+        :return: (src, dst) arrays of square indexes, with -1 for boards with no moves
+        """
+        candidates = np.concatenate(
+            [
+                self.slides(teams, opening).reshape(len(self), -1),
+                self.jumps(teams, opening).reshape(len(self), -1),
+            ],
+            axis=1,
+        )
+        counts = candidates.sum(axis=1)
+        picks = (rng.random(len(self)) * np.maximum(counts, 1)).astype(np.int64)
+        choice = (np.cumsum(candidates, axis=1) <= picks[:, None]).sum(axis=1)
+        choice = np.minimum(choice, candidates.shape[1] - 1)
+        half = SQUARES * len(DIRECTIONS)
+        is_jump = choice >= half
+        square, direction_id = np.divmod(choice % half, len(DIRECTIONS))
+        dst = np.where(
+            is_jump, JUMP_DST[square, direction_id], SLIDE_DST[square, direction_id]
+        )
+        has_moves = counts > 0
+        return np.where(has_moves, square, -1), np.where(has_moves, dst, -1)
+
+    def apply(self, src: np.ndarray, dst: np.ndarray) -> None:
+        """
+        Apply one slide or single jump to each board.
+
+        Jumping over a piece of the other team captures it. Boards with a source of -1
+        are left unchanged. This method assumes that the moves are legal.
+
+        :param src: a (K,) array of source square indexes, or -1
+        :param dst: a (K,) array of destination square indexes
+        """
+        src = np.asarray(src)
+        dst = np.asarray(dst)
+        rows = np.nonzero(src >= 0)[0]
+        src, dst = src[rows], dst[rows]
+        movers = self.cells[rows, src]
+        self.cells[rows, src] = EMPTY
+        self.cells[rows, dst] = movers
+        distance = np.abs(dst - src)
+        is_jump = (distance == 2) | (distance == 2 * boards.Board.MAX_COL)
+        over = (src + dst) // 2
+        captured = is_jump & (self.cells[rows, over] != movers)
+        self.cells[rows[captured], over[captured]] = EMPTY
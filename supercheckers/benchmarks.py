@@ -0,0 +1,430 @@
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import (
+    boards,
+    enums,
+    games,
+    journals,
+    movegen,
+    moves,
+    notation,
+    players,
+    rules,
+    utils,
+    verifiers,
+)
+
+#: Engine games in the text notation, replayed by the benchmarks.
+CORPUS = (
+    "O @3 G4-F4 G3-F3 B5-C5 B6-C6 E2-E3 F3-D3 G6-F6 G5-F5 C2-C3 C6-C4-C2 D7-D6 A3-C3 "
+    "A4-C4 F5-F3 F7-F5 G1-G3-E3 E8-E6 C7-C6 A6-A4 C3-C5 D6-B6 C5-C4 A8-A6-C6 "
+    "C1-C3-C5-C7-A7 C8-A8-A6-C6 A1-C1-C3 B6-D6 D2-D4 F6-F4 E1-C1 G8-E8-C8 D3-D5-D7 "
+    "E6-F6 C3-C5-C7-E7 H7-F7 C1-C3 H5-H7 C4-E4-G4 H3-H5 H8-H6-H4-F4 H1-H3 G4-E4 F1-E1 "
+    "C2-C4 A2-C2 E7-G7 E1-D1 D7-D6 D1-C1 E3-E5-G5 C1-B1 F3-F5-F7",
+    "O @4 G4-F4 G5-F5 E2-E3 B6-C6 D1-D3-F3 B4-C4 G2-G4-E4 B8-B6-B4-D4 C2-C3 B2-B4 "
+    "C3-C5 C6-C4 G6-F6 C7-C6 D7-D6 C6-E6-G6 B1-D1 F8-F6 E8-E6 F6-D6 E3-E5-G5 G6-G4 "
+    "D1-C1 D8-B8 F1-D1 H8-F8 H1-F1 H6-H8 H3-H1 H4-H6 A8-C8 A7-B7 A6-A7 A1-B1 C1-A1 "
+    "F2-E2 F3-E3 E2-E1 A4-A6 E1-C1 A2-A4 C1-B1 A1-C1 G4-G3 A7-C7 D6-E6 C7-C6 G3-F3 "
+    "E3-G3 B4-B3 G3-F3 B3-C3 C8-C7 C3-C5 C1-B1 H6-H5 B1-A1 H5-H4 A1-B1 H4-H3 B1-A1 "
+    "H3-G3 E4-E3 D4-D5 A1-B1 G3-G2 B1-A1 G2-G1 F1-E1 G1-G2 A1-B1 G2-F2 B1-A1 F2-E2 "
+    "F4-E4 D5-E5 A1-B1 E2-D2 F3-D3-D1 G7-G6 B1-A1 G6-F6 A6-B6 F6-D6 A1-B1 F8-F7 B1-A1 "
+    "F7-F6 A1-B1 F6-F5 B1-A1 F5-D5-D7-B7-B5-D5 A1-B1 D6-D4-F4 E3-F3 F4-E4 B1-A1 "
+    "C5-C7 A1-B1 E5-E3-G3",
+    "O @7 G6-F6 G3-F3 F6-E6 B6-C6 D1-D3 C1-C3-E3 E6-E5 B4-B6-D6 E2-E4-E6 G1-G3-E3 "
+    "H5-F5-D5 H4-F4 B3-C3 C7-C5 B1-B3-D3 D6-D4-D2 E6-E4-E2-C2-C4 E7-E6 F7-F6 E6-E4 "
+    "H7-F7-F5 D8-D6 F1-D1 H2-H4 D1-C1 A7-C7 C1-B1 A1-C1 H1-G1 A3-A1 G1-F1 A5-A3 F1-E1 "
+    "A1-B1 E1-D1 C1-E1 A6-A5 B1-A1 A5-A4 A3-A5 A8-A7 B8-B7 A7-A6 B7-D7-D5 A6-A4 "
+    "F8-D8-B8 A4-A3 D6-D4-B4 A3-B3 B4-B2 G8-G7 C5-E5-G5 G7-G6 G5-G7 F6-F5 F4-F6 C3-D3 "
+    "F2-F4-D4-D2",
+)
+
+PERFT_DEPTH = 5
+
+DEFAULT_THRESHOLD = 0.2
+
+#: The most seconds a run of each startup benchmark may take, whatever the baseline.
+BUDGETS: Dict[str, float] = {"startup.import": 0.05, "startup.cli": 0.15}
+
+
+class Case(NamedTuple):
+    """A benchmark Case, ready to be timed."""
+
+    run: Callable[[], object]
+    operations: int
+    nodes: Optional[int] = None
+
+
+@dataclass
+class Measurement:
+    """The Measurement of a single benchmark."""
+
+    seconds: float
+    operations: int
+    nodes: Optional[int] = None
+
+
+@dataclass
+class Regression:
+    """A Regression of a benchmark against its baseline."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+
+#: The setup function of every benchmark, by name.
+BENCHMARKS: Dict[str, Callable[[], Case]] = {}
+
+
+def _benchmark(name: str) -> Callable[[Callable[[], Case]], Callable[[], Case]]:
+    """
+    Register a benchmark setup function.
+
+    :param name: the name of the benchmark
+    :return: a decorator
+    """
+
+    def register(setup: Callable[[], Case]) -> Callable[[], Case]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _records() -> List[games.GameRecord]:
+    """
+    Parse the corpus.
+
+    :return: a GameRecord per game
+    """
+    return list(notation.read_games(CORPUS))
+
+
+def _positions() -> List[Tuple[journals.Journal, moves.Move]]:
+    """
+    Replay the corpus.
+
+    :return: a (Journal before the Move, Move) tuple for every Move of every game
+    """
+    result = []
+    for record in _records():
+        journal = journals.Journal(boards.Board())
+        for move in record.moves:
+            result.append((journal.copy(), move))
+            journal.apply(move)
+    return result
+
+
+def _illegal_moves(
+    positions: Iterable[Tuple[journals.Journal, moves.Move]],
+    verifier: verifiers.Verifier,
+) -> List[Tuple[journals.Journal, moves.Move]]:
+    """
+    Create an illegal Move of the right team for every position.
+
+    :param positions: (Journal, Move) tuples
+    :param verifier: a Verifier to reject legal Moves with
+    :return: (Journal, illegal Move) tuples
+    """
+    rng = random.Random(0)
+    result = []
+    for journal, move in positions:
+        while True:
+            locations = [(rng.randrange(8), rng.randrange(8)) for _ in range(2)]
+            illegal = moves.Move(move.team, locations)
+            if not verifier.verify(journal, illegal).is_valid:
+                break
+        result.append((journal, illegal))
+    return result
+
+
+@_benchmark("board.copy")
+def _board_copy() -> Case:
+    board_list = [journal.current_board for journal, _ in _positions()]
+
+    def run() -> None:
+        for board in board_list:
+            board.copy()
+
+    return Case(run, len(board_list))
+
+
+@_benchmark("board.apply")
+def _board_apply() -> Case:
+    pairs = [(journal.current_board, move) for journal, move in _positions()]
+
+    def run() -> None:
+        for board, move in pairs:
+            board.copy().apply(move)
+
+    return Case(run, len(pairs))
+
+
+@_benchmark("board.make")
+def _board_make() -> Case:
+    pairs = [(journal.current_board, move) for journal, move in _positions()]
+
+    def run() -> None:
+        for board, move in pairs:
+            board.unmake(board.make(move))
+
+    return Case(run, len(pairs))
+
+
+@_benchmark("journal.apply")
+def _journal_apply() -> Case:
+    pairs = _positions()
+
+    def run() -> None:
+        for journal, move in pairs:
+            journal.copy().apply(move)
+
+    return Case(run, len(pairs))
+
+
+@_benchmark("journal.current_board")
+def _journal_current_board() -> Case:
+    journal_list = [journal for journal, _ in _positions()]
+
+    def run() -> None:
+        for journal in journal_list:
+            journal.current_board
+
+    return Case(run, len(journal_list))
+
+
+def _verify_case(fail_fast: bool) -> Case:
+    """
+    Verify every legal corpus Move and as many illegal Moves.
+
+    :param fail_fast: the fail_fast argument of Verifier.verify
+    :return: a Case
+    """
+    verifier = verifiers.Verifier(rules.all_rules())
+    pairs = _positions()
+    pairs += _illegal_moves(pairs, verifier)
+
+    def run() -> None:
+        for journal, move in pairs:
+            verifier.verify(journal, move, fail_fast)
+
+    return Case(run, len(pairs))
+
+
+@_benchmark("verifier.verify")
+def _verify() -> Case:
+    return _verify_case(fail_fast=False)
+
+
+@_benchmark("verifier.verify_fail_fast")
+def _verify_fail_fast() -> Case:
+    return _verify_case(fail_fast=True)
+
+
+@_benchmark("utils.compare")
+def _compare() -> Case:
+    locations = [(row_id, col_id) for row_id in range(8) for col_id in range(8)]
+
+    def run() -> None:
+        for src_loc in locations:
+            for dst_loc in locations:
+                utils.compare(src_loc, dst_loc)
+
+    return Case(run, len(locations) ** 2)
+
+
+@_benchmark("game.playthrough")
+def _playthrough() -> Case:
+    records = _records()
+    verifier = verifiers.Verifier(rules.all_rules())
+    player_1 = players.ConsolePlayer(enums.Team.ONE)
+    player_2 = players.ConsolePlayer(enums.Team.TWO)
+
+    def run() -> None:
+        for record in records:
+            journal = journals.Journal(boards.Board())
+            state = games.GameState(
+                player_1, player_2, journal, enums.PlayState.IN_PROGRESS
+            )
+            for move in record.moves:
+                verifier.verify(journal, move, fail_fast=True)
+                journal.apply(move)
+                state.update_play_state()
+
+    return Case(run, len(records))
+
+
+@_benchmark("movegen.generate")
+def _generate() -> Case:
+    journal_list = [journal for journal, _ in _positions()]
+
+    def run() -> None:
+        for journal in journal_list:
+            for _ in movegen.generate(journal):
+                pass
+
+    return Case(run, len(journal_list))
+
+
+@_benchmark(f"movegen.perft{PERFT_DEPTH}")
+def _perft() -> Case:
+    def run() -> int:
+        return movegen.perft(boards.Board(), enums.Team.ONE, PERFT_DEPTH)
+
+    return Case(run, 1, run())
+
+
+def _startup_case(*args: str) -> Case:
+    """
+    Start a new Python interpreter, as the batch jobs and engine subprocesses do.
+
+    :param args: the interpreter arguments
+    :return: a Case
+    """
+    command = [sys.executable, *args]
+
+    def run() -> None:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+    return Case(run, 1)
+
+
+@_benchmark("startup.import")
+def _startup_import() -> Case:
+    return _startup_case("-c", "import supercheckers")
+
+
+@_benchmark("startup.cli")
+def _startup_cli() -> Case:
+    return _startup_case("-m", "supercheckers", "--help")
+
+
+def run(
+    names: Optional[Iterable[str]] = None, repeat: int = 5
+) -> Dict[str, Measurement]:
+    """
+    Run benchmarks.
+
+    Each benchmark is run enough times to take at least 0.2 seconds, and the fastest
+    of repeat runs is kept, divided by the number of operations per run.
+
+    :param names: the names of the benchmarks to run, or None for all of them
+    :param repeat: the number of timed runs per benchmark
+    :return: a Measurement per benchmark name
+    :raise: KeyError if a benchmark does not exist
+    """
+    results = {}
+    for name in names if names is not None else BENCHMARKS:
+        case = BENCHMARKS[name]()
+        timer = timeit.Timer(case.run)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat, number))
+        seconds = best / number / case.operations
+        results[name] = Measurement(seconds, case.operations, case.nodes)
+    return results
+
+
+def compare(
+    results: Dict[str, Measurement],
+    baseline: Dict[str, Measurement],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Find the benchmarks that are slower than their baseline or their budget, or count
+    other nodes.
+
+    :param results: the current Measurements
+    :param baseline: the baseline Measurements
+    :param threshold: the tolerated slowdown, e.g. 0.1 for 10%
+    :return: a list of Regressions
+    """
+    regressions = []
+    for name, measurement in results.items():
+        budget = BUDGETS.get(name)
+        if budget is not None and measurement.seconds > budget:
+            regressions.append(Regression(name, "budget", budget, measurement.seconds))
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if measurement.seconds > before.seconds * (1 + threshold):
+            regressions.append(
+                Regression(name, "seconds", before.seconds, measurement.seconds)
+            )
+        if before.nodes is not None and measurement.nodes != before.nodes:
+            regressions.append(
+                Regression(name, "nodes", before.nodes, measurement.nodes or 0)
+            )
+    return regressions
+
+
+def report(
+    results: Dict[str, Measurement], baseline: Optional[Dict[str, Measurement]] = None
+) -> str:
+    """
+    Format Measurements as a table, with the change against a baseline.
+
+    :param results: the current Measurements
+    :param baseline: the baseline Measurements, if any
+    :return: a multi-line string
+    """
+    lines = [f"{'benchmark':<28} {'time/op':>12} {'baseline':>12} {'change':>8}"]
+    for name, measurement in results.items():
+        before = (baseline or {}).get(name)
+        if before is None:
+            columns = f"{'-':>12} {'-':>8}"
+        else:
+            change = measurement.seconds / before.seconds - 1
+            columns = f"{_format_seconds(before.seconds):>12} {change:>+8.1%}"
+        lines.append(f"{name:<28} {_format_seconds(measurement.seconds):>12} {columns}")
+    return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    """
+    Format a duration with a readable unit.
+
+    :param seconds: a duration in seconds
+    :return: a string, e.g. "12.3 us"
+    """
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.1f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def save(results: Dict[str, Measurement], path: str) -> None:
+    """
+    Save Measurements as JSON, with the Python version and the machine.
+
+    :param results: the Measurements
+    :param path: the JSON file path
+    """
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "results": {name: asdict(measurement) for name, measurement in results.items()},
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+        file.write("\n")
+
+
+def load(path: str) -> Dict[str, Measurement]:
+    """
+    Load Measurements saved as JSON.
+
+    :param path: the JSON file path
+    :return: a Measurement per benchmark name
+    """
+    with open(path) as file:
+        data = json.load(file)
+    return {name: Measurement(**values) for name, values in data["results"].items()}
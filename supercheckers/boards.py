@@ -1,9 +1,11 @@
-import copy
-import itertools
 from dataclasses import dataclass
 from typing import List, Optional, Set, Tuple
 
 from . import enums, moves, utils
+from . import geometry as geometry_
+
+#: The occupancy masks of Team.ONE and Team.TWO and the Zobrist hash before a Move.
+UndoToken = Tuple[int, int, int]
 
 
 @dataclass
@@ -15,33 +17,98 @@ class Piece:
 
 
 class Board:
-    """A Supercheckers Board."""
+    """
+    A Supercheckers Board.
+
+    The board is stored as one occupancy mask per Team, where the bit for a
+    (row_id, col_id) location is ``row_id * cols + col_id``. Pieces are created on
+    demand when the board is indexed. The size of the board and of its court are
+    given by a shared geometry.Geometry, the 8x8 board with a 4x4 court by default.
 
-    MAX_ROW = 8
-    MAX_COL = 8
+    A Zobrist hash of the pieces is updated with every change, so boards can be
+    compared and used as dictionary keys. Boards are mutable, so a board must not be
+    modified while it is used as a key.
+    """
 
-    def __init__(self, populate: bool = True) -> None:
+    #: The size of the default board.
+    MAX_ROW = geometry_.ROWS
+    MAX_COL = geometry_.COLS
+    TEAMS = (enums.Team.ONE, enums.Team.TWO)
+
+    def __init__(
+        self, populate: bool = True, geometry: Optional[geometry_.Geometry] = None
+    ) -> None:
         """
         Create a new game board.
 
         :param populate: True if the board should be reset to default position.
+        :param geometry: the size of the board, see geometry.get
         """
-        self._grid: List[List[Optional[Piece]]] = [
-            [None for _ in range(self.MAX_COL)] for _ in range(self.MAX_ROW)
-        ]
+        self.geometry = geometry or geometry_.DEFAULT
+        self._masks: List[int] = [0, 0]
+        self._hash = 0
         if populate:
             self.reset()
 
+    @classmethod
+    def from_masks(
+        cls, mask_1: int, mask_2: int, geometry: Optional[geometry_.Geometry] = None
+    ) -> "Board":
+        """
+        Create a board from a pair of occupancy masks.
+
+        :param mask_1: the occupancy mask of Team.ONE
+        :param mask_2: the occupancy mask of Team.TWO
+        :param geometry: the size of the board, see geometry.get
+        :return: a Board
+        """
+        board = cls(populate=False, geometry=geometry)
+        board._masks = [mask_1, mask_2]
+        board._hash = _zobrist_hash(mask_1, mask_2, board.geometry)
+        return board
+
+    @property
+    def masks(self) -> Tuple[int, int]:
+        """
+        Return the occupancy masks of Team.ONE and Team.TWO.
+
+        :return: a (mask_1, mask_2) tuple
+        """
+        return self._masks[0], self._masks[1]
+
+    def mask(self, team: enums.Team) -> int:
+        """
+        Return the occupancy mask of a team.
+
+        :param team: a Team
+        :return: an integer with one bit set per occupied location
+        """
+        return self._masks[self.TEAMS.index(team)]
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        Return the Zobrist hash of the pieces on the board.
+
+        :return: a 64-bit hash
+        """
+        return self._hash
+
+    def position_hash(self, team: enums.Team) -> int:
+        """
+        Return the Zobrist hash of the board with a team to move.
+
+        :param team: the Team to move
+        :return: a 64-bit hash
+        """
+        if team == enums.Team.TWO:
+            return self._hash ^ self.geometry.zobrist_side_key
+        return self._hash
+
     def reset(self) -> None:
         """Reset the board to default position."""
-        team_cycle = itertools.cycle(enums.Team.__members__.values())
-        for row_id in range(self.MAX_ROW):
-            next(team_cycle)
-            for col_id in range(self.MAX_COL):
-                location = (row_id, col_id)
-                self[location] = (
-                    None if utils.in_middle(location) else Piece(next(team_cycle))
-                )
+        self._masks = list(self.geometry.initial_masks)
+        self._hash = _zobrist_hash(self._masks[0], self._masks[1], self.geometry)
 
     def apply(self, move: moves.Move) -> None:
         """
@@ -56,6 +123,34 @@ class Board:
             dst_loc = move.locations[i]
             self._move(src_loc, dst_loc)
 
+    def make(self, move: moves.Move) -> UndoToken:
+        """
+        Apply a Move in place, and return a token that undoes it.
+
+        The token records the occupancy masks and the hash from before the move, so
+        unmake restores the board exactly, including every piece captured along a
+        jump chain. Pieces are created on demand, so there are no Piece locations to
+        restore. Tokens must be unmade in the reverse order they were made.
+
+        This method assumes that the move has been validated.
+
+        :param move: a Move
+        :return: an UndoToken for unmake
+        """
+        masks = self._masks
+        token = (masks[0], masks[1], self._hash)
+        self.apply(move)
+        return token
+
+    def unmake(self, token: UndoToken) -> None:
+        """
+        Undo a Move applied by make.
+
+        :param token: the UndoToken returned by make
+        """
+        masks = self._masks
+        masks[0], masks[1], self._hash = token
+
     def _move(self, src_loc: Tuple[int, int], dst_loc: Tuple[int, int]) -> None:
         """
         Move from a source location to a destination location.
@@ -63,18 +158,38 @@ class Board:
         :param src_loc: a (row_id, col_id) source location
         :param dst_loc: a (row_id, col_id) destination location
         """
-        piece = self[src_loc]
-        assert piece and piece.team
-        self[src_loc] = None
-        self[dst_loc] = piece
+        masks = self._masks
+        geometry = self.geometry
+        src = src_loc[0] * geometry.cols + src_loc[1]
+        dst = dst_loc[0] * geometry.cols + dst_loc[1]
+        src_bit = 1 << src
+        dst_bit = 1 << dst
+        team_id = 0 if masks[0] & src_bit else 1
+        assert masks[team_id] & src_bit
+        masks[team_id] ^= src_bit | dst_bit
+        keys = geometry.zobrist_keys[team_id]
+        self._hash ^= keys[src] ^ keys[dst]
 
-        description = utils.compare(src_loc, dst_loc)
-        if description.move_type == enums.MoveType.JUMP:
-            assert description.jmp_loc
-            jmp_piece = self[description.jmp_loc]
-            assert jmp_piece and jmp_piece.team
-            if jmp_piece.team != piece.team:
-                self[description.jmp_loc] = None
+        if geometry.descriptions[src][dst].move_type == enums.MoveType.JUMP:
+            jmp = (src + dst) // 2
+            jmp_bit = 1 << jmp
+            assert (masks[0] | masks[1]) & jmp_bit
+            if masks[1 - team_id] & jmp_bit:
+                masks[1 - team_id] ^= jmp_bit
+                self._hash ^= geometry.zobrist_keys[1 - team_id][jmp]
+
+    @property
+    def court_counts(self) -> Tuple[int, int]:
+        """
+        Return the number of pieces each team has in the middle of the board.
+
+        :return: a (Team.ONE count, Team.TWO count) tuple
+        """
+        middle_mask = self.geometry.middle_mask
+        return (
+            bin(self._masks[0] & middle_mask).count("1"),
+            bin(self._masks[1] & middle_mask).count("1"),
+        )
 
     def get_middle_teams(self) -> Set[enums.Team]:
         """
@@ -82,21 +197,22 @@ class Board:
 
         :return: a set of Team enums
         """
-        teams = set()
-        for location in itertools.product(range(self.MAX_ROW), range(self.MAX_COL)):
-            if utils.in_middle(location):
-                piece = self[location]
-                if piece:
-                    teams.add(piece.team)
-        return teams
+        middle_mask = self.geometry.middle_mask
+        return {
+            team for team, mask in zip(self.TEAMS, self._masks) if mask & middle_mask
+        }
 
     def copy(self) -> "Board":
         """
-        Return a deep copy of this board.
+        Return a copy of this board.
 
         :return: a Board
         """
-        return copy.deepcopy(self)
+        board = self.__class__.__new__(self.__class__)
+        board.geometry = self.geometry
+        board._masks = self._masks[:]
+        board._hash = self._hash
+        return board
 
     def __getitem__(self, item: Tuple[int, int]) -> Optional[Piece]:
         """
@@ -106,10 +222,12 @@ class Board:
         :return: Piece at that location, or None
         :raise: ValueError if location is invalid
         """
-        row_id, col_id = item
-        if not ((0 <= row_id < self.MAX_ROW) and (0 <= col_id < self.MAX_COL)):
-            raise ValueError(f"Invalid location: {item!r}")
-        return self._grid[row_id][col_id]
+        bit = 1 << self.geometry.to_square(item)
+        if self._masks[0] & bit:
+            return Piece(enums.Team.ONE, item)
+        if self._masks[1] & bit:
+            return Piece(enums.Team.TWO, item)
+        return None
 
     def __setitem__(self, key: Tuple[int, int], value: Optional[Piece]) -> None:
         """
@@ -119,11 +237,17 @@ class Board:
         :param value: a Piece to set, or None to unset
         :raise: ValueError if location is invalid
         """
-        row_id, col_id = key
-        if not ((0 <= row_id < self.MAX_ROW) and (0 <= col_id < self.MAX_COL)):
-            raise ValueError(f"Invalid location: {key!r}")
-        self._grid[row_id][col_id] = value
+        square = self.geometry.to_square(key)
+        keys = self.geometry.zobrist_keys
+        bit = 1 << square
+        for team_id in range(len(self.TEAMS)):
+            if self._masks[team_id] & bit:
+                self._masks[team_id] ^= bit
+                self._hash ^= keys[team_id][square]
         if value:
+            team_id = self.TEAMS.index(value.team)
+            self._masks[team_id] |= bit
+            self._hash ^= keys[team_id][square]
             value.location = key
 
     def __str__(self) -> str:
@@ -132,28 +256,84 @@ class Board:
 
         :return: an ascii board string
         """
-        col_names = [utils.to_char(col_id) for col_id in range(self.MAX_COL)]
-        column_row = "   " + " ".join(col_names) + " "
-        divider_row = "  +" + ("-" * (self.MAX_COL * 2 - 1)) + "+"
+        geometry = self.geometry
+        width = len(str(geometry.rows))
+        col_names = [utils.to_char(col_id) for col_id in range(geometry.cols)]
+        column_row = " " * (width + 2) + " ".join(col_names) + " "
+        divider_row = " " * (width + 1) + "+" + ("-" * (geometry.cols * 2 - 1)) + "+"
 
+        mask_1, mask_2 = self._masks
         result = ""
         result += column_row + "\n"
         result += divider_row + "\n"
-        for row_id in reversed(range(self.MAX_ROW)):
-            result += f"{row_id + 1} |"
-            for col_id in range(self.MAX_COL):
-                piece = self[(row_id, col_id)]
-                result += piece.team.value if piece else " "
-                result += "#" if (1 < row_id < 6) and (1 <= col_id < 6) else "|"
+        for row_id in reversed(range(geometry.rows)):
+            result += f"{row_id + 1:>{width}} |"
+            for col_id in range(geometry.cols):
+                bit = 1 << (row_id * geometry.cols + col_id)
+                if mask_1 & bit:
+                    result += enums.Team.ONE.value
+                elif mask_2 & bit:
+                    result += enums.Team.TWO.value
+                else:
+                    result += " "
+                in_court = geometry.in_middle((row_id, col_id)) or geometry.in_middle(
+                    (row_id, col_id + 1)
+                )
+                result += "#" if in_court else "|"
             result += f" {row_id + 1}\n"
         result += divider_row + "\n"
         result += column_row
         return result
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Determine if two boards have the same size and pieces in the same locations.
+
+        :param other: any object
+        :return: True if other is a Board of the same size with the same pieces
+        """
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self._masks == other._masks and self.geometry is other.geometry
+
+    def __hash__(self) -> int:
+        """
+        Return the Zobrist hash of this Board.
+
+        :return: a 64-bit hash
+        """
+        return self._hash
+
     def __repr__(self) -> str:
         """
         Return the internal representation of this Board.
 
         :return: a repr string
         """
-        return f"{self.__class__.__qualname__}()"
+        if self.geometry is geometry_.DEFAULT:
+            return f"{self.__class__.__qualname__}()"
+        return f"{self.__class__.__qualname__}(geometry={self.geometry!r})"
+
+
+MIDDLE_MASK = geometry_.MIDDLE_MASK
+
+ZOBRIST_KEYS = geometry_.DEFAULT.zobrist_keys
+ZOBRIST_SIDE_KEY = geometry_.DEFAULT.zobrist_side_key
+
+
+def _zobrist_hash(mask_1: int, mask_2: int, geometry: geometry_.Geometry) -> int:
+    """
+    Compute the Zobrist hash of a pair of occupancy masks from scratch.
+
+    :param mask_1: the occupancy mask of Team.ONE
+    :param mask_2: the occupancy mask of Team.TWO
+    :param geometry: the size of the board
+    :return: a 64-bit hash
+    """
+    result = 0
+    for keys, mask in zip(geometry.zobrist_keys, (mask_1, mask_2)):
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            result ^= keys[bit.bit_length() - 1]
+    return result
@@ -0,0 +1,232 @@
+import concurrent.futures
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from . import boards, enums, movegen, moves, search
+
+MAGIC = b"SCBOOK\0\0"
+VERSION = 1
+
+#: magic, version, entry count
+HEADER = struct.Struct("<8sHxxxxxxQ")
+#: position key, packed move, score, search depth
+RECORD = struct.Struct("<QQfHxx")
+
+MAX_CODE = (1 << 64) - 1
+
+#: mask_1, mask_2, team_bit, turn_number
+Position = Tuple[int, int, int, int]
+
+
+class BookError(ValueError):
+    """Raised when a book file is invalid."""
+
+
+class BookEntry(NamedTuple):
+    """The Entry of a single position in an opening book."""
+
+    key: int
+    move: moves.Move
+    score: float
+    depth: int
+
+
+def positions(depth: int) -> Iterator[Tuple[int, Position]]:
+    """
+    Enumerate every position reached in the first turns of a game.
+
+    Positions that are reached by different move orders are yielded once.
+
+    :param depth: the number of turns to enumerate, 4 for the opening phase
+    :return: an Iterator of (position key, Position) tuples, one turn at a time
+    """
+    frontier = {}
+    board = boards.Board()
+    team = enums.Team.ONE
+    frontier[search.position_key(board, team, 1)] = (board, team)
+    for turn_number in range(1, depth + 1):
+        following: Dict[int, Tuple[boards.Board, enums.Team]] = {}
+        other_turn = turn_number + 1
+        for key, (board, team) in frontier.items():
+            yield key, (*board.masks, boards.Board.TEAMS.index(team), turn_number)
+            if turn_number == depth:
+                continue
+            game_over, _ = search.winner(board, turn_number)
+            if game_over:
+                continue
+            other = search.opponent(team)
+            for move in movegen.generate(board, team, turn_number <= 4):
+                child = board.copy()
+                child.apply(move)
+                following.setdefault(
+                    search.position_key(child, other, other_turn), (child, other)
+                )
+        frontier = following
+
+
+def _analyze(position: Position, max_depth: int) -> Optional[Tuple[int, float]]:
+    """
+    Search a position for the best Move.
+
+    :param position: a Position
+    :param max_depth: the search depth in plies
+    :return: a (packed Move, score) tuple, or None if the game is over or the move
+        does not fit in a record
+    """
+    mask_1, mask_2, team_bit, turn_number = position
+    board = boards.Board.from_masks(mask_1, mask_2)
+    if search.winner(board, turn_number)[0]:
+        return None
+    team = boards.Board.TEAMS[team_bit]
+    try:
+        result = search.Searcher(max_depth).search(board, team, turn_number)
+    except ValueError:
+        return None
+    code = result.move.code
+    return None if code > MAX_CODE else (code, result.value)
+
+
+def build(
+    path: str,
+    depth: int = 4,
+    max_depth: int = 4,
+    workers: Optional[int] = None,
+    extend: bool = False,
+) -> int:
+    """
+    Enumerate and evaluate every opening position, and write a book file.
+
+    Positions are searched in a process pool. When extending a book, its positions
+    that were already searched at least as deep are kept without searching them again.
+    The new book replaces the file once it is complete.
+
+    :param path: the book file path
+    :param depth: the number of turns to enumerate
+    :param max_depth: the search depth in plies
+    :param workers: the number of worker processes, 0 for none, None for one per CPU
+    :param extend: True to keep the entries of an existing book
+    :return: the number of entries in the book
+    """
+    records: Dict[int, Tuple[int, float, int]] = {}
+    if extend and os.path.exists(path):
+        with Book(path) as book:
+            for key, code, score, entry_depth in book._records():
+                records[key] = (code, score, entry_depth)
+
+    pending: List[Tuple[int, Position]] = [
+        (key, position)
+        for key, position in positions(depth)
+        if records.get(key, (0, 0.0, -1))[2] < max_depth
+    ]
+    keys = [key for key, _ in pending]
+    analyzed = [position for _, position in pending]
+    depths = [max_depth] * len(analyzed)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers:
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            chunksize = max(1, len(analyzed) // (workers * 8))
+            results = list(
+                executor.map(_analyze, analyzed, depths, chunksize=chunksize)
+            )
+    else:
+        results = list(map(_analyze, analyzed, depths))
+    for key, result in zip(keys, results):
+        if result is not None:
+            code, score = result
+            records[key] = (code, score, max_depth)
+
+    partial = f"{path}.partial"
+    with open(partial, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(records)))
+        for key in sorted(records):
+            file.write(RECORD.pack(key, *records[key]))
+    os.replace(partial, path)
+    return len(records)
+
+
+class Book:
+    """
+    A reader of an opening book file.
+
+    The file is memory mapped and its records are sorted by position key, so a lookup
+    is a binary search that only reads the records it visits.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a book file for reading.
+
+        :param path: the book file path
+        :raise: BookError if the file is not a valid book
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise BookError("Truncated book header")
+            magic, version, self._count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise BookError("Not a book file")
+            if version != VERSION:
+                raise BookError(f"Unsupported book version: {version}")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if HEADER.size + self._count * RECORD.size > len(self._mmap):
+            self.close()
+            raise BookError("Truncated book")
+
+    def lookup(
+        self, board: boards.Board, team: enums.Team, turn_number: int
+    ) -> Optional[BookEntry]:
+        """
+        Look up the best Move of a position.
+
+        :param board: a Board
+        :param team: the Team to move
+        :param turn_number: the turn number about to be played
+        :return: a BookEntry, or None if the position is not in the book
+        """
+        key = search.position_key(board, team, turn_number)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record = RECORD.unpack_from(self._mmap, HEADER.size + middle * RECORD.size)
+            if record[0] < key:
+                low = middle + 1
+            elif record[0] > key:
+                high = middle
+            else:
+                _, code, score, depth = record
+                return BookEntry(key, moves.decode(code), score, depth)
+        return None
+
+    def _records(self) -> Iterator[Tuple[int, int, float, int]]:
+        """
+        Iterate over the raw records of the book, in key order.
+
+        :return: an Iterator of (key, packed Move, score, depth) tuples
+        """
+        for index in range(self._count):
+            yield RECORD.unpack_from(self._mmap, HEADER.size + index * RECORD.size)
+
+    def __iter__(self) -> Iterator[BookEntry]:
+        for key, code, score, depth in self._records():
+            yield BookEntry(key, moves.decode(code), score, depth)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __reduce__(self):
+        return Book, (self.path,)
+
+    def close(self) -> None:
+        """Close the memory map of the file."""
+        self._mmap.close()
+
+    def __enter__(self) -> "Book":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -39,3 +39,45 @@ class MoveType(enum.IntEnum):
             return MoveType(distance)
         except ValueError:
             return MoveType.UNKNOWN
+
+
+class Bound(enum.Enum):
+    EXACT = enum.auto()
+    LOWER = enum.auto()
+    UPPER = enum.auto()
+
+
+class Replacement(enum.Enum):
+    ALWAYS = enum.auto()
+    DEPTH_PREFERRED = enum.auto()
+
+
+class Outcome(enum.IntEnum):
+    DRAW = 0
+    WIN = 1
+    LOSS = 2
+
+
+class EndReason(enum.Enum):
+    COMPLETE = "complete"
+    RESIGN = "resign"
+    TIMEOUT = "timeout"
+    DISCONNECT = "disconnect"
+    SHUTDOWN = "shutdown"
+
+
+class Stage(enum.Enum):
+    CREATE_MOVE = "create_move"
+    VERIFY = "verify"
+    APPLY = "apply"
+    UPDATE_PLAY_STATE = "update_play_state"
+
+
+class Schedule(enum.Enum):
+    ROUND_ROBIN = "round-robin"
+    GAUNTLET = "gauntlet"
+
+
+class Hypothesis(enum.Enum):
+    H0 = "H0"
+    H1 = "H1"
@@ -1,25 +1,30 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from . import enums, journals, players, verifiers
+from . import boards, enums, journals, metrics, moves, players, utils, verifiers
 
 
 @dataclass
 class GameState:
-    """The state of a Supercheckers game."""
+    """
+    The state of a Supercheckers game.
 
-    player_1: players.Player
-    player_2: players.Player
+    A player is None when its Moves are not created by a Player, e.g. the remote
+    players of a servers.Session.
+    """
+
+    player_1: Optional[players.AnyPlayer]
+    player_2: Optional[players.AnyPlayer]
     journal: journals.Journal
     play_state: enums.PlayState = enums.PlayState.NOT_STARTED
     winner: Optional[enums.Team] = None
 
     @property
-    def current_player(self) -> players.Player:
+    def current_player(self) -> Optional[players.AnyPlayer]:
         """
         Get the current player based off of the current turn number.
 
-        :return: a Player
+        :return: a Player, or None
         """
         if self.journal.current_turn_number % 2 != 0:
             return self.player_1
@@ -28,28 +33,91 @@ class GameState:
     def update_play_state(self) -> None:
         """Update the play_state enum based on the state of the game."""
         if self.journal.current_turn_number > 4:
-            board = self.journal.current_board
-            teams = board.get_middle_teams()
-            if not teams:
-                self.play_state = enums.PlayState.COMPLETE
-                self.winner = None
-            elif len(teams) == 1:
+            count_1, count_2 = self.journal.court_counts
+            if not (count_1 and count_2):
                 self.play_state = enums.PlayState.COMPLETE
-                self.winner = teams.pop()
+                if count_1:
+                    self.winner = enums.Team.ONE
+                elif count_2:
+                    self.winner = enums.Team.TWO
+                else:
+                    self.winner = None
+
+    def to_record(self, seed: Optional[int] = None) -> "GameRecord":
+        """
+        Create a GameRecord of the moves and the result of this game.
+
+        :param seed: the random seed the game was played with, if any
+        :return: a GameRecord
+        """
+        return GameRecord(self.journal.move_history, self.play_state, self.winner, seed)
+
+
+@dataclass
+class GameRecord:
+    """A record of the Moves and the result of a Supercheckers game."""
+
+    moves: List[moves.Move]
+    play_state: enums.PlayState
+    winner: Optional[enums.Team] = None
+    seed: Optional[int] = None
+
+    def replay(self) -> journals.Journal:
+        """
+        Replay the Moves of this game from the default position.
+
+        :return: a Journal of the game
+        """
+        journal = journals.Journal(boards.Board())
+        for move in self.moves:
+            journal.apply(move)
+        return journal
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return a JSON serializable representation of this record.
+
+        Each move is written as its square names joined by dashes, e.g. "C2-C3".
+
+        :return: a dict
+        """
+        return {
+            "play_state": self.play_state.name,
+            "winner": self.winner.value if self.winner else None,
+            "turns": len(self.moves),
+            "seed": self.seed,
+            "moves": [
+                "-".join(
+                    f"{utils.to_char(col_id)}{row_id + 1}"
+                    for row_id, col_id in move.locations
+                )
+                for move in self.moves
+            ],
+        }
 
 
 class Game:
     """A Game of Supercheckers."""
 
-    def __init__(self, state: GameState, verifier: verifiers.Verifier):
+    def __init__(
+        self,
+        state: GameState,
+        verifier: verifiers.Verifier,
+        verbose: bool = True,
+        metrics: Optional[metrics.Metrics] = None,
+    ):
         """
         Create a Game of Supercheckers.
 
         :param state: a Supercheckers GameState
         :param verifier: a rules Verifier
+        :param verbose: False to turn off all console output
+        :param metrics: optional Metrics to record the stage timings of each turn
         """
         self.state = state
         self.verifier = verifier
+        self.verbose = verbose
+        self.metrics = metrics
 
     @property
     def in_progress(self) -> bool:
@@ -62,27 +130,82 @@ class Game:
 
     def begin(self) -> None:
         """Begin a game by setting the play_state to IN_PROGRESS."""
-        print("Beginning game...")
+        self._print("Beginning game...")
         self.state.play_state = enums.PlayState.IN_PROGRESS
-        print(self.state.journal.current_board)
+        self._print(self.state.journal.current_board)
 
     def take_turn(self) -> None:
         """
         Take a single turn.
 
         This method will not return until a Move is created, validated, and applied.
+
+        :raise: TypeError if the current player is an AsyncPlayer or None
         """
         player = self.state.current_player
+        if not isinstance(player, players.Player):
+            raise TypeError(f"A Game can not be played by {player!r}")
+        stopwatch = self._stopwatch()
         while True:
             move = player.create_move(self.state.journal.copy())
-            result = self.verifier.verify(self.state.journal, move)
-            if result.is_valid:
+            if stopwatch:
+                stopwatch.lap(enums.Stage.CREATE_MOVE)
+            if self._verify(move, stopwatch):
                 break
-            for rule in result.failed_rules:
-                print("ERROR:", rule.message)
+        self._apply(move, stopwatch)
+
+    def play_move(self, move: moves.Move) -> bool:
+        """
+        Verify a Move of the current team, and apply it if it is valid.
+
+        :param move: a Move, e.g. one that was not created by the current player
+        :return: True if the Move was valid and applied
+        """
+        stopwatch = self._stopwatch()
+        if not self._verify(move, stopwatch):
+            return False
+        self._apply(move, stopwatch)
+        return True
+
+    def _stopwatch(self) -> Optional[metrics.Stopwatch]:
+        """
+        Start timing a turn, if the game records Metrics.
+
+        :return: a Stopwatch, or None
+        """
+        return metrics.Stopwatch() if self.metrics is not None else None
+
+    def _verify(self, move: moves.Move, stopwatch: Optional[metrics.Stopwatch]) -> bool:
+        """
+        Verify a Move, printing the rules it fails.
+
+        :param move: the Move of the current player
+        :param stopwatch: the Stopwatch of the turn, or None
+        :return: True if the Move is valid
+        """
+        result = self.verifier.verify(self.state.journal, move)
+        if stopwatch:
+            stopwatch.lap(enums.Stage.VERIFY)
+        for rule in result.failed_rules:
+            self._print("ERROR:", rule.message)
+        return result.is_valid
+
+    def _apply(self, move: moves.Move, stopwatch: Optional[metrics.Stopwatch]) -> None:
+        """
+        Apply a valid Move and update the play state.
+
+        :param move: the Move of the current player
+        :param stopwatch: the Stopwatch of the turn, or None
+        """
+        turn_number = self.state.journal.current_turn_number
         self.state.journal.apply(move)
+        if stopwatch:
+            stopwatch.lap(enums.Stage.APPLY)
         self.state.update_play_state()
-        print(self.state.journal.current_board)
+        if stopwatch and self.metrics is not None:
+            stopwatch.lap(enums.Stage.UPDATE_PLAY_STATE)
+            self.metrics.record_turn(turn_number, stopwatch)
+        self._print(self.state.journal.current_board)
 
     def end(self, error: bool = False) -> None:
         """
@@ -94,15 +217,24 @@ class Game:
         :param error: True if an error occurred
         """
         if error:
-            print("Game over: unhandled error.")
+            self._print("Game over: unhandled error.")
             self.state.play_state = enums.PlayState.ERROR
         elif self.in_progress:
-            print("Game over, game aborted.")
+            self._print("Game over, game aborted.")
             self.state.play_state = enums.PlayState.COMPLETE
         elif self.state.winner:
-            print(f"Game over, {self.state.winner.value} wins!")
+            self._print(f"Game over, {self.state.winner.value} wins!")
         else:
-            print("Game over, tie game.")
+            self._print("Game over, tie game.")
+
+    def _print(self, *values: object) -> None:
+        """
+        Print to the console, unless console output is turned off.
+
+        :param values: the values to print
+        """
+        if self.verbose:
+            print(*values)
 
     def __enter__(self):
         self.begin()
@@ -110,3 +242,60 @@ class Game:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.end(error=bool(exc_val))
+
+
+class AsyncGame(Game):
+    """
+    A Game of Supercheckers that awaits its players.
+
+    Players may be AsyncPlayers or Players. A Player blocks the event loop while it
+    creates a Move, so wrap slow ones in a ThreadPlayer or a ProcessPlayer to run many
+    games on one event loop.
+    """
+
+    async def play_turn(self) -> None:
+        """
+        Take a single turn.
+
+        This coroutine will not return until a Move is created, validated, and
+        applied.
+
+        :raise: TypeError if the current player is None
+        """
+        player = self.state.current_player
+        if player is None:
+            raise TypeError("A Game can not be played without a Player")
+        stopwatch = self._stopwatch()
+        while True:
+            journal = self.state.journal.copy()
+            if isinstance(player, players.AsyncPlayer):
+                move = await player.create_move(journal)
+            else:
+                move = player.create_move(journal)
+            if stopwatch:
+                stopwatch.lap(enums.Stage.CREATE_MOVE)
+            if self._verify(move, stopwatch):
+                break
+        self._apply(move, stopwatch)
+
+    async def play(self, max_turns: Optional[int] = None) -> GameRecord:
+        """
+        Play the game until it ends, or until max_turns turns have been played.
+
+        A game that reaches max_turns is left IN_PROGRESS.
+
+        :param max_turns: the maximum number of turns to play, or None for no limit
+        :return: a GameRecord
+        """
+        self.begin()
+        try:
+            while self.in_progress and (
+                max_turns is None or self.state.journal.current_turn_number <= max_turns
+            ):
+                await self.play_turn()
+        except BaseException:
+            self.end(error=True)
+            raise
+        if not self.in_progress:
+            self.end()
+        return self.state.to_record()
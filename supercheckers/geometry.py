@@ -0,0 +1,319 @@
+import functools
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from . import enums
+
+#: The smallest number of rows or columns of a board.
+MIN_SIZE = 4
+#: The largest number of rows or columns of a board.
+MAX_SIZE = 26
+#: The seed of the Zobrist keys, shared by every board size.
+ZOBRIST_SEED = 0x5C0FFEE
+
+
+@dataclass(frozen=True)
+class Description:
+    """A Description of two locations."""
+
+    direction: enums.Direction
+    move_type: enums.MoveType
+    jmp_loc: Optional[Tuple[int, int]]
+
+
+def describe(src_loc: Tuple[int, int], dst_loc: Tuple[int, int]) -> Description:
+    """
+    Compute the relationship between two locations, without using the tables.
+
+    :param src_loc: a (row_id, col_id) source location
+    :param dst_loc: a (row_id, col_id) destination location
+    :return: a Description of the locations
+    """
+    src_row, src_col = src_loc
+    dst_row, dst_col = dst_loc
+    horizontal = src_row == dst_row
+    vertical = src_col == dst_col
+    if horizontal == vertical:
+        return Description(enums.Direction.UNKNOWN, enums.MoveType.UNKNOWN, None)
+    if horizontal:
+        if src_col < dst_col:
+            direction = enums.Direction.EAST
+        else:
+            direction = enums.Direction.WEST
+        distance = dst_col - src_col
+        jmp_loc = (src_row, src_col + (distance // 2)) if abs(distance) == 2 else None
+    else:
+        if src_row < dst_row:
+            direction = enums.Direction.NORTH
+        else:
+            direction = enums.Direction.SOUTH
+        distance = dst_row - src_row
+        jmp_loc = (src_row + (distance // 2), src_col) if abs(distance) == 2 else None
+    move_type = enums.MoveType.from_distance(abs(distance))
+    return Description(direction, move_type, jmp_loc)
+
+
+class Geometry:
+    """
+    The size of a Supercheckers board and of its court, with precomputed tables.
+
+    A square index is ``row_id * cols + col_id``, and bit ``square`` of an occupancy
+    mask is set if the square is occupied. The court is centered on the board. Every
+    table is computed once per size, see get, so code that handles many boards never
+    repeats a bounds check or a neighbor search per square.
+    """
+
+    def __init__(self, rows: int, cols: int, court: int):
+        """
+        Compute the tables of a board size.
+
+        :param rows: the number of rows of the board
+        :param cols: the number of columns of the board
+        :param court: the number of rows and columns of the court
+        :raise: ValueError if a size is invalid
+        """
+        for name, size in (("rows", rows), ("cols", cols)):
+            if not (MIN_SIZE <= size <= MAX_SIZE) or size % 2:
+                raise ValueError(f"Invalid number of {name}: {size!r}")
+        if not (2 <= court <= min(rows, cols) - 2) or court % 2:
+            raise ValueError(f"Invalid court size: {court!r}")
+        self.rows = rows
+        self.cols = cols
+        self.court = court
+        self.squares = rows * cols
+
+        #: The (row_id, col_id) location of each square.
+        self.locations: Tuple[Tuple[int, int], ...] = tuple(
+            divmod(square, cols) for square in range(self.squares)
+        )
+        row_start = (rows - court) // 2
+        col_start = (cols - court) // 2
+        #: True for each square in the middle of the board.
+        self.middle: Tuple[bool, ...] = tuple(
+            row_start <= row_id < row_start + court
+            and col_start <= col_id < col_start + court
+            for row_id, col_id in self.locations
+        )
+        #: An occupancy mask of the middle of the board.
+        self.middle_mask = _to_mask(self.middle)
+        #: The occupancy masks of Team.ONE and Team.TWO in the default position.
+        self.initial_masks = tuple(
+            _to_mask(
+                not self.middle[square] and (row_id + col_id + 1) % 2 == team_id
+                for square, (row_id, col_id) in enumerate(self.locations)
+            )
+            for team_id in range(2)
+        )
+        #: The Description of every (src_square, dst_square) pair.
+        self.descriptions = self._build_descriptions()
+        #: The squares a slide away from each square.
+        self.slides: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(self._neighbors(square, 1)) for square in range(self.squares)
+        )
+        #: The (jumped square, destination square) pairs a jump away from each square.
+        self.jumps: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+            tuple(((square + dst) // 2, dst) for dst in self._neighbors(square, 2))
+            for square in range(self.squares)
+        )
+
+        zobrist_random = random.Random(ZOBRIST_SEED)
+        #: The Zobrist key of each square, per team.
+        self.zobrist_keys: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(zobrist_random.getrandbits(64) for _ in range(self.squares))
+            for _ in range(2)
+        )
+        #: The Zobrist key of Team.TWO to move.
+        self.zobrist_side_key = zobrist_random.getrandbits(64)
+
+    def _build_descriptions(self) -> Tuple[Tuple[Description, ...], ...]:
+        """
+        Describe every pair of squares, sharing a single object for equal Descriptions.
+
+        :return: a squares by squares table of Descriptions
+        """
+        interned: Dict[Description, Description] = {}
+        table = []
+        for src_loc in self.locations:
+            row = []
+            for dst_loc in self.locations:
+                description = describe(src_loc, dst_loc)
+                row.append(interned.setdefault(description, description))
+            table.append(tuple(row))
+        return tuple(table)
+
+    def _neighbors(self, square: int, distance: int) -> Tuple[int, ...]:
+        """
+        Return the squares a distance away from a square, in one direction.
+
+        :param square: a square index
+        :param distance: 1 for a slide, 2 for a jump
+        :return: the destination squares, in increasing order
+        """
+        row_id, col_id = self.locations[square]
+        return tuple(
+            sorted(
+                dst_row * self.cols + dst_col
+                for dst_row, dst_col in (
+                    (row_id - distance, col_id),
+                    (row_id, col_id - distance),
+                    (row_id, col_id + distance),
+                    (row_id + distance, col_id),
+                )
+                if 0 <= dst_row < self.rows and 0 <= dst_col < self.cols
+            )
+        )
+
+    def on_board(self, location: Tuple[int, int]) -> bool:
+        """
+        Determine if a location is on the board.
+
+        :param location: a (row_id, col_id) location
+        :return: True if the location is on the board
+        """
+        row_id, col_id = location
+        return 0 <= row_id < self.rows and 0 <= col_id < self.cols
+
+    def to_square(self, location: Tuple[int, int]) -> int:
+        """
+        Convert a location on the board to a square index.
+
+        :param location: a (row_id, col_id) location
+        :return: a square index
+        :raise: ValueError if the location is not on the board
+        """
+        row_id, col_id = location
+        if not (0 <= row_id < self.rows and 0 <= col_id < self.cols):
+            raise ValueError(f"Invalid location: {location!r}")
+        return row_id * self.cols + col_id
+
+    def compare(
+        self, src_loc: Tuple[int, int], dst_loc: Tuple[int, int]
+    ) -> Description:
+        """
+        Compare the relationship between two locations, see utils.compare.
+
+        Locations on the board are looked up in the descriptions table.
+
+        :param src_loc: a (row_id, col_id) source location
+        :param dst_loc: a (row_id, col_id) destination location
+        :return: a Description of the locations
+        """
+        src_row, src_col = src_loc
+        dst_row, dst_col = dst_loc
+        rows = self.rows
+        cols = self.cols
+        if 0 <= src_row < rows and 0 <= src_col < cols:
+            if 0 <= dst_row < rows and 0 <= dst_col < cols:
+                return self.descriptions[src_row * cols + src_col][
+                    dst_row * cols + dst_col
+                ]
+        return describe(src_loc, dst_loc)
+
+    def in_middle(self, location: Tuple[int, int]) -> bool:
+        """
+        Determine if a location is in the middle of the board.
+
+        :param location: a (row_id, col_id) location
+        :return: True if the location is in the middle of the board
+        """
+        row_id, col_id = location
+        if 0 <= row_id < self.rows and 0 <= col_id < self.cols:
+            return self.middle[row_id * self.cols + col_id]
+        return False
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle a Geometry as its size, so that unpickling shares the cached tables.
+
+        :return: a reduce tuple
+        """
+        return get, (self.rows, self.cols, self.court)
+
+    def __repr__(self) -> str:
+        """
+        Return the internal representation of this Geometry.
+
+        :return: a repr string
+        """
+        name = self.__class__.__qualname__
+        return f"{name}(rows={self.rows}, cols={self.cols}, court={self.court})"
+
+
+def _to_mask(flags: Iterable[bool]) -> int:
+    """
+    Turn a flag per square into an occupancy mask.
+
+    :param flags: True for each square to set
+    :return: an integer with one bit set per True flag
+    """
+    return sum(1 << square for square, flag in enumerate(flags) if flag)
+
+
+def get(rows: int, cols: Optional[int] = None, court: Optional[int] = None) -> Geometry:
+    """
+    Return the shared Geometry of a board size.
+
+    :param rows: the number of rows of the board
+    :param cols: the number of columns of the board, rows by default
+    :param court: the size of the court, 4 less than the smaller side by default
+    :return: a Geometry
+    :raise: ValueError if a size is invalid
+    """
+    if cols is None:
+        cols = rows
+    if court is None:
+        court = min(rows, cols) - 4
+    return _get(rows, cols, court)
+
+
+@functools.lru_cache(maxsize=None)
+def _get(rows: int, cols: int, court: int) -> Geometry:
+    """
+    Create the Geometry of a board size once.
+
+    :param rows: the number of rows of the board
+    :param cols: the number of columns of the board
+    :param court: the size of the court
+    :return: a Geometry
+    :raise: ValueError if a size is invalid
+    """
+    return Geometry(rows, cols, court)
+
+
+#: The Geometry of the standard 8x8 board, with a 4x4 court.
+DEFAULT = get(8)
+
+ROWS = DEFAULT.rows
+COLS = DEFAULT.cols
+SQUARES = DEFAULT.squares
+
+
+def to_square(location: Tuple[int, int]) -> int:
+    """
+    Convert a location on the default board to a square index.
+
+    :param location: a (row_id, col_id) location
+    :return: a square index, row_id * COLS + col_id
+    """
+    row_id, col_id = location
+    return row_id * COLS + col_id
+
+
+#: The (row_id, col_id) location of each square.
+LOCATIONS = DEFAULT.locations
+
+#: True for each square in the middle of the board.
+MIDDLE = DEFAULT.middle
+
+#: An occupancy mask of the middle of the board.
+MIDDLE_MASK = DEFAULT.middle_mask
+
+#: The Description of every (src_square, dst_square) pair.
+DESCRIPTIONS = DEFAULT.descriptions
+
+#: The squares a slide away from each square.
+SLIDES = DEFAULT.slides
+
+#: The (jumped square, destination square) pairs a jump away from each square.
+JUMPS = DEFAULT.jumps
@@ -1,13 +1,24 @@
-import copy
-from typing import List, Optional, Tuple
+import array
+from typing import Iterable, Iterator, List, MutableSequence, Optional, Tuple
 
-from . import boards, enums, moves
+from . import boards, enums, geometry, moves
 
 JournalEntry = Tuple[Optional[moves.Move], boards.Board]
 
 
 class Journal:
-    """A journal of all previous Move and Board states."""
+    """
+    A journal of all previous Move and Board states.
+
+    Only the current board is kept in full. Each turn records its Move and the XOR of
+    the occupancy masks before and after the move, and the full masks are
+    snapshotted every SNAPSHOT_INTERVAL turns so that any previous board can be
+    rebuilt from the nearest snapshot.
+
+    The history is append-only, so copies share it until one of them applies a Move.
+    """
+
+    SNAPSHOT_INTERVAL = 32
 
     def __init__(self, board: boards.Board):
         """
@@ -15,7 +26,11 @@ class Journal:
 
         :param board: a Board to use as the initial state
         """
-        self._log: List[JournalEntry] = [(None, board.copy())]
+        self._board = board.copy()
+        self._length = 0
+        self._moves: List[moves.Move] = []
+        self._deltas = _masks_array(board.geometry, ())
+        self._snapshots = _masks_array(board.geometry, board.masks)
 
     @property
     def current_turn_number(self) -> int:
@@ -26,7 +41,7 @@ class Journal:
 
         :return: the current turn number
         """
-        return len(self._log)
+        return self._length + 1
 
     @property
     def current_team(self) -> enums.Team:
@@ -37,6 +52,15 @@ class Journal:
         """
         return enums.Team.ONE if self.current_turn_number % 2 != 0 else enums.Team.TWO
 
+    @property
+    def geometry(self) -> geometry.Geometry:
+        """
+        Return the size of the board of this journal.
+
+        :return: a Geometry
+        """
+        return self._board.geometry
+
     @property
     def current_board(self) -> boards.Board:
         """
@@ -44,7 +68,70 @@ class Journal:
 
         :return: the current board
         """
-        return self._log[-1][1].copy()
+        return self._board.copy()
+
+    @property
+    def court_counts(self) -> Tuple[int, int]:
+        """
+        Return the number of pieces each team has in the middle of the current board.
+
+        :return: a (Team.ONE count, Team.TWO count) tuple
+        """
+        return self._board.court_counts
+
+    @property
+    def position_hash(self) -> int:
+        """
+        Return the Zobrist hash of the current board and the current team.
+
+        :return: a 64-bit hash
+        """
+        return self._board.position_hash(self.current_team)
+
+    @property
+    def move_history(self) -> List[moves.Move]:
+        """
+        Return a list of all the Moves applied so far.
+
+        :return: a list of Moves in the order they were applied
+        """
+        return self._moves[: self._length]
+
+    def board_at(self, turn_number: int) -> boards.Board:
+        """
+        Return a copy of the board as it was at the start of a turn.
+
+        :param turn_number: a turn number, between 1 and current_turn_number
+        :return: a Board
+        :raise: ValueError if the turn number is out of range
+        """
+        if not (1 <= turn_number <= self.current_turn_number):
+            raise ValueError(f"Invalid turn number: {turn_number!r}")
+        if turn_number == self.current_turn_number:
+            return self.current_board
+        index = turn_number - 1
+        snapshot_id = index // self.SNAPSHOT_INTERVAL
+        mask_1, mask_2 = self._snapshots[snapshot_id * 2 : snapshot_id * 2 + 2]
+        for i in range(snapshot_id * self.SNAPSHOT_INTERVAL, index):
+            mask_1 ^= self._deltas[i * 2]
+            mask_2 ^= self._deltas[i * 2 + 1]
+        return boards.Board.from_masks(mask_1, mask_2, self.geometry)
+
+    def entries(self) -> Iterator[JournalEntry]:
+        """
+        Iterate over every turn of the journal.
+
+        The first entry has no Move and the initial board. Every following entry has
+        a Move and the board after that Move was applied.
+
+        :return: an Iterator of (Move, Board) entries
+        """
+        mask_1, mask_2 = self._snapshots[0:2]
+        yield None, boards.Board.from_masks(mask_1, mask_2, self.geometry)
+        for i in range(self._length):
+            mask_1 ^= self._deltas[i * 2]
+            mask_2 ^= self._deltas[i * 2 + 1]
+            yield self._moves[i], boards.Board.from_masks(mask_1, mask_2, self.geometry)
 
     def apply(self, move: moves.Move) -> None:
         """
@@ -54,14 +141,54 @@ class Journal:
 
         :param move: a Move
         """
-        board = self.current_board
-        board.apply(move)
-        self._log.append((move, board))
+        if len(self._moves) != self._length:
+            self._unshare()
+        before_1, before_2 = self._board.masks
+        self._board.apply(move)
+        after_1, after_2 = self._board.masks
+        self._moves.append(move)
+        self._deltas.append(before_1 ^ after_1)
+        self._deltas.append(before_2 ^ after_2)
+        self._length += 1
+        if self._length % self.SNAPSHOT_INTERVAL == 0:
+            self._snapshots.append(after_1)
+            self._snapshots.append(after_2)
+
+    def _unshare(self) -> None:
+        """Stop sharing history with another journal that has since moved on."""
+        snapshot_count = self._length // self.SNAPSHOT_INTERVAL + 1
+        self._moves = self._moves[: self._length]
+        self._deltas = self._deltas[: self._length * 2]
+        self._snapshots = self._snapshots[: snapshot_count * 2]
 
     def copy(self) -> "Journal":
         """
-        Return a deep copy of this journal.
+        Return a copy of this journal.
+
+        The copy shares its history with this journal, which is never modified in
+        place, so copying does not depend on the number of turns.
 
         :return: a Journal
         """
-        return copy.deepcopy(self)
+        journal = self.__class__.__new__(self.__class__)
+        journal.__dict__.update(self.__dict__)
+        journal._board = self._board.copy()
+        return journal
+
+
+def _masks_array(
+    board_geometry: geometry.Geometry, masks: Iterable[int]
+) -> MutableSequence[int]:
+    """
+    Create a compact sequence of occupancy masks.
+
+    Masks of boards with up to 64 squares are stored in an array of 64-bit integers,
+    and masks of larger boards in a list.
+
+    :param board_geometry: the Geometry of the masks
+    :param masks: the initial masks
+    :return: a mutable sequence of masks
+    """
+    if board_geometry.squares <= 64:
+        return array.array("Q", masks)
+    return list(masks)
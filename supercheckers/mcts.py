@@ -0,0 +1,368 @@
+import concurrent.futures
+import math
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from . import boards, enums, movegen, moves, search
+
+#: A compact position encoding of (mask_1, mask_2, team index, turn_number).
+Encoding = Tuple[int, int, int, int]
+
+DRAW = -1
+
+
+@dataclass
+class PlayoutBatch:
+    """The results of a batch of random playouts from a single position."""
+
+    wins_1: int
+    wins_2: int
+    draws: int
+    pid: int
+    elapsed: float
+
+    @property
+    def count(self) -> int:
+        return self.wins_1 + self.wins_2 + self.draws
+
+
+@dataclass
+class MonteCarloResult:
+    """The Result of a MonteCarloSearcher's search for the best Move."""
+
+    move: moves.Move
+    visits: int
+    value: float
+    playouts: int
+    elapsed: float
+
+
+def encode(board: boards.Board, team: enums.Team, turn_number: int) -> Encoding:
+    """
+    Encode a position compactly, so that it is cheap to send to another process.
+
+    :param board: a Board
+    :param team: the Team to move
+    :param turn_number: the turn number about to be played
+    :return: an Encoding
+    """
+    mask_1, mask_2 = board.masks
+    return mask_1, mask_2, boards.Board.TEAMS.index(team), turn_number
+
+
+def playout(encoding: Encoding, rng: random.Random, max_turns: int = 200) -> int:
+    """
+    Play random legal moves from a position until the game is over.
+
+    :param encoding: an Encoding of the starting position
+    :param rng: a random number generator
+    :param max_turns: the number of turns after which the game is a draw
+    :return: the winning team index (0 or 1), or DRAW
+    """
+    mask_1, mask_2, team_id, turn_number = encoding
+    board = boards.Board.from_masks(mask_1, mask_2)
+    for turn_number in range(turn_number, turn_number + max_turns):
+        game_over, winner = search.winner(board, turn_number)
+        if game_over:
+            return DRAW if winner is None else boards.Board.TEAMS.index(winner)
+        team = boards.Board.TEAMS[team_id]
+        team_id = 1 - team_id
+        legal_moves = list(movegen.generate_codes(board, team, turn_number <= 4))
+        if not legal_moves:
+            return boards.Board.TEAMS.index(search.opponent(team))
+        board.apply(moves.decode(rng.choice(legal_moves)))
+    return DRAW
+
+
+def run_playouts(encoding: Encoding, count: int, seed: int) -> PlayoutBatch:
+    """
+    Run a batch of random playouts.
+
+    This function is the unit of work sent to worker processes.
+
+    :param encoding: an Encoding of the starting position
+    :param count: the number of playouts
+    :param seed: a random seed
+    :return: a PlayoutBatch
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    results = [0, 0, 0]
+    for _ in range(count):
+        results[playout(encoding, rng)] += 1
+    elapsed = time.perf_counter() - start
+    return PlayoutBatch(results[0], results[1], results[DRAW], os.getpid(), elapsed)
+
+
+class _Node:
+    """A node of the search tree, reached by a Move of the team that just moved."""
+
+    __slots__ = (
+        "board",
+        "team_id",
+        "turn_number",
+        "move",
+        "parent",
+        "children",
+        "untried",
+        "visits",
+        "pending",
+        "wins",
+    )
+
+    def __init__(
+        self,
+        board: boards.Board,
+        team_id: int,
+        turn_number: int,
+        move: Optional[moves.Move] = None,
+        parent: Optional["_Node"] = None,
+    ):
+        self.board = board
+        self.team_id = team_id
+        self.turn_number = turn_number
+        self.move = move
+        self.parent = parent
+        self.children: List[_Node] = []
+        self.visits = 0
+        self.pending = 0
+        self.wins = 0.0
+        game_over, _ = search.winner(board, turn_number)
+        if game_over:
+            self.untried: List[int] = []
+        else:
+            team = boards.Board.TEAMS[team_id]
+            self.untried = list(movegen.generate_codes(board, team, turn_number <= 4))
+
+    @property
+    def team(self) -> enums.Team:
+        """Return the team to move."""
+        return boards.Board.TEAMS[self.team_id]
+
+    @property
+    def mover(self) -> int:
+        """Return the index of the team that made the move into this node."""
+        return 1 - self.team_id
+
+    def select(self, exploration: float) -> "_Node":
+        """Return the child with the highest upper confidence bound."""
+        log_n = math.log(self.visits + self.pending + 1)
+
+        def score(child: _Node) -> float:
+            n = child.visits + child.pending
+            return child.wins / n + exploration * math.sqrt(log_n / n)
+
+        return max(self.children, key=score)
+
+
+class MonteCarloSearcher:
+    """
+    A Monte Carlo tree Searcher using UCT.
+
+    Random playouts are run in batches in a process pool. Each worker receives the
+    compact Encoding of a leaf position, never a Journal or a Board, and batches for
+    several leaves are kept in flight at once, with pending playouts counted as
+    visits so that concurrent selections spread over the tree.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        playouts: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        batch_size: int = 16,
+        exploration: float = math.sqrt(2),
+        seed: Optional[int] = None,
+    ):
+        """
+        Create a MonteCarloSearcher.
+
+        The search stops once the number of playouts or the time limit is reached. If
+        neither is given, 1000 playouts are run.
+
+        :param workers: the number of worker processes, 0 to run playouts in this
+            process, or None to use one per CPU
+        :param playouts: an optional budget in playouts per search
+        :param time_limit: an optional budget in seconds per search
+        :param batch_size: the number of playouts sent to a worker at once
+        :param exploration: the UCT exploration constant
+        :param seed: a random seed
+        """
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.playouts = playouts if playouts or time_limit else 1000
+        self.time_limit = time_limit
+        self.batch_size = batch_size
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.rates: Dict[int, float] = {}
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    def search(
+        self, board: boards.Board, team: enums.Team, turn_number: int
+    ) -> MonteCarloResult:
+        """
+        Search for the best Move for a team.
+
+        At least one batch of playouts is always run, however small the budget.
+
+        :param board: the current Board
+        :param team: the Team to move
+        :param turn_number: the current turn number
+        :return: a MonteCarloResult
+        :raise: ValueError if the team has no legal moves
+        """
+        start = time.perf_counter()
+        deadline = start + self.time_limit if self.time_limit else None
+        root = _Node(board.copy(), boards.Board.TEAMS.index(team), turn_number)
+        if not root.untried:
+            raise ValueError(f"No legal moves for {team!r}")
+        totals: Dict[int, Tuple[int, float]] = {}
+        completed = 0
+        submitted = 0
+        in_flight: Dict[concurrent.futures.Future, _Node] = {}
+
+        def budget_left() -> bool:
+            # The first batch is always played, so that the root has a child.
+            if not submitted:
+                return True
+            if self.playouts is not None and submitted >= self.playouts:
+                return False
+            if deadline is not None and time.perf_counter() > deadline:
+                return False
+            return True
+
+        while True:
+            while budget_left() and len(in_flight) < max(self.workers, 1):
+                leaf = self._select(root)
+                submitted += self.batch_size
+                if not leaf.untried and not leaf.children:
+                    self._backpropagate(leaf, self._terminal_batch(leaf))
+                    completed += self.batch_size
+                    continue
+                if self.workers:
+                    future = self._pool().submit(
+                        run_playouts,
+                        encode(leaf.board, leaf.team, leaf.turn_number),
+                        self.batch_size,
+                        self.rng.getrandbits(32),
+                    )
+                    in_flight[future] = leaf
+                else:
+                    batch = run_playouts(
+                        encode(leaf.board, leaf.team, leaf.turn_number),
+                        self.batch_size,
+                        self.rng.getrandbits(32),
+                    )
+                    self._record(totals, batch)
+                    self._backpropagate(leaf, batch)
+                    completed += batch.count
+            if not in_flight:
+                break
+            done, _ = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                batch = future.result()
+                self._record(totals, batch)
+                self._backpropagate(in_flight.pop(future), batch)
+                completed += batch.count
+
+        self.rates = {
+            pid: count / elapsed for pid, (count, elapsed) in totals.items() if elapsed
+        }
+        best = max(root.children, key=lambda child: child.visits)
+        assert best.move
+        elapsed = time.perf_counter() - start
+        value = best.wins / best.visits if best.visits else 0.0
+        return MonteCarloResult(best.move, best.visits, value, completed, elapsed)
+
+    def _select(self, root: _Node) -> _Node:
+        """
+        Walk down the tree to a leaf, expanding one new child if possible.
+
+        Every node on the path gets a batch of pending visits.
+
+        :param root: the root node
+        :return: the selected leaf node
+        """
+        node = root
+        while True:
+            node.pending += self.batch_size
+            if node.untried:
+                code = node.untried.pop(self.rng.randrange(len(node.untried)))
+                move = moves.decode(code)
+                board = node.board.copy()
+                board.apply(move)
+                child = _Node(board, 1 - node.team_id, node.turn_number + 1, move, node)
+                node.children.append(child)
+                child.pending += self.batch_size
+                return child
+            if not node.children:
+                return node
+            node = node.select(self.exploration)
+
+    def _terminal_batch(self, leaf: _Node) -> PlayoutBatch:
+        """
+        Return the results of a batch of playouts from a position with no moves.
+
+        :param leaf: a node where the game is over or the team to move is stuck
+        :return: a PlayoutBatch
+        """
+        game_over, winner = search.winner(leaf.board, leaf.turn_number)
+        if game_over:
+            result = DRAW if winner is None else boards.Board.TEAMS.index(winner)
+        else:
+            result = leaf.mover
+        counts = [0, 0, 0]
+        counts[result] = self.batch_size
+        return PlayoutBatch(counts[0], counts[1], counts[DRAW], os.getpid(), 0.0)
+
+    def _backpropagate(self, leaf: _Node, batch: PlayoutBatch) -> None:
+        """
+        Add the results of a batch of playouts to every node from a leaf to the root.
+
+        :param leaf: the node the playouts started from
+        :param batch: a PlayoutBatch
+        """
+        wins = (batch.wins_1, batch.wins_2)
+        node: Optional[_Node] = leaf
+        while node is not None:
+            node.pending -= self.batch_size
+            node.visits += batch.count
+            node.wins += wins[node.mover] + batch.draws / 2
+            node = node.parent
+
+    @staticmethod
+    def _record(totals: Dict[int, Tuple[int, float]], batch: PlayoutBatch) -> None:
+        """
+        Add a batch to the per-process playout totals.
+
+        :param totals: a dict of pid to (playouts, seconds)
+        :param batch: a PlayoutBatch
+        """
+        count, elapsed = totals.get(batch.pid, (0, 0.0))
+        totals[batch.pid] = (count + batch.count, elapsed + batch.elapsed)
+
+    def _pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """
+        Return the process pool, creating it on first use.
+
+        :return: a ProcessPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
@@ -0,0 +1,167 @@
+import collections
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Mapping, Tuple
+
+from . import enums
+
+
+@dataclass
+class TurnTiming:
+    """The Timing of every stage of a single turn, in seconds."""
+
+    turn_number: int
+    stages: Dict[str, float]
+
+
+class Stopwatch:
+    """A Stopwatch that adds the time since its last lap to a stage."""
+
+    def __init__(self) -> None:
+        """Create a Stopwatch and start it."""
+        self.stages: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, stage: enums.Stage) -> None:
+        """
+        Add the time since the last lap to a stage.
+
+        :param stage: a Stage
+        """
+        now = time.perf_counter()
+        self.stages[stage.value] = self.stages.get(stage.value, 0.0) + now - self._last
+        self._last = now
+
+
+class Metrics:
+    """
+    In-process Metrics of rule checks and game turns.
+
+    A Verifier or a Game records into a Metrics object only when one is given to it,
+    so that there is no instrumentation overhead otherwise.
+    """
+
+    PREFIX = "supercheckers"
+
+    def __init__(self, max_turns: int = 1000):
+        """
+        Create empty Metrics.
+
+        :param max_turns: the number of most recent TurnTimings to keep
+        """
+        self.max_turns = max_turns
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.rule_calls: Dict[str, int] = collections.Counter()
+        self.rule_seconds: Dict[str, float] = collections.defaultdict(float)
+        self.rule_failures: Dict[str, int] = collections.Counter()
+        self.stage_calls: Dict[str, int] = collections.Counter()
+        self.stage_seconds: Dict[str, float] = collections.defaultdict(float)
+        self.turns: Deque[TurnTiming] = collections.deque(maxlen=self.max_turns)
+
+    def record_rule(self, name: str, seconds: float, passed: bool) -> None:
+        """
+        Record a single rule check.
+
+        :param name: the name of the Rule
+        :param seconds: the time the check took
+        :param passed: False if the Move failed the Rule
+        """
+        self.rule_calls[name] += 1
+        self.rule_seconds[name] += seconds
+        if not passed:
+            self.rule_failures[name] += 1
+
+    def record_turn(self, turn_number: int, stopwatch: Stopwatch) -> None:
+        """
+        Record the stage timings of a turn.
+
+        :param turn_number: the turn number
+        :param stopwatch: the Stopwatch that timed the turn
+        """
+        for stage, seconds in stopwatch.stages.items():
+            self.stage_calls[stage] += 1
+            self.stage_seconds[stage] += seconds
+        self.turns.append(TurnTiming(turn_number, dict(stopwatch.stages)))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a JSON serializable copy of the metrics.
+
+        :return: a dict
+        """
+        return {
+            "rules": {
+                name: {
+                    "calls": calls,
+                    "seconds": self.rule_seconds[name],
+                    "failures": self.rule_failures[name],
+                }
+                for name, calls in sorted(self.rule_calls.items())
+            },
+            "stages": {
+                stage: {"calls": calls, "seconds": self.stage_seconds[stage]}
+                for stage, calls in sorted(self.stage_calls.items())
+            },
+            "turns": [{"turn": turn.turn_number, **turn.stages} for turn in self.turns],
+        }
+
+    def to_json(self) -> str:
+        """
+        Format a snapshot of the metrics as JSON.
+
+        :return: a JSON string
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Format the metrics in the Prometheus text exposition format.
+
+        :return: the metrics, one sample per line
+        """
+        lines = []
+        families: List[Tuple[str, str, str, Mapping[str, float]]] = [
+            ("rule_calls_total", "Rule checks.", "rule", self.rule_calls),
+            (
+                "rule_seconds_total",
+                "Time spent checking rules.",
+                "rule",
+                self.rule_seconds,
+            ),
+            ("rule_failures_total", "Failed rule checks.", "rule", self.rule_failures),
+            ("stage_calls_total", "Timed turn stages.", "stage", self.stage_calls),
+            (
+                "stage_seconds_total",
+                "Time spent in turn stages.",
+                "stage",
+                self.stage_seconds,
+            ),
+        ]
+        for name, description, label, values in families:
+            metric = f"{self.PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for key, value in sorted(values.items()):
+                lines.append(f'{metric}{{{label}="{key}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str, format_: str = "json") -> None:
+        """
+        Write the metrics to a file.
+
+        :param path: the file path
+        :param format_: "json" or "prometheus"
+        :raise: ValueError if the format is unknown
+        """
+        if format_ == "json":
+            text = self.to_json() + "\n"
+        elif format_ == "prometheus":
+            text = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown metrics format: {format_!r}")
+        with open(path, "w") as file:
+            file.write(text)
@@ -1,16 +1,42 @@
+import functools
 from dataclasses import dataclass
-from typing import Sequence, Tuple
+from typing import Any, Sequence, Tuple
 
-from . import enums, utils
+from . import enums, geometry, utils
+
+#: The number of bits of a packed Move used for the team and the location count.
+HEADER_BITS = 6
+#: The number of bits of a packed Move used for each location.
+SQUARE_BITS = 6
+#: The maximum number of locations of a packed Move.
+MAX_LOCATIONS = 31
+
+_TEAMS = (enums.Team.ONE, enums.Team.TWO)
 
 
 @dataclass(frozen=True)
 class Move:
     """A single Supercheckers move represented by a team and a sequence of locations."""
 
+    __slots__ = ("team", "locations")
+
     team: enums.Team
     locations: Sequence[Tuple[int, int]]
 
+    def __post_init__(self) -> None:
+        """Store the locations as a tuple, so that a Move can be hashed."""
+        if type(self.locations) is not tuple:
+            object.__setattr__(self, "locations", tuple(self.locations))
+
+    @property
+    def code(self) -> int:
+        """
+        Return the packed integer encoding of this Move.
+
+        :return: an integer, see encode
+        """
+        return encode(self)
+
     def __len__(self) -> int:
         """
         Return the length of the Love, which is the number of locations in the move.
@@ -29,3 +55,91 @@ class Move:
             f"{utils.to_char(col_id)}{row_id + 1}" for row_id, col_id in self.locations
         )
         return f"[{self.team.value}: {locations}]"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle a Move as its packed integer encoding when possible.
+
+        :return: a reduce tuple
+        """
+        try:
+            return decode, (encode(self),)
+        except ValueError:
+            return Move, (self.team, self.locations)
+
+
+def encode(move: Move) -> int:
+    """
+    Pack a Move into an integer.
+
+    Bit 0 is the team (0 for Team.ONE, 1 for Team.TWO), bits 1 to 5 are the number of
+    locations, and every following group of SQUARE_BITS bits is the square index of
+    the next location.
+
+    :param move: a Move
+    :return: an integer
+    :raise: ValueError if the Move can not be packed
+    """
+    count = len(move.locations)
+    if count > MAX_LOCATIONS:
+        raise ValueError(f"Too many locations to encode: {move!r}")
+    code = _TEAMS.index(move.team) | count << 1
+    shift = HEADER_BITS
+    for row_id, col_id in move.locations:
+        if not (0 <= row_id < geometry.ROWS and 0 <= col_id < geometry.COLS):
+            raise ValueError(f"Invalid location to encode: {move!r}")
+        code |= (row_id * geometry.COLS + col_id) << shift
+        shift += SQUARE_BITS
+    return code
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def decode(code: int) -> Move:
+    """
+    Unpack an integer into a Move.
+
+    Decoded Moves are interned, so decoding the same integer again returns the same
+    Move object.
+
+    :param code: an integer created by encode
+    :return: a Move
+    """
+    return Move(_TEAMS[code & 1], decode_locations(code))
+
+
+def decode_locations(code: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Unpack the locations of a packed Move.
+
+    :param code: an integer created by encode
+    :return: a tuple of (row_id, col_id) locations
+    """
+    count = code >> 1 & MAX_LOCATIONS
+    square_mask = (1 << SQUARE_BITS) - 1
+    code >>= HEADER_BITS
+    locations = []
+    for _ in range(count):
+        locations.append(geometry.LOCATIONS[code & square_mask])
+        code >>= SQUARE_BITS
+    return tuple(locations)
+
+
+def length(code: int) -> int:
+    """
+    Return the number of locations of a packed Move.
+
+    :param code: an integer created by encode
+    :return: the number of locations
+    """
+    return code >> 1 & MAX_LOCATIONS
+
+
+def intern(move: Move) -> Move:
+    """
+    Return the shared Move object equal to a Move.
+
+    :param move: a Move
+    :return: an equal, interned Move
+    :raise: ValueError if the Move can not be packed
+    """
+    return decode(encode(move))
@@ -1,8 +1,19 @@
+from __future__ import annotations
+
 import abc
+import collections
 import re
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 from . import enums, journals, moves, utils
 
+# The engines and the concurrency modules are only imported by the players that use
+# them, so that a ConsolePlayer does not load them.
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    from . import books, tablebases
+
 
 class Player(abc.ABC):
     """An abstract base class representing the interface of a Player."""
@@ -26,11 +37,124 @@ class Player(abc.ABC):
         raise NotImplementedError()
 
 
+class AsyncPlayer(abc.ABC):
+    """An abstract base class representing the interface of an awaitable Player."""
+
+    def __init__(self, team: enums.Team):
+        """
+        Create a new player associated with a team.
+
+        :param team: a Team
+        """
+        self.team = team
+
+    @abc.abstractmethod
+    async def create_move(self, journal: journals.Journal) -> moves.Move:
+        """
+        Create a Move, given a Journal's history of the game, without blocking.
+
+        :param journal: a Game Journal
+        :return: a Move
+        """
+        raise NotImplementedError()
+
+
+#: A synchronous or an awaitable Player.
+AnyPlayer = Union[Player, AsyncPlayer]
+
+
+class ThreadPlayer(AsyncPlayer):
+    """An AsyncPlayer that runs a Player in a thread pool."""
+
+    def __init__(
+        self,
+        player: Player,
+        executor: Optional[concurrent.futures.ThreadPoolExecutor] = None,
+    ):
+        """
+        Wrap a Player, such as a ConsolePlayer, that blocks while creating a Move.
+
+        :param player: a Player
+        :param executor: a thread pool, or None to use the event loop's default one
+        """
+        super().__init__(player.team)
+        self.player = player
+        self.executor = executor
+
+    async def create_move(self, journal: journals.Journal) -> moves.Move:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.player.create_move, journal
+        )
+
+
+_process_players: "collections.OrderedDict[str, Player]" = collections.OrderedDict()
+_PROCESS_PLAYERS_SIZE = 64
+
+
+def _create_move_in_process(
+    key: str, payload: bytes, journal: journals.Journal
+) -> moves.Move:
+    """
+    Create a Move with a Player that is cached in this worker process.
+
+    :param key: the unique key of the Player
+    :param payload: the pickled Player, unpickled if it is not cached yet
+    :param journal: a Game Journal
+    :return: a Move
+    """
+    import pickle
+
+    player = _process_players.pop(key, None) or pickle.loads(payload)
+    _process_players[key] = player
+    if len(_process_players) > _PROCESS_PLAYERS_SIZE:
+        _process_players.popitem(last=False)
+    return player.create_move(journal)
+
+
+class ProcessPlayer(AsyncPlayer):
+    """
+    An AsyncPlayer that runs a Player, such as an EnginePlayer, in a process pool.
+
+    The Player is pickled once. Each worker process unpickles it on first use and
+    keeps it, with its transposition table, for the following Moves, so state that
+    the Player changes in a worker, like EnginePlayer.last_result, is not seen here.
+    """
+
+    def __init__(
+        self, player: Player, executor: concurrent.futures.ProcessPoolExecutor
+    ):
+        """
+        Wrap a Player that spends its time computing a Move.
+
+        :param player: a picklable Player
+        :param executor: the process pool, which may be shared by many players
+        """
+        import pickle
+        import uuid
+
+        super().__init__(player.team)
+        self.player = player
+        self.executor = executor
+        self._key = uuid.uuid4().hex
+        self._payload = pickle.dumps(player)
+
+    async def create_move(self, journal: journals.Journal) -> moves.Move:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _create_move_in_process, self._key, self._payload, journal
+        )
+
+
 class ConsolePlayer(Player):
     """A Player that creates a move by entering text on the console."""
 
-    INPUT_REGEX = re.compile("^([A-Z][0-9][, ] *)+[A-Z][0-9]$", re.IGNORECASE)
-    SPLIT_REGEX = re.compile("[, ] *")
+    INPUT_REGEX = re.compile("^([A-Z]+[0-9]+[, ] *)+[A-Z]+[0-9]+$", re.IGNORECASE)
+    LOCATION_REGEX = re.compile("([A-Z]+)([0-9]+)", re.IGNORECASE)
 
     def create_move(self, journal: journals.Journal) -> moves.Move:
         while True:
@@ -55,6 +179,7 @@ class ConsolePlayer(Player):
         * "c2 c4 c6"
         * "C2 C4"
         * "C2 c4 C6"
+        * "j10 j12" on larger boards
 
         :param move_input: a string representing a Move
         :return: a Move
@@ -63,8 +188,125 @@ class ConsolePlayer(Player):
         if not self.INPUT_REGEX.match(move_input):
             raise ValueError(f"Invalid request: {move_input!r}")
         locations = []
-        for part in self.SPLIT_REGEX.split(move_input):
-            row_id = int(part[1]) - 1
-            col_id = utils.to_int(part[0])
-            locations.append((row_id, col_id))
+        for col_name, row_name in self.LOCATION_REGEX.findall(move_input):
+            locations.append((int(row_name) - 1, utils.to_int(col_name)))
         return moves.Move(self.team, locations)
+
+
+class EnginePlayer(Player):
+    """A Player that creates a move with an alpha-beta search engine."""
+
+    def __init__(
+        self,
+        team: enums.Team,
+        max_depth: int = 4,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        tablebase: Optional[tablebases.Tablebase] = None,
+        book: Optional[books.Book] = None,
+    ):
+        """
+        Create a new engine player associated with a team.
+
+        :param team: a Team
+        :param max_depth: the maximum search depth in plies
+        :param time_limit: an optional budget in seconds per move
+        :param node_limit: an optional budget in nodes per move
+        :param tablebase: an optional Tablebase for positions with few pieces
+        :param book: an optional opening Book, answered without searching
+        """
+        from . import search
+
+        super().__init__(team)
+        self.searcher = search.Searcher(
+            max_depth, time_limit, node_limit, tablebase=tablebase
+        )
+        self.book = book
+        self.last_result: Optional[search.SearchResult] = None
+
+    def create_move(self, journal: journals.Journal) -> moves.Move:
+        from . import search
+
+        entry = _lookup(self.book, journal)
+        if entry is not None:
+            self.last_result = search.SearchResult(
+                entry.move, entry.score, entry.depth, 0, 0.0
+            )
+            return entry.move
+        self.last_result = self.searcher.search(
+            journal.current_board, journal.current_team, journal.current_turn_number
+        )
+        return self.last_result.move
+
+
+class MonteCarloPlayer(Player):
+    """A Player that creates a move with a Monte Carlo tree search."""
+
+    def __init__(
+        self,
+        team: enums.Team,
+        workers: Optional[int] = None,
+        playouts: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+        book: Optional[books.Book] = None,
+    ):
+        """
+        Create a new Monte Carlo player associated with a team.
+
+        :param team: a Team
+        :param workers: the number of playout processes, 0 for none, None for one per
+            CPU
+        :param playouts: an optional budget in playouts per move
+        :param time_limit: an optional budget in seconds per move
+        :param seed: a random seed
+        :param book: an optional opening Book, answered without searching
+        """
+        from . import mcts
+
+        super().__init__(team)
+        self.searcher = mcts.MonteCarloSearcher(
+            workers, playouts, time_limit, seed=seed
+        )
+        self.book = book
+        self.last_result: Optional[mcts.MonteCarloResult] = None
+
+    def create_move(self, journal: journals.Journal) -> moves.Move:
+        entry = _lookup(self.book, journal)
+        if entry is not None:
+            self.last_result = None
+            return entry.move
+        self.last_result = self.searcher.search(
+            journal.current_board, journal.current_team, journal.current_turn_number
+        )
+        return self.last_result.move
+
+    @property
+    def playout_rates(self) -> Dict[int, float]:
+        """
+        Return the playouts per second completed by each process in the last search.
+
+        :return: a dict of process id to playouts per second
+        """
+        return self.searcher.rates
+
+    def close(self) -> None:
+        """Shut down the playout processes."""
+        self.searcher.close()
+
+
+def _lookup(
+    book: Optional[books.Book], journal: journals.Journal
+) -> Optional[books.BookEntry]:
+    """
+    Look up the current position of a game in an opening book.
+
+    :param book: a Book, or None
+    :param journal: a Game Journal
+    :return: a BookEntry, or None if there is no book or the position is not in it
+    """
+    if book is None:
+        return None
+    return book.lookup(
+        journal.current_board, journal.current_team, journal.current_turn_number
+    )
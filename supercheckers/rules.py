@@ -1,14 +1,64 @@
 import abc
-import inspect
-import sys
-from typing import Iterable
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
-from . import enums, journals, moves, utils
+from . import boards, enums, journals, moves, utils
+
+
+class Context:
+    """
+    The shared state of a single Move verification.
+
+    The board and the location descriptions are computed at most once and shared by
+    every Rule checking the same Move. Rules must not modify them.
+    """
+
+    def __init__(self, journal: journals.Journal, move: moves.Move):
+        """
+        Create a verification context.
+
+        :param journal: a Game Journal
+        :param move: a Move to validate
+        """
+        self.journal = journal
+        self.move = move
+        self._board: Optional[boards.Board] = None
+        self._descriptions: Optional[List[utils.Description]] = None
+
+    @property
+    def board(self) -> boards.Board:
+        """
+        Return the current board of the journal.
+
+        :return: a Board
+        """
+        if self._board is None:
+            self._board = self.journal.current_board
+        return self._board
+
+    @property
+    def descriptions(self) -> List[utils.Description]:
+        """
+        Return the Description of each pair of consecutive locations in the Move.
+
+        :return: a list of Descriptions, one shorter than the Move
+        """
+        if self._descriptions is None:
+            locations = self.move.locations
+            compare = self.journal.geometry.compare
+            self._descriptions = [
+                compare(locations[i - 1], locations[i])
+                for i in range(1, len(locations))
+            ]
+        return self._descriptions
 
 
 class Rule(abc.ABC):
     """An abstract base class that represents the interface for a rule."""
 
+    #: The relative cost of checking the rule. Cheaper rules are checked first when
+    #: a Verifier stops at the first failure.
+    cost = 0
+
     @property
     @abc.abstractmethod
     def message(self) -> str:
@@ -19,7 +69,21 @@ class Rule(abc.ABC):
         """
         raise NotImplementedError()
 
-    @abc.abstractmethod
+    def check(self, context: Context) -> bool:
+        """
+        Validate a move based on a shared verification Context.
+
+        Subclasses should override either this method or is_valid. By default it
+        delegates to is_valid, so rules written before Context existed still work.
+
+        :param context: a verification Context
+        :return: True if the Move is valid
+        :raise: NotImplementedError if neither method is overridden
+        """
+        if type(self).is_valid is Rule.is_valid:
+            raise NotImplementedError()
+        return self.is_valid(context.journal, context.move)
+
     def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
         """
         Validate a move based on the Game Journal.
@@ -27,8 +91,11 @@ class Rule(abc.ABC):
         :param journal: a Game Journal
         :param move: a Move to validate
         :return: True if the Move is valid
+        :raise: NotImplementedError if neither method is overridden
         """
-        raise NotImplementedError()
+        if type(self).check is Rule.check:
+            raise NotImplementedError()
+        return self.check(Context(journal, move))
 
     def __repr__(self) -> str:
         """
@@ -39,20 +106,41 @@ class Rule(abc.ABC):
         return f"{self.__class__.__qualname__}()"
 
 
+#: Every concrete Rule class, by class name.
+RULES: Dict[str, Type[Rule]] = {}
+
+
+def _rule(rule_class: Type[Rule]) -> Type[Rule]:
+    """
+    Register a concrete Rule class.
+
+    :param rule_class: a Rule subclass
+    :return: the same class
+    """
+    RULES[rule_class.__name__] = rule_class
+    return rule_class
+
+
+@_rule
 class AtLeastTwoLocationsRule(Rule):
     """Rule requiring a Move to have at least two locations."""
 
+    cost = 0
+
     @property
     def message(self) -> str:
         return "Your move must contain at least two locations."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        return len(move) >= 2
+    def check(self, context: Context) -> bool:
+        return len(context.move) >= 2
 
 
+@_rule
 class ExactlyTwoLocationsRule(Rule):
     """Rule requiring a Move with two locations has either a slide or a jump."""
 
+    cost = 2
+
     @property
     def message(self) -> str:
         return (
@@ -60,168 +148,180 @@ class ExactlyTwoLocationsRule(Rule):
             "(two spaces) in a straight line. "
         )
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        if len(move) != 2:
+    def check(self, context: Context) -> bool:
+        if len(context.move) != 2:
             return True
-        src_loc, dst_loc = move.locations
-        description = utils.compare(src_loc, dst_loc)
+        description = context.descriptions[0]
         return description.move_type is not enums.MoveType.UNKNOWN
 
 
+@_rule
 class MoreThanTwoLocationsRule(Rule):
     """Rule requiring a Move with more than two locations has only jumps."""
 
+    cost = 2
+
     @property
     def message(self) -> str:
         return (
             "A move with more than two locations must contain only jumps (two spaces)."
         )
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        if len(move) <= 2:
+    def check(self, context: Context) -> bool:
+        if len(context.move) <= 2:
             return True
-        for i in range(1, len(move)):
-            src_loc = move.locations[i - 1]
-            dst_loc = move.locations[i]
-            description = utils.compare(src_loc, dst_loc)
+        for description in context.descriptions:
             if description.move_type != enums.MoveType.JUMP:
                 return False
         return True
 
 
+@_rule
 class AlwaysOnTheBoardRule(Rule):
     """Rule requiring a Move never leaves the board."""
 
+    cost = 1
+
     @property
     def message(self) -> str:
         return "Your piece must remain on the board at all times."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        board = journal.current_board
-        for location in move.locations:
-            row_id, col_id = location
-            if not (0 <= row_id < board.MAX_ROW):
-                return False
-            if not (0 <= col_id < board.MAX_COL):
+    def check(self, context: Context) -> bool:
+        on_board = context.journal.geometry.on_board
+        for location in context.move.locations:
+            if not on_board(location):
                 return False
         return True
 
 
+@_rule
 class CorrectTeamRule(Rule):
     """Rule requiring a Move manipulates a piece from the correct team."""
 
+    cost = 3
+
     @property
     def message(self) -> str:
         return "You must move a piece from your own team."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        board = journal.current_board
-        if not move.locations:
+    def check(self, context: Context) -> bool:
+        if not context.move.locations:
             return False
-        piece = board[move.locations[0]]
+        piece = context.board[context.move.locations[0]]
         if not piece:
             return False
-        if piece.team != journal.current_team:
+        if piece.team != context.journal.current_team:
             return False
         return True
 
 
+@_rule
 class IntermediateLandingLocationsRule(Rule):
     """Rule requiring a Move's intermediate locations be empty."""
 
+    cost = 3
+
     @property
     def message(self) -> str:
         return "All intermediate landing locations must be empty."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        if len(move) <= 2:
+    def check(self, context: Context) -> bool:
+        if len(context.move) <= 2:
             return True
-        board = journal.current_board
-        for location in move.locations[1:-1]:
+        board = context.board
+        for location in context.move.locations[1:-1]:
             if board[location] is not None:
                 return False
         return True
 
 
+@_rule
 class FinalLandingLocationRule(Rule):
     """Rule requiring a Move's final location be empty."""
 
+    cost = 3
+
     @property
     def message(self) -> str:
         return "Your final landing location must be empty."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        if len(move) <= 1:
+    def check(self, context: Context) -> bool:
+        if len(context.move) <= 1:
             return True
-        return journal.current_board[move.locations[-1]] is None
+        return context.board[context.move.locations[-1]] is None
 
 
+@_rule
 class FirstFourMovesRule(Rule):
     """Rule requiring the first four Moves be slides into the middle of the board."""
 
+    cost = 2
+
     @property
     def message(self) -> str:
         return "For your first two moves, you must slide into the middle."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        if journal.current_turn_number > 4:
+    def check(self, context: Context) -> bool:
+        if context.journal.current_turn_number > 4:
             return True
-        if len(move) != 2:
+        if len(context.move) != 2:
             return False
-        src_loc, dst_loc = move.locations
-        description = utils.compare(src_loc, dst_loc)
+        description = context.descriptions[0]
         if description.move_type != enums.MoveType.SLIDE:
             return False
-        if not utils.in_middle(dst_loc):
+        if not context.journal.geometry.in_middle(context.move.locations[1]):
             return False
         return True
 
 
+@_rule
 class JumpOverAPieceRule(Rule):
     """Rule requiring a Move's jumps to occur over a piece."""
 
+    cost = 4
+
     @property
     def message(self) -> str:
         return "All jumps must be over a piece."
 
-    def is_valid(self, journal: journals.Journal, move: moves.Move) -> bool:
-        team = journal.current_team
-        board = journal.current_board
-        for i in range(1, len(move.locations)):
-            src_loc = move.locations[i - 1]
-            dst_loc = move.locations[i]
-            description = utils.compare(src_loc, dst_loc)
+    def check(self, context: Context) -> bool:
+        team = context.journal.current_team
+        board = context.board
+        captured = set()
+        for description in context.descriptions:
             if description.move_type == enums.MoveType.JUMP:
                 jmp_loc = description.jmp_loc
                 assert jmp_loc
                 jmp_piece = board[jmp_loc]
-                if jmp_piece is None:
+                if jmp_piece is None or jmp_loc in captured:
                     return False
                 if jmp_piece.team != team:
-                    board[jmp_loc] = None
+                    captured.add(jmp_loc)
         return True
 
 
-def all_rules() -> Iterable[Rule]:
+#: The names of the Rules in each rule set. The "standard" set is every rule of the
+#: game, and the "shape" set only checks the locations of a Move, without a board.
+RULE_SETS: Dict[str, Tuple[str, ...]] = {
+    "standard": tuple(sorted(RULES)),
+    "shape": (
+        "AlwaysOnTheBoardRule",
+        "AtLeastTwoLocationsRule",
+        "ExactlyTwoLocationsRule",
+        "MoreThanTwoLocationsRule",
+    ),
+}
+
+
+def all_rules(rule_set: str = "standard") -> Iterable[Rule]:
     """
-    Return all instances of Rules defined in this module in alphabetical order.
+    Return instances of the Rules of a rule set in alphabetical order.
 
+    :param rule_set: the name of a rule set in RULE_SETS
     :return: an Iterable of Rules
+    :raise: ValueError if the rule set does not exist
     """
-
-    def is_concrete_rule_class(obj):
-        """
-        Determine if object is a concrete class that is a subclass of Rule.
-
-        :param obj: any object
-        :return: True if object is a concrete class that is a subclass of Rule
-        """
-        return (
-            inspect.isclass(obj)
-            and not inspect.isabstract(obj)
-            and issubclass(obj, Rule)
-        )
-
-    current_module = sys.modules[__name__]
-    rule_classes = inspect.getmembers(current_module, is_concrete_rule_class)
-    return [rule_class() for name, rule_class in rule_classes]
+    names = RULE_SETS.get(rule_set)
+    if names is None:
+        raise ValueError(f"Invalid rule set: {rule_set!r}")
+    return [RULES[name]() for name in names]
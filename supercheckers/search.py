@@ -0,0 +1,367 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from . import boards, enums, movegen, moves, tablebases, transpositions
+
+WIN_SCORE = 100000.0
+#: Values beyond this are wins or losses a number of plies away.
+MATE_SCORE = WIN_SCORE / 2
+COURT_WEIGHT = 4.0
+MATERIAL_WEIGHT = 1.0
+
+_OPENING_KEY = random.Random(0x0BE11).getrandbits(64)
+
+
+@dataclass
+class SearchResult:
+    """The Result of a Searcher's search for the best Move."""
+
+    move: moves.Move
+    value: float
+    depth: int
+    nodes: int
+    elapsed: float
+
+
+class _SearchAborted(Exception):
+    """Raised inside a search when its time or node budget is exhausted."""
+
+
+def _count(mask: int) -> int:
+    """
+    Count the bits set in a mask.
+
+    :param mask: an occupancy mask
+    :return: the number of pieces in the mask
+    """
+    return bin(mask).count("1")
+
+
+def evaluate(board: boards.Board, team: enums.Team) -> float:
+    """
+    Evaluate a board from the point of view of a team.
+
+    The evaluation rewards having more pieces than the opponent in the middle of the
+    board (the King's Court), and more pieces than the opponent overall.
+
+    :param board: a Board
+    :param team: the Team the evaluation is for
+    :return: a positive value if the team is ahead
+    """
+    mask_1, mask_2 = board.masks
+    court_1, court_2 = board.court_counts
+    if team == enums.Team.TWO:
+        mask_1, mask_2 = mask_2, mask_1
+        court_1, court_2 = court_2, court_1
+    court = court_1 - court_2
+    material = _count(mask_1) - _count(mask_2)
+    return COURT_WEIGHT * court + MATERIAL_WEIGHT * material
+
+
+def winner(board: boards.Board, turn_number: int) -> Tuple[bool, Optional[enums.Team]]:
+    """
+    Determine if the game is over at the start of a turn, and who won.
+
+    :param board: a Board
+    :param turn_number: the turn number that is about to be played
+    :return: a (game_over, winning Team or None) tuple
+    """
+    if turn_number <= 4:
+        return False, None
+    mask_1, mask_2 = board.masks
+    in_court_1 = bool(mask_1 & boards.MIDDLE_MASK)
+    in_court_2 = bool(mask_2 & boards.MIDDLE_MASK)
+    if in_court_1 and in_court_2:
+        return False, None
+    if in_court_1:
+        return True, enums.Team.ONE
+    if in_court_2:
+        return True, enums.Team.TWO
+    return True, None
+
+
+class Searcher:
+    """An iterative deepening alpha-beta Searcher."""
+
+    def __init__(
+        self,
+        max_depth: int = 4,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        table: Optional[transpositions.TranspositionTable] = None,
+        tablebase: Optional[tablebases.Tablebase] = None,
+    ):
+        """
+        Create a Searcher.
+
+        The search deepens one ply at a time until max_depth is reached or the time or
+        node budget runs out. The best Move of the deepest completed iteration is used.
+
+        :param max_depth: the maximum search depth in plies
+        :param time_limit: an optional budget in seconds per search
+        :param node_limit: an optional budget in nodes per search
+        :param table: a TranspositionTable, or None to create one
+        :param tablebase: an optional Tablebase, probed after the opening
+        """
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.table = table if table is not None else transpositions.TranspositionTable()
+        self.tablebase = tablebase
+        self.nodes = 0
+        self._deadline: Optional[float] = None
+
+    def search(
+        self, board: boards.Board, team: enums.Team, turn_number: int
+    ) -> SearchResult:
+        """
+        Search for the best Move for a team.
+
+        The search works on a single copy of the board, making and unmaking every
+        Move in place, so the given board is never modified.
+
+        :param board: the current Board
+        :param team: the Team to move
+        :param turn_number: the current turn number
+        :return: a SearchResult
+        :raise: ValueError if the team has no legal moves
+        """
+        start = time.perf_counter()
+        self.nodes = 0
+        self._deadline = start + self.time_limit if self.time_limit else None
+        self.table.new_search()
+
+        root_moves = list(movegen.generate_codes(board, team, turn_number <= 4))
+        if not root_moves:
+            raise ValueError(f"No legal moves for {team!r}")
+        if self.tablebase is not None and turn_number > 4:
+            probe = self.tablebase.probe(board, team)
+            best = self.tablebase.best_move(board, team)
+            if probe is not None and best is not None:
+                elapsed = time.perf_counter() - start
+                return SearchResult(best, _probe_value(probe, 0), 0, 0, elapsed)
+        board = board.copy()
+        best_move, best_value, best_depth = root_moves[0], 0.0, 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                move, value = self._search_root(
+                    board, team, turn_number, depth, root_moves
+                )
+            except _SearchAborted:
+                break
+            best_move, best_value, best_depth = move, value, depth
+            root_moves.remove(move)
+            root_moves.insert(0, move)
+            if abs(value) >= WIN_SCORE - self.max_depth:
+                break
+        elapsed = time.perf_counter() - start
+        return SearchResult(
+            moves.decode(best_move), best_value, best_depth, self.nodes, elapsed
+        )
+
+    def _search_root(
+        self,
+        board: boards.Board,
+        team: enums.Team,
+        turn_number: int,
+        depth: int,
+        root_moves: List[int],
+    ) -> Tuple[int, float]:
+        """
+        Search every root Move to a fixed depth.
+
+        :param board: the current Board, restored before returning
+        :param team: the Team to move
+        :param turn_number: the current turn number
+        :param depth: the depth to search to
+        :param root_moves: the packed legal Moves, best first
+        :return: a (best packed Move, value) tuple
+        """
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        other = opponent(team)
+        best_move = root_moves[0]
+        for move in root_moves:
+            undo = board.make(moves.decode(move))
+            value = -self._negamax(
+                board, other, turn_number + 1, depth - 1, 1, -beta, -alpha
+            )
+            board.unmake(undo)
+            if value > alpha:
+                alpha, best_move = value, move
+        key = position_key(board, team, turn_number)
+        self.table.store(key, depth, alpha, enums.Bound.EXACT, best_move)
+        return best_move, alpha
+
+    def _negamax(
+        self,
+        board: boards.Board,
+        team: enums.Team,
+        turn_number: int,
+        depth: int,
+        ply: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        """
+        Return the value of a position for the team to move.
+
+        :param board: a Board, restored before returning
+        :param team: the Team to move
+        :param turn_number: the turn number about to be played
+        :param depth: the remaining depth
+        :param ply: the distance from the root
+        :param alpha: the lower bound of the search window
+        :param beta: the upper bound of the search window
+        :return: the value of the position
+        """
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise _SearchAborted()
+        if self._deadline is not None and not self.nodes & 1023:
+            if time.perf_counter() > self._deadline:
+                raise _SearchAborted()
+
+        game_over, winning_team = winner(board, turn_number)
+        if game_over:
+            if winning_team is None:
+                return 0.0
+            return WIN_SCORE - ply if winning_team == team else ply - WIN_SCORE
+        if self.tablebase is not None and turn_number > 4:
+            probe = self.tablebase.probe(board, team)
+            if probe is not None:
+                return _probe_value(probe, ply)
+        if depth <= 0:
+            return evaluate(board, team)
+
+        key = position_key(board, team, turn_number)
+        entry = self.table.probe(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry.move
+            if entry.depth >= depth:
+                value = _from_table(entry.value, ply)
+                if entry.bound == enums.Bound.EXACT:
+                    return value
+                if entry.bound == enums.Bound.LOWER and value >= beta:
+                    return value
+                if entry.bound == enums.Bound.UPPER and value <= alpha:
+                    return value
+
+        original_alpha = alpha
+        best_value = ply - WIN_SCORE
+        best_move = None
+        other = opponent(team)
+        legal_moves = movegen.generate_codes(board, team, turn_number <= 4)
+        for move in _ordered(legal_moves, tt_move):
+            undo = board.make(moves.decode(move))
+            value = -self._negamax(
+                board, other, turn_number + 1, depth - 1, ply + 1, -beta, -alpha
+            )
+            board.unmake(undo)
+            if value > best_value:
+                best_value, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best_value <= original_alpha:
+            bound = enums.Bound.UPPER
+        elif best_value >= beta:
+            bound = enums.Bound.LOWER
+        else:
+            bound = enums.Bound.EXACT
+        self.table.store(key, depth, _to_table(best_value, ply), bound, best_move)
+        return best_value
+
+
+def opponent(team: enums.Team) -> enums.Team:
+    """
+    Return the opposing team.
+
+    :param team: a Team
+    :return: the other Team
+    """
+    return enums.Team.TWO if team == enums.Team.ONE else enums.Team.ONE
+
+
+def _to_table(value: float, ply: int) -> float:
+    """
+    Convert a search value into a transposition table value.
+
+    Wins and losses are stored as their distance from the position rather than
+    from the root, so that they stay correct when reached at another ply.
+
+    :param value: the value of a position
+    :param ply: the distance from the root
+    :return: the value to store
+    """
+    if value >= MATE_SCORE:
+        return value + ply
+    if value <= -MATE_SCORE:
+        return value - ply
+    return value
+
+
+def _from_table(value: float, ply: int) -> float:
+    """
+    Convert a transposition table value back into a search value, see _to_table.
+
+    :param value: the stored value
+    :param ply: the distance from the root
+    :return: the value of the position
+    """
+    if value >= MATE_SCORE:
+        return value - ply
+    if value <= -MATE_SCORE:
+        return value + ply
+    return value
+
+
+def _probe_value(probe: tablebases.Probe, ply: int) -> float:
+    """
+    Convert a tablebase Probe into a search value.
+
+    :param probe: a Probe for the team to move
+    :param ply: the distance from the root
+    :return: the value of the position
+    """
+    if probe.outcome == enums.Outcome.WIN:
+        return WIN_SCORE - ply - probe.distance
+    if probe.outcome == enums.Outcome.LOSS:
+        return ply + probe.distance - WIN_SCORE
+    return 0.0
+
+
+def position_key(board: boards.Board, team: enums.Team, turn_number: int) -> int:
+    """
+    Return the transposition key of a position.
+
+    Opening positions are keyed separately, because their legal moves differ.
+
+    :param board: a Board
+    :param team: the Team to move
+    :param turn_number: the turn number about to be played
+    :return: a 64-bit key
+    """
+    key = board.position_hash(team)
+    return key ^ _OPENING_KEY if turn_number <= 4 else key
+
+
+def _ordered(legal_moves: Iterable[int], tt_move: Optional[int]) -> List[int]:
+    """
+    Order Moves so that the most promising ones are searched first.
+
+    The transposition table Move comes first, followed by the longest jump chains.
+
+    :param legal_moves: an Iterable of packed legal Moves
+    :param tt_move: the best packed Move stored in the transposition table, if any
+    :return: a list of packed Moves
+    """
+    ordered = sorted(legal_moves, key=moves.length, reverse=True)
+    if tt_move is not None and tt_move in ordered:
+        ordered.remove(tt_move)
+        ordered.insert(0, tt_move)
+    return ordered
@@ -0,0 +1,168 @@
+import concurrent.futures
+import random
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+from . import boards, enums, games, journals, movegen, players, rules, verifiers
+
+#: A callable that receives each finished game with its index.
+Sink = Callable[[int, games.GameRecord], None]
+
+
+def play_game(
+    player_1: players.Player,
+    player_2: players.Player,
+    verifier: Optional[verifiers.Verifier] = None,
+    seed: Optional[int] = None,
+    max_turns: int = 500,
+    random_turns: int = 0,
+) -> games.GameRecord:
+    """
+    Play a single game between two players with a quiet games.Game.
+
+    The first random_turns turns are played with random legal moves, so that games
+    between deterministic players differ. A game that reaches max_turns is left
+    IN_PROGRESS, and a game where a player creates an invalid move ends in ERROR.
+
+    :param player_1: the Player for Team.ONE
+    :param player_2: the Player for Team.TWO
+    :param verifier: a rules Verifier, or None to use all rules
+    :param seed: a random seed for the random turns
+    :param max_turns: the maximum number of turns to play
+    :param random_turns: the number of turns to play randomly
+    :return: a GameRecord
+    """
+    if verifier is None:
+        verifier = verifiers.Verifier(rules.all_rules())
+    rng = random.Random(seed)
+    state = games.GameState(player_1, player_2, journals.Journal(boards.Board()))
+    game = games.Game(state, verifier, verbose=False)
+    game.begin()
+    journal = state.journal
+    while game.in_progress and journal.current_turn_number <= max_turns:
+        if journal.current_turn_number <= random_turns:
+            legal_moves = list(movegen.generate(journal))
+            if not legal_moves:
+                game.end(error=True)
+                break
+            move = rng.choice(legal_moves)
+        else:
+            player = state.current_player
+            assert isinstance(player, players.Player)
+            move = player.create_move(journal.copy())
+        if not game.play_move(move):
+            game.end(error=True)
+            break
+    return state.to_record(seed)
+
+
+_worker_args: Dict[str, object] = {}
+
+
+def _init_worker(
+    player_1: players.Player,
+    player_2: players.Player,
+    max_turns: int,
+    random_turns: int,
+) -> None:
+    """
+    Store the players and the game settings once per worker process.
+
+    :param player_1: the Player for Team.ONE
+    :param player_2: the Player for Team.TWO
+    :param max_turns: the maximum number of turns to play
+    :param random_turns: the number of turns to play randomly
+    """
+    _worker_args.update(
+        player_1=player_1,
+        player_2=player_2,
+        max_turns=max_turns,
+        random_turns=random_turns,
+    )
+
+
+def _play_worker_game(index: int, seed: int) -> Tuple[int, games.GameRecord]:
+    """
+    Play a game with the players stored in this worker process.
+
+    :param index: the index of the game
+    :param seed: the random seed of the game
+    :return: an (index, GameRecord) tuple
+    """
+    record = play_game(seed=seed, **_worker_args)  # type: ignore
+    return index, record
+
+
+def run(
+    player_1: players.Player,
+    player_2: players.Player,
+    games_count: int,
+    workers: int = 0,
+    seed: int = 0,
+    max_turns: int = 500,
+    random_turns: int = 4,
+) -> Iterator[Tuple[int, games.GameRecord]]:
+    """
+    Play many games between two players, yielding each game as soon as it finishes.
+
+    Game i is played with the random seed seed + i. Games are spread over a process
+    pool, where each worker receives the players once, and at most a few games per
+    worker are queued at a time, so memory does not grow with the number of games.
+    Finished games may be yielded out of order.
+
+    :param player_1: the Player for Team.ONE
+    :param player_2: the Player for Team.TWO
+    :param games_count: the number of games to play
+    :param workers: the number of worker processes, or 0 to play in this process
+    :param seed: the random seed of the first game
+    :param max_turns: the maximum number of turns per game
+    :param random_turns: the number of turns per game to play randomly
+    :return: an Iterator of (index, GameRecord) tuples
+    """
+    if not workers:
+        _init_worker(player_1, player_2, max_turns, random_turns)
+        for index in range(games_count):
+            yield _play_worker_game(index, seed + index)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(player_1, player_2, max_turns, random_turns),
+    ) as executor:
+        pending: Set[concurrent.futures.Future] = set()
+        next_index = 0
+        while next_index < games_count or pending:
+            while next_index < games_count and len(pending) < workers * 4:
+                pending.add(
+                    executor.submit(_play_worker_game, next_index, seed + next_index)
+                )
+                next_index += 1
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+
+
+def run_to_sink(
+    player_1: players.Player,
+    player_2: players.Player,
+    games_count: int,
+    sink: Sink,
+    **kwargs: int,
+) -> Dict[Optional[enums.Team], int]:
+    """
+    Play many games between two players and send each finished game to a sink.
+
+    :param player_1: the Player for Team.ONE
+    :param player_2: the Player for Team.TWO
+    :param games_count: the number of games to play
+    :param sink: a callable receiving each (index, GameRecord)
+    :param kwargs: the keyword arguments of run
+    :return: a dict of the number of wins per winning Team, with None for no winner
+    """
+    results: Dict[Optional[enums.Team], int] = {}
+    for index, record in run(player_1, player_2, games_count, **kwargs):
+        sink(index, record)
+        results[record.winner] = results.get(record.winner, 0) + 1
+    return results
@@ -0,0 +1,566 @@
+import asyncio
+import collections
+import itertools
+import json
+import random
+import signal
+import time
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from . import (
+    boards,
+    enums,
+    games,
+    journals,
+    movegen,
+    notation,
+    rules,
+    search,
+    verifiers,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7878
+
+#: The most bytes waiting to be sent to a client before it is disconnected as stalled.
+MAX_WRITE_BUFFER = 1 << 20
+
+Message = Dict[str, Any]
+
+
+class Connection:
+    """
+    A client Connection, exchanging one JSON object per line.
+
+    Messages are written without waiting for the client to read them, so that a slow
+    client never holds up a game. A client that lets more than MAX_WRITE_BUFFER bytes
+    pile up is disconnected instead.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Create a Connection.
+
+        :param reader: the stream to read messages from
+        :param writer: the stream to write messages to
+        """
+        self.reader = reader
+        self.writer = writer
+        self.session: Optional["Session"] = None
+        self.team: Optional[enums.Team] = None
+
+    async def receive(self) -> Optional[Message]:
+        """
+        Read the next message.
+
+        :return: a Message, or None if the stream has ended
+        :raise: ValueError if the line is not a JSON object
+        """
+        line = await self.reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError("Messages must be JSON objects")
+        return message
+
+    def send(self, message: Message) -> None:
+        """
+        Write a message, unless the connection is closing.
+
+        If the client is not reading its messages, the connection is aborted, which
+        ends its reads as if the client had disconnected.
+
+        :param message: a JSON serializable Message
+        """
+        if self.writer.is_closing():
+            return
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.writer.transport.abort()
+
+    def error(self, message: str, **values: Any) -> None:
+        """
+        Write an error message.
+
+        :param message: a description of the error
+        :param values: additional values of the message
+        """
+        self.send(dict(type="error", message=message, **values))
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class Session:
+    """
+    A game between two Connections, hosted by a Server.
+
+    The Moves of both teams arrive over their Connections, so the GameState of a
+    session has no Players.
+
+    Messages from both connections are put in the inbox of the session, as (Team,
+    Message) tuples, where a None Message means that the connection was lost and a
+    None Team means that the server is shutting down.
+    """
+
+    def __init__(
+        self,
+        session_id: int,
+        connections: Tuple[Connection, Connection],
+        verifier: verifiers.Verifier,
+        move_timeout: Optional[float] = None,
+    ):
+        """
+        Create a Session.
+
+        :param session_id: the id of the session
+        :param connections: the Connections of Team.ONE and Team.TWO
+        :param verifier: the Verifier of every Move
+        :param move_timeout: the seconds a player has to move, or None for no limit
+        """
+        self.id = session_id
+        self.verifier = verifier
+        self.move_timeout = move_timeout
+        self.connections = dict(zip(boards.Board.TEAMS, connections))
+        self.state = games.GameState(
+            None,
+            None,
+            journals.Journal(boards.Board()),
+            enums.PlayState.IN_PROGRESS,
+        )
+        self.inbox: "asyncio.Queue[Tuple[Optional[enums.Team], Optional[Message]]]"
+        self.inbox = asyncio.Queue()
+        for team, connection in self.connections.items():
+            connection.session = self
+            connection.team = team
+
+    async def run(self) -> enums.EndReason:
+        """
+        Play the game until it ends, then detach the connections.
+
+        :return: the EndReason
+        """
+        for team, connection in self.connections.items():
+            connection.send(dict(type="start", game=self.id, team=team.value))
+        reason = await self._play()
+        winner = self.state.winner.value if self.state.winner else None
+        self._broadcast(
+            dict(type="end", game=self.id, winner=winner, reason=reason.value)
+        )
+        for connection in self.connections.values():
+            connection.session = connection.team = None
+        return reason
+
+    async def _play(self) -> enums.EndReason:
+        """
+        Apply valid Moves from the players until the game ends.
+
+        :return: the EndReason
+        """
+        journal = self.state.journal
+        loop = asyncio.get_running_loop()
+        move_timeout = self.move_timeout
+        deadline = None if move_timeout is None else loop.time() + move_timeout
+        while self.state.play_state == enums.PlayState.IN_PROGRESS:
+            current = journal.current_team
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                team, message = await asyncio.wait_for(self.inbox.get(), timeout)
+            except asyncio.TimeoutError:
+                self._finish(search.opponent(current))
+                return enums.EndReason.TIMEOUT
+            if team is None:
+                return enums.EndReason.SHUTDOWN
+            if message is None:
+                self._finish(search.opponent(team))
+                return enums.EndReason.DISCONNECT
+            connection = self.connections[team]
+            kind = message.get("type")
+            if kind == "resign":
+                self._finish(search.opponent(team))
+                return enums.EndReason.RESIGN
+            if kind != "move":
+                connection.error(f"Unexpected message type: {kind!r}")
+                continue
+            if team != current:
+                connection.error("Not your turn")
+                continue
+            try:
+                move = notation.parse_move(str(message.get("move")), team)
+            except notation.NotationError as e:
+                connection.error(str(e))
+                continue
+            result = self.verifier.verify(journal, move, fail_fast=True)
+            if not result.is_valid:
+                failed_rules = [type(rule).__name__ for rule in result.failed_rules]
+                message_text = "; ".join(rule.message for rule in result.failed_rules)
+                connection.error(message_text, rules=failed_rules)
+                continue
+            turn_number = journal.current_turn_number
+            journal.apply(move)
+            self.state.update_play_state()
+            self._broadcast(
+                dict(
+                    type="move",
+                    game=self.id,
+                    turn=turn_number,
+                    team=team.value,
+                    move=notation.format_move(move),
+                )
+            )
+            if move_timeout is not None:
+                deadline = loop.time() + move_timeout
+        return enums.EndReason.COMPLETE
+
+    def _finish(self, winner: enums.Team) -> None:
+        """
+        End the game early, with a winner.
+
+        :param winner: the winning Team
+        """
+        self.state.play_state = enums.PlayState.COMPLETE
+        self.state.winner = winner
+
+    def _broadcast(self, message: Message) -> None:
+        """
+        Write a message to both connections.
+
+        :param message: a JSON serializable Message
+        """
+        for connection in self.connections.values():
+            connection.send(message)
+
+
+class Server:
+    """
+    An asyncio game Server, hosting many concurrent games over TCP.
+
+    Clients send one JSON object per line: {"type": "join"} to be matched with the
+    next client that joins, then {"type": "move", "move": "C2-C3"} on their turns, or
+    {"type": "resign"}. The server answers {"type": "waiting"}, {"type": "start"} with
+    the game id and the team, a {"type": "move"} for every valid move of either
+    player, {"type": "end"} with the winner and the EndReason, and {"type": "error"}
+    for anything it rejects.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        move_timeout: Optional[float] = 60.0,
+        match_timeout: Optional[float] = None,
+        verifier: Optional[verifiers.Verifier] = None,
+    ):
+        """
+        Create a Server.
+
+        :param host: the host to listen on
+        :param port: the port to listen on, or 0 for any free port
+        :param move_timeout: the seconds a player has to move before losing, or None
+        :param match_timeout: the seconds a client waits for an opponent, or None
+        :param verifier: the Verifier of every Move, or None to use all rules
+        """
+        self.host = host
+        self.port = port
+        self.move_timeout = move_timeout
+        self.match_timeout = match_timeout
+        self.verifier = verifier or verifiers.Verifier(rules.all_rules())
+        self.results: Dict[enums.EndReason, int] = collections.Counter()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._session_ids = itertools.count(1)
+        self._sessions: Dict[Session, asyncio.Task] = {}
+        self._handlers: Set[asyncio.Task] = set()
+        self._waiting: Deque[Connection] = collections.deque()
+        self._match_timers: Dict[Connection, asyncio.TimerHandle] = {}
+
+    @property
+    def sessions(self) -> int:
+        """
+        Return the number of games in progress.
+
+        :return: the number of Sessions
+        """
+        return len(self._sessions)
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def shutdown(self) -> None:
+        """
+        Shut down gracefully.
+
+        New connections are refused, every game in progress ends with
+        EndReason.SHUTDOWN, and every connection is closed once its players have been
+        told.
+        """
+        if self._server is not None:
+            self._server.close()
+        for session in self._sessions:
+            session.inbox.put_nowait((None, None))
+        await asyncio.gather(*self._sessions.values())
+        for timer in self._match_timers.values():
+            timer.cancel()
+        for handler in list(self._handlers):
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Read the messages of a client until it disconnects.
+
+        :param reader: the stream to read from
+        :param writer: the stream to write to
+        """
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        connection = Connection(reader, writer)
+        try:
+            while True:
+                try:
+                    message = await connection.receive()
+                except ValueError as e:
+                    connection.error(f"Invalid message: {e}")
+                    continue
+                if message is None:
+                    break
+                if connection.session is not None:
+                    connection.session.inbox.put_nowait((connection.team, message))
+                elif message.get("type") == "join":
+                    self._join(connection)
+                else:
+                    connection.error("Join a game first")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if connection.session is not None:
+                connection.session.inbox.put_nowait((connection.team, None))
+            self._leave(connection)
+            self._handlers.discard(task)
+            await connection.close()
+
+    def _join(self, connection: Connection) -> None:
+        """
+        Match a connection with the longest waiting one, or make it wait.
+
+        :param connection: the joining Connection
+        """
+        if connection in self._waiting:
+            connection.error("Already waiting for an opponent")
+            return
+        while self._waiting:
+            opponent = self._waiting.popleft()
+            self._cancel_timer(opponent)
+            if opponent.writer.is_closing():
+                continue
+            session = Session(
+                next(self._session_ids),
+                (opponent, connection),
+                self.verifier,
+                self.move_timeout,
+            )
+            self._sessions[session] = asyncio.create_task(self._run(session))
+            return
+        self._waiting.append(connection)
+        if self.match_timeout is not None:
+            self._match_timers[connection] = asyncio.get_running_loop().call_later(
+                self.match_timeout, self._expire, connection
+            )
+        connection.send(dict(type="waiting"))
+
+    def _expire(self, connection: Connection) -> None:
+        """
+        Stop waiting for an opponent.
+
+        :param connection: the waiting Connection
+        """
+        self._leave(connection)
+        connection.error("No opponent found")
+
+    def _leave(self, connection: Connection) -> None:
+        """
+        Remove a connection from the matchmaking queue.
+
+        :param connection: a Connection
+        """
+        if connection in self._waiting:
+            self._waiting.remove(connection)
+            self._cancel_timer(connection)
+
+    def _cancel_timer(self, connection: Connection) -> None:
+        """
+        Cancel the matchmaking timeout of a connection, if it has one.
+
+        :param connection: a Connection
+        """
+        timer = self._match_timers.pop(connection, None)
+        if timer is not None:
+            timer.cancel()
+
+    async def _run(self, session: Session) -> None:
+        """
+        Run a session and forget it once it ends.
+
+        :param session: a Session
+        """
+        try:
+            reason = await session.run()
+            self.results[reason] += 1
+        finally:
+            del self._sessions[session]
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    move_timeout: Optional[float] = 60.0,
+    match_timeout: Optional[float] = None,
+) -> Server:
+    """
+    Run a Server until SIGINT or SIGTERM, then shut it down gracefully.
+
+    :param host: the host to listen on
+    :param port: the port to listen on
+    :param move_timeout: the seconds a player has to move before losing, or None
+    :param match_timeout: the seconds a client waits for an opponent, or None
+    :return: the stopped Server
+    """
+    server = Server(host, port, move_timeout, match_timeout)
+    await server.start()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signal_number, stop.set)
+        except NotImplementedError:  # pragma: no cover
+            pass
+    await stop.wait()
+    await server.shutdown()
+    return server
+
+
+@dataclass
+class LoadTestResult:
+    """The Result of a load test."""
+
+    games: int
+    moves: int
+    elapsed: float
+    latencies: List[float]
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.moves / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return a percentile of the move latencies.
+
+        :param percent: a percentage between 0 and 100
+        :return: the latency in seconds, or 0.0 if there were no moves
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[index]
+
+
+async def load_test(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    games_count: int = 100,
+    max_turns: int = 200,
+    seed: int = 0,
+) -> LoadTestResult:
+    """
+    Play many concurrent games of random moves against a Server.
+
+    Every game has two clients, which each keep a Journal of their game. A client
+    resigns once max_turns turns have been played. The latency of a move is the time
+    from sending it to receiving it back from the server.
+
+    :param host: the host of the Server
+    :param port: the port of the Server
+    :param games_count: the number of concurrent games
+    :param max_turns: the number of turns before a game is resigned
+    :param seed: the random seed of the first client
+    :return: a LoadTestResult
+    """
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _client(host, port, random.Random(seed + i), max_turns, latencies)
+            for i in range(games_count * 2)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    return LoadTestResult(games_count, len(latencies), elapsed, latencies)
+
+
+async def _client(
+    host: str, port: int, rng: random.Random, max_turns: int, latencies: List[float]
+) -> None:
+    """
+    Join a game and play random legal moves until it ends.
+
+    :param host: the host of the Server
+    :param port: the port of the Server
+    :param rng: the Random generator of the moves
+    :param max_turns: the number of turns before resigning
+    :param latencies: a list to append the latency of every own move to
+    :raise: RuntimeError if the server rejects a message
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    connection = Connection(reader, writer)
+    connection.send(dict(type="join"))
+    journal = journals.Journal(boards.Board())
+    team = None
+    sent = 0.0
+    try:
+        while True:
+            message = await connection.receive()
+            if message is None:
+                raise RuntimeError("Connection closed by the server")
+            kind = message["type"]
+            if kind == "error":
+                raise RuntimeError(message["message"])
+            if kind == "end":
+                return
+            if kind == "start":
+                team = enums.Team(message["team"])
+            elif kind == "move":
+                move = notation.parse_move(message["move"], enums.Team(message["team"]))
+                journal.apply(move)
+                if move.team == team:
+                    latencies.append(time.perf_counter() - sent)
+            else:
+                continue
+            turn_number = journal.current_turn_number
+            if journal.current_team != team:
+                continue
+            if search.winner(journal.current_board, turn_number)[0]:
+                continue
+            legal_moves = list(movegen.generate(journal))
+            if turn_number > max_turns or not legal_moves:
+                connection.send(dict(type="resign"))
+                continue
+            sent = time.perf_counter()
+            move = rng.choice(legal_moves)
+            connection.send(dict(type="move", move=notation.format_move(move)))
+    finally:
+        await connection.close()
@@ -0,0 +1,355 @@
+import array
+import collections
+import itertools
+import mmap
+import struct
+import sys
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+from . import boards, enums, geometry, movegen, moves
+
+MAGIC = b"SCTBASE\0"
+VERSION = 1
+
+#: magic, version, maximum pieces, entry count
+HEADER = struct.Struct("<8sHHxxxxQ")
+#: the Outcome in the low bits, the distance in plies in the high bits
+ENTRY = struct.Struct("<H")
+
+OUTCOME_BITS = 2
+OUTCOME_MASK = (1 << OUTCOME_BITS) - 1
+MAX_DISTANCE = (1 << (ENTRY.size * 8 - OUTCOME_BITS)) - 1
+
+#: The largest number of pieces a tablebase can be generated for, so that every
+#: position index fits in 32 bits.
+MAX_PIECES = 5
+
+
+class TablebaseError(ValueError):
+    """Raised when a tablebase file is invalid."""
+
+
+class Probe(NamedTuple):
+    """The Probed value of a position, for the team to move."""
+
+    outcome: enums.Outcome
+    distance: int
+
+
+def _binomials(n: int) -> List[List[int]]:
+    """
+    Build Pascal's triangle, padded with zeros.
+
+    :param n: the largest n
+    :return: a table where table[n][k] is n choose k, for every k up to n
+    """
+    table = [[1] + [0] * n]
+    for _ in range(n):
+        previous = table[-1]
+        table.append([1] + [previous[k - 1] + previous[k] for k in range(1, n + 1)])
+    return table
+
+
+_BINOMIALS = _binomials(geometry.SQUARES)
+
+#: The jumped square of every (src_square, dst_square) jump.
+_JUMPED = {
+    (src, dst): over
+    for src in range(geometry.SQUARES)
+    for over, dst in geometry.JUMPS[src]
+}
+
+
+def offsets(max_pieces: int) -> Tuple[int, ...]:
+    """
+    Return the first index of the positions with each number of pieces.
+
+    :param max_pieces: the largest number of pieces
+    :return: max_pieces + 2 offsets, where the last one is the number of positions
+    """
+    result = [0]
+    for pieces in range(max_pieces + 1):
+        result.append(result[-1] + (_BINOMIALS[geometry.SQUARES][pieces] << pieces + 1))
+    return tuple(result)
+
+
+def index(
+    mask_1: int, mask_2: int, team_bit: int, position_offsets: Tuple[int, ...]
+) -> int:
+    """
+    Return the perfect hash of a position.
+
+    Positions are grouped by their number of pieces. Within a group, the set of
+    occupied squares is ranked in the combinatorial number system, then each piece
+    adds one bit for its team, and the team to move adds the lowest bit.
+
+    :param mask_1: the occupancy mask of Team.ONE
+    :param mask_2: the occupancy mask of Team.TWO
+    :param team_bit: 0 if Team.ONE moves, 1 if Team.TWO moves
+    :param position_offsets: the result of offsets
+    :return: an index, or -1 if there are too many pieces
+    """
+    max_pieces = len(position_offsets) - 2
+    occupied = mask_1 | mask_2
+    rank = teams = pieces = 0
+    while occupied:
+        bit = occupied & -occupied
+        occupied ^= bit
+        if pieces == max_pieces:
+            return -1
+        if mask_2 & bit:
+            teams |= 1 << pieces
+        pieces += 1
+        rank += _BINOMIALS[bit.bit_length() - 1][pieces]
+    return position_offsets[pieces] + ((rank << pieces | teams) << 1 | team_bit)
+
+
+def _play(code: int, mask_1: int, mask_2: int) -> Tuple[int, int]:
+    """
+    Apply a packed legal Move to a pair of occupancy masks.
+
+    :param code: a packed Move, see moves.encode
+    :param mask_1: the occupancy mask of Team.ONE
+    :param mask_2: the occupancy mask of Team.TWO
+    :return: the (mask_1, mask_2) after the Move
+    """
+    square_mask = (1 << moves.SQUARE_BITS) - 1
+    team_bit = code & 1
+    mine, theirs = (mask_2, mask_1) if team_bit else (mask_1, mask_2)
+    count = code >> 1 & moves.MAX_LOCATIONS
+    code >>= moves.HEADER_BITS
+    src = code & square_mask
+    mine ^= 1 << src
+    for _ in range(count - 1):
+        code >>= moves.SQUARE_BITS
+        dst = code & square_mask
+        over = _JUMPED.get((src, dst))
+        if over is not None:
+            theirs &= ~(1 << over)
+        src = dst
+    mine |= 1 << src
+    return (theirs, mine) if team_bit else (mine, theirs)
+
+
+def _terminal(mask_1: int, mask_2: int, team_bit: int) -> Optional[enums.Outcome]:
+    """
+    Return the Outcome of a position where the game is over.
+
+    :param mask_1: the occupancy mask of Team.ONE
+    :param mask_2: the occupancy mask of Team.TWO
+    :param team_bit: 0 if Team.ONE moves, 1 if Team.TWO moves
+    :return: the Outcome for the team to move, or None if the game is not over
+    """
+    in_court_1 = bool(mask_1 & boards.MIDDLE_MASK)
+    in_court_2 = bool(mask_2 & boards.MIDDLE_MASK)
+    if in_court_1 and in_court_2:
+        return None
+    if in_court_1 == in_court_2:
+        return enums.Outcome.DRAW
+    return enums.Outcome.WIN if in_court_2 == bool(team_bit) else enums.Outcome.LOSS
+
+
+def generate(path: str, max_pieces: int = 3) -> int:
+    """
+    Solve every position with up to max_pieces pieces, and write a tablebase file.
+
+    Positions are solved by retrograde analysis after the opening, i.e. the game is
+    over when fewer than two teams have pieces in the middle. The successors of every
+    position are generated once, the positions where the game is over are resolved
+    first, and each resolved position then resolves its predecessors in breadth
+    first order: a position is won in d + 1 plies if a successor is lost in d plies,
+    and lost in d + 1 plies once every successor is won, the last one in d plies.
+    A position where the team to move has no legal moves is lost in 0 plies, as in
+    search and mcts. Positions that are never resolved are draws, with distance 0.
+
+    The work grows with 2 ** max_pieces * (64 choose max_pieces): 3 pieces take a
+    few seconds, and each extra piece takes about 30 times longer.
+
+    :param path: the tablebase file path
+    :param max_pieces: the largest number of pieces on the board, up to MAX_PIECES
+    :return: the number of positions
+    :raise: ValueError if max_pieces is not supported
+    """
+    if not 1 <= max_pieces <= MAX_PIECES:
+        raise ValueError(f"Invalid number of pieces: {max_pieces!r}")
+    position_offsets = offsets(max_pieces)
+    size = position_offsets[-1]
+    values = array.array("H", bytes(size * ENTRY.size))
+    resolved = bytearray(size)
+    remaining = array.array("H", bytes(size * ENTRY.size))
+    parents = array.array("I")
+    children = array.array("I")
+
+    for pieces in range(max_pieces + 1):
+        for squares in itertools.combinations(range(geometry.SQUARES), pieces):
+            bits = [1 << square for square in squares]
+            occupied = sum(bits)
+            for teams in range(1 << pieces):
+                mask_2 = sum(bit for i, bit in enumerate(bits) if teams >> i & 1)
+                mask_1 = occupied ^ mask_2
+                for team_bit, team in enumerate(boards.Board.TEAMS):
+                    parent = index(mask_1, mask_2, team_bit, position_offsets)
+                    outcome = _terminal(mask_1, mask_2, team_bit)
+                    if outcome is not None:
+                        values[parent] = outcome
+                        resolved[parent] = 1
+                        continue
+                    board = boards.Board.from_masks(mask_1, mask_2)
+                    for code in movegen.generate_codes(board, team, opening=False):
+                        child_1, child_2 = _play(code, mask_1, mask_2)
+                        parents.append(parent)
+                        children.append(
+                            index(child_1, child_2, team_bit ^ 1, position_offsets)
+                        )
+                        remaining[parent] += 1
+                    if not remaining[parent]:
+                        values[parent] = enums.Outcome.LOSS
+                        resolved[parent] = 1
+
+    # Group the parents of each child together, with a counting sort.
+    starts = array.array("Q", bytes((size + 1) * 8))
+    for child in children:
+        starts[child + 1] += 1
+    for i in range(size):
+        starts[i + 1] += starts[i]
+    cursor = array.array("I", starts)
+    predecessors = array.array("I", bytes(len(parents) * 4))
+    for parent, child in zip(parents, children):
+        predecessors[cursor[child]] = parent
+        cursor[child] += 1
+    del parents, children, cursor
+
+    queue: Deque[int] = collections.deque(
+        i for i in range(size) if resolved[i] and starts[i] != starts[i + 1]
+    )
+    while queue:
+        child = queue.popleft()
+        child_outcome = values[child] & OUTCOME_MASK
+        distance = min((values[child] >> OUTCOME_BITS) + 1, MAX_DISTANCE)
+        for i in range(starts[child], starts[child + 1]):
+            parent = predecessors[i]
+            if resolved[parent]:
+                continue
+            if child_outcome == enums.Outcome.LOSS:
+                values[parent] = enums.Outcome.WIN | distance << OUTCOME_BITS
+            elif child_outcome == enums.Outcome.WIN:
+                remaining[parent] -= 1
+                if remaining[parent]:
+                    continue
+                values[parent] = enums.Outcome.LOSS | distance << OUTCOME_BITS
+            else:
+                continue
+            resolved[parent] = 1
+            queue.append(parent)
+
+    if sys.byteorder != "little":
+        values.byteswap()
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, max_pieces, size))
+        values.tofile(file)
+    return size
+
+
+class Tablebase:
+    """
+    A reader of a tablebase file.
+
+    The file is memory mapped, so a probe reads a single entry at the perfect hash
+    of the position, regardless of the size of the tablebase.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a tablebase file for reading.
+
+        :param path: the tablebase file path
+        :raise: TablebaseError if the file is not a valid tablebase
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise TablebaseError("Truncated tablebase header")
+            magic, version, self.max_pieces, size = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise TablebaseError("Not a tablebase file")
+            if version != VERSION:
+                raise TablebaseError(f"Unsupported tablebase version: {version}")
+            self._offsets = offsets(self.max_pieces)
+            if size != self._offsets[-1]:
+                raise TablebaseError("Invalid tablebase size")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if HEADER.size + size * ENTRY.size > len(self._mmap):
+            self.close()
+            raise TablebaseError("Truncated tablebase")
+
+    def probe(self, board: boards.Board, team: enums.Team) -> Optional[Probe]:
+        """
+        Look up the value of a position after the opening.
+
+        :param board: a Board
+        :param team: the Team to move
+        :return: a Probe for the team, or None if there are too many pieces
+        """
+        mask_1, mask_2 = board.masks
+        return self._probe(mask_1, mask_2, boards.Board.TEAMS.index(team))
+
+    def _probe(self, mask_1: int, mask_2: int, team_bit: int) -> Optional[Probe]:
+        """
+        Look up the value of a position given as occupancy masks.
+
+        :param mask_1: the occupancy mask of Team.ONE
+        :param mask_2: the occupancy mask of Team.TWO
+        :param team_bit: 0 if Team.ONE moves, 1 if Team.TWO moves
+        :return: a Probe for the team, or None if there are too many pieces
+        """
+        i = index(mask_1, mask_2, team_bit, self._offsets)
+        if i < 0:
+            return None
+        (value,) = ENTRY.unpack_from(self._mmap, HEADER.size + i * ENTRY.size)
+        return Probe(enums.Outcome(value & OUTCOME_MASK), value >> OUTCOME_BITS)
+
+    def best_move(self, board: boards.Board, team: enums.Team) -> Optional[moves.Move]:
+        """
+        Find the Move with the best value after the opening.
+
+        A win is played in as few plies as possible, and a loss is delayed as long as
+        possible.
+
+        :param board: a Board
+        :param team: the Team to move
+        :return: the best Move, or None if there are too many pieces or no moves
+        """
+        mask_1, mask_2 = board.masks
+        team_bit = boards.Board.TEAMS.index(team)
+        if index(mask_1, mask_2, team_bit, self._offsets) < 0:
+            return None
+        best_code, best_score = None, None
+        for code in movegen.generate_codes(board, team, opening=False):
+            probe = self._probe(*_play(code, mask_1, mask_2), team_bit ^ 1)
+            assert probe is not None
+            if probe.outcome == enums.Outcome.LOSS:
+                score = MAX_DISTANCE - probe.distance
+            elif probe.outcome == enums.Outcome.WIN:
+                score = probe.distance - 2 * MAX_DISTANCE
+            else:
+                score = -MAX_DISTANCE
+            if best_score is None or score > best_score:
+                best_code, best_score = code, score
+        return None if best_code is None else moves.decode(best_code)
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __reduce__(self):
+        return Tablebase, (self.path,)
+
+    def close(self) -> None:
+        """Close the memory map of the file."""
+        self._mmap.close()
+
+    def __enter__(self) -> "Tablebase":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,498 @@
+import concurrent.futures
+import functools
+import inspect
+import itertools
+import math
+import os
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from . import enums, games, players, selfplay
+
+#: A picklable callable that creates a Player for a team, e.g.
+#: functools.partial(players.EnginePlayer, max_depth=2).
+PlayerFactory = Callable[[enums.Team], players.Player]
+
+#: The Player class and its default keyword arguments of each player kind.
+PLAYER_KINDS: Dict[str, Tuple[type, Dict[str, object]]] = {
+    "engine": (players.EnginePlayer, {}),
+    "montecarlo": (players.MonteCarloPlayer, {"workers": 0}),
+}
+
+#: The two-sided 95% quantile of the normal distribution.
+Z_95 = 1.959964
+
+
+class Pairing(NamedTuple):
+    """A scheduled game between two named players."""
+
+    game: int
+    player_1: str
+    player_2: str
+    seed: int
+
+
+class EloEstimate(NamedTuple):
+    """An Elo difference with the bounds of its confidence interval."""
+
+    elo: float
+    lower: float
+    upper: float
+
+
+@dataclass
+class SPRT:
+    """
+    A sequential probability ratio test of the Elo difference of the first player.
+
+    H0 is that the difference is elo0 and H1 that it is elo1. The log-likelihood
+    ratio uses the normal approximation of the game scores.
+    """
+
+    elo0: float = 0.0
+    elo1: float = 5.0
+    alpha: float = 0.05
+    beta: float = 0.05
+
+    @property
+    def bounds(self) -> Tuple[float, float]:
+        """
+        Return the log-likelihood ratios that accept H0 and H1.
+
+        :return: a (lower, upper) tuple
+        """
+        return (
+            math.log(self.beta / (1 - self.alpha)),
+            math.log((1 - self.beta) / self.alpha),
+        )
+
+    def llr(self, wins: int, draws: int, losses: int) -> float:
+        """
+        Return the log-likelihood ratio of H1 against H0.
+
+        :param wins: the number of games won
+        :param draws: the number of games drawn
+        :param losses: the number of games lost
+        :return: a log-likelihood ratio, 0 while the scores do not vary
+        """
+        count = wins + draws + losses
+        if not count:
+            return 0.0
+        score, variance = _score_variance(wins, draws, losses)
+        if not variance:
+            return 0.0
+        score_0, score_1 = expected_score(self.elo0), expected_score(self.elo1)
+        return (
+            count * (score_1 - score_0) * (2 * score - score_0 - score_1) / variance / 2
+        )
+
+    def decide(self, wins: int, draws: int, losses: int) -> Optional[enums.Hypothesis]:
+        """
+        Decide the test, if the log-likelihood ratio has crossed a bound.
+
+        :param wins: the number of games won
+        :param draws: the number of games drawn
+        :param losses: the number of games lost
+        :return: the accepted Hypothesis, or None to keep playing
+        """
+        lower, upper = self.bounds
+        llr = self.llr(wins, draws, losses)
+        if llr <= lower:
+            return enums.Hypothesis.H0
+        if llr >= upper:
+            return enums.Hypothesis.H1
+        return None
+
+
+@dataclass
+class Standings:
+    """The wins, draws and losses of every player against every other player."""
+
+    names: List[str]
+    results: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)
+
+    def record(self, pairing: Pairing, score: float) -> None:
+        """
+        Record the result of a game.
+
+        :param pairing: the Pairing of the game
+        :param score: 1 if player_1 won, 0.5 for a draw, 0 if player_2 won
+        """
+        column = {1.0: 0, 0.5: 1, 0.0: 2}[score]
+        first = self.results.setdefault((pairing.player_1, pairing.player_2), [0, 0, 0])
+        second = self.results.setdefault(
+            (pairing.player_2, pairing.player_1), [0, 0, 0]
+        )
+        first[column] += 1
+        second[2 - column] += 1
+
+    def totals(self, name: str) -> Tuple[int, int, int]:
+        """
+        Return the wins, draws and losses of a player against all opponents.
+
+        :param name: the name of a player
+        :return: a (wins, draws, losses) tuple
+        """
+        wins, draws, losses = 0, 0, 0
+        for (player, _), (win, draw, loss) in self.results.items():
+            if player == name:
+                wins, draws, losses = wins + win, draws + draw, losses + loss
+        return wins, draws, losses
+
+    @property
+    def games(self) -> int:
+        """
+        Return the number of games recorded.
+
+        :return: a number of games
+        """
+        return sum(sum(result) for result in self.results.values()) // 2
+
+    def elo(self, name: str, z: float = Z_95) -> EloEstimate:
+        """
+        Estimate the Elo difference of a player against the average of its opponents.
+
+        :param name: the name of a player
+        :param z: the normal quantile of the confidence interval, e.g. Z_95 for 95%
+        :return: an EloEstimate, with infinite bounds for a perfect score
+        """
+        wins, draws, losses = self.totals(name)
+        count = wins + draws + losses
+        if not count:
+            return EloEstimate(0.0, -math.inf, math.inf)
+        score, variance = _score_variance(wins, draws, losses)
+        margin = z * math.sqrt(variance / count)
+        return EloEstimate(
+            elo_difference(score),
+            elo_difference(score - margin),
+            elo_difference(score + margin),
+        )
+
+    def report(self) -> str:
+        """
+        Format the Elo table and the win/draw/loss matrix.
+
+        :return: a multi-line string
+        """
+        width = max(len(name) for name in ["player", *self.names]) + 2
+        lines = [f"{'player':<{width}} {'elo':>7} {'95% ci':>17} {'w-d-l':>14}"]
+        for name in sorted(self.names, key=lambda name: -self.elo(name).elo):
+            elo = self.elo(name)
+            interval = f"[{elo.lower:+.0f}, {elo.upper:+.0f}]"
+            wins, draws, losses = self.totals(name)
+            lines.append(
+                f"{name:<{width}} {elo.elo:>+7.0f} {interval:>17} "
+                f"{f'{wins}-{draws}-{losses}':>14}"
+            )
+        cells = {
+            pair: "-".join(map(str, result)) for pair, result in self.results.items()
+        }
+        width = max([width - 2, *map(len, cells.values())]) + 2
+        lines.append("")
+        lines.append(" " * width + "".join(f"{name:>{width}}" for name in self.names))
+        for name in self.names:
+            row = (cells.get((name, opponent), "") for opponent in self.names)
+            line = f"{name:<{width}}" + "".join(f"{cell:>{width}}" for cell in row)
+            lines.append(line.rstrip())
+        return "\n".join(lines)
+
+
+@dataclass
+class TournamentResult:
+    """The Result of a tournament."""
+
+    standings: Standings
+    hypothesis: Optional[enums.Hypothesis] = None
+    llr: Optional[float] = None
+
+
+def expected_score(elo: float) -> float:
+    """
+    Return the expected score of a player that is elo points stronger.
+
+    :param elo: an Elo difference
+    :return: a score between 0 and 1
+    """
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def elo_difference(score: float) -> float:
+    """
+    Return the Elo difference that gives an expected score.
+
+    :param score: a score between 0 and 1
+    :return: an Elo difference, infinite for a score of 0 or 1
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return 400 * math.log10(score / (1 - score))
+
+
+def _score_variance(wins: int, draws: int, losses: int) -> Tuple[float, float]:
+    """
+    Return the mean and the variance of the scores of some games.
+
+    :param wins: the number of games won
+    :param draws: the number of games drawn
+    :param losses: the number of games lost
+    :return: a (mean, variance) tuple
+    """
+    count = wins + draws + losses
+    score = (wins + draws / 2) / count
+    variance = (
+        wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score**2
+    ) / count
+    return score, variance
+
+
+def parse_player(spec: str) -> Tuple[str, PlayerFactory]:
+    """
+    Parse a player specification such as "deep=engine:max_depth=4,node_limit=5000".
+
+    :param spec: a NAME=KIND[:KEY=VALUE,...] string, where KIND is in PLAYER_KINDS
+    :return: a (name, PlayerFactory) tuple
+    :raise: ValueError if the specification is invalid
+    """
+    name, _, rest = spec.partition("=")
+    kind, _, options = rest.partition(":")
+    if not name or kind not in PLAYER_KINDS:
+        raise ValueError(f"Invalid player: {spec!r}")
+    player_class, defaults = PLAYER_KINDS[kind]
+    kwargs = dict(defaults)
+    for option in filter(None, options.split(",")):
+        key, _, value = option.partition("=")
+        kwargs[key] = _parse_number(value, spec)
+    try:
+        inspect.signature(player_class).bind(enums.Team.ONE, **kwargs)
+    except TypeError:
+        raise ValueError(f"Invalid player: {spec!r}")
+    return name, functools.partial(player_class, **kwargs)
+
+
+def _parse_number(value: str, spec: str) -> float:
+    """
+    Parse an integer or a float option value.
+
+    :param value: the option value
+    :param spec: the player specification, for the error message
+    :return: an int or a float
+    :raise: ValueError if the value is not a number
+    """
+    for number_type in (int, float):
+        try:
+            return number_type(value)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid player: {spec!r}")
+
+
+def schedule(
+    names: List[str],
+    rounds: int = 1,
+    kind: enums.Schedule = enums.Schedule.ROUND_ROBIN,
+    seed: int = 0,
+) -> Iterator[Pairing]:
+    """
+    Schedule the games of a tournament with balanced colors.
+
+    Every round, each pair of players plays two games with the same random seed, one
+    with each player as Team.ONE. A round robin pairs every player with every other
+    player, and a gauntlet pairs the first player with every other player.
+
+    :param names: the names of the players
+    :param rounds: the number of rounds
+    :param kind: a Schedule
+    :param seed: the random seed of the first pair of games
+    :return: an Iterator of Pairings, in playing order
+    """
+    if kind == enums.Schedule.GAUNTLET:
+        pairs = [(names[0], name) for name in names[1:]]
+    else:
+        pairs = list(itertools.combinations(names, 2))
+    game = 0
+    for round_id in range(rounds):
+        for pair_id, (first, second) in enumerate(pairs):
+            game_seed = seed + round_id * len(pairs) + pair_id
+            yield Pairing(game, first, second, game_seed)
+            yield Pairing(game + 1, second, first, game_seed)
+            game += 2
+
+
+def score(record: games.GameRecord) -> float:
+    """
+    Return the score of Team.ONE in a game.
+
+    A game that was not finished is a draw, and a game that ended in an error is lost
+    by the team that was to move.
+
+    :param record: a GameRecord
+    :return: 1 for a win, 0.5 for a draw, 0 for a loss
+    """
+    if record.play_state == enums.PlayState.ERROR:
+        return 0.0 if len(record.moves) % 2 == 0 else 1.0
+    if record.play_state != enums.PlayState.COMPLETE or record.winner is None:
+        return 0.5
+    return 1.0 if record.winner == enums.Team.ONE else 0.0
+
+
+_worker_args: Dict[str, object] = {}
+
+
+def _init_worker(
+    factories: Dict[str, PlayerFactory], max_turns: int, random_turns: int
+) -> None:
+    """
+    Store the player factories and the game settings once per worker process.
+
+    :param factories: the PlayerFactory of each player name
+    :param max_turns: the maximum number of turns to play
+    :param random_turns: the number of turns to play randomly
+    """
+    _worker_args.update(
+        factories=factories, max_turns=max_turns, random_turns=random_turns
+    )
+
+
+def _play_worker_game(pairing: Pairing) -> Tuple[Pairing, games.GameRecord]:
+    """
+    Play a scheduled game with new players from the factories of this worker process.
+
+    The players are closed after the game, so Monte Carlo playout processes do not
+    pile up over a tournament.
+
+    :param pairing: a Pairing
+    :return: a (Pairing, GameRecord) tuple
+    """
+    factories: Dict[str, PlayerFactory] = _worker_args["factories"]  # type: ignore
+    player_1 = factories[pairing.player_1](enums.Team.ONE)
+    player_2 = factories[pairing.player_2](enums.Team.TWO)
+    try:
+        record = selfplay.play_game(
+            player_1,
+            player_2,
+            seed=pairing.seed,
+            max_turns=_worker_args["max_turns"],  # type: ignore
+            random_turns=_worker_args["random_turns"],  # type: ignore
+        )
+    finally:
+        for player in (player_1, player_2):
+            if isinstance(player, players.MonteCarloPlayer):
+                player.close()
+    return pairing, record
+
+
+def _play(
+    factories: Dict[str, PlayerFactory],
+    pairings: Iterable[Pairing],
+    workers: int,
+    max_turns: int,
+    random_turns: int,
+) -> Generator[Tuple[Pairing, games.GameRecord], None, None]:
+    """
+    Play scheduled games, yielding each game as soon as it finishes.
+
+    Closing the iterator cancels the games that have not started.
+
+    :param factories: the PlayerFactory of each player name
+    :param pairings: the Pairings to play
+    :param workers: the number of worker processes, or 0 to play in this process
+    :param max_turns: the maximum number of turns per game
+    :param random_turns: the number of turns per game to play randomly
+    :return: an Iterator of (Pairing, GameRecord) tuples
+    """
+    if not workers:
+        _init_worker(factories, max_turns, random_turns)
+        for pairing in pairings:
+            yield _play_worker_game(pairing)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(factories, max_turns, random_turns),
+    ) as executor:
+        pending: Set[concurrent.futures.Future] = set()
+        iterator = iter(pairings)
+        try:
+            for pairing in itertools.islice(iterator, workers * 2):
+                pending.add(executor.submit(_play_worker_game, pairing))
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for pairing in itertools.islice(iterator, len(done)):
+                    pending.add(executor.submit(_play_worker_game, pairing))
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def run(
+    factories: Dict[str, PlayerFactory],
+    rounds: int = 1,
+    kind: enums.Schedule = enums.Schedule.ROUND_ROBIN,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    max_turns: int = 500,
+    random_turns: int = 4,
+    sprt: Optional[SPRT] = None,
+    sink: Optional[Callable[[Pairing, games.GameRecord], None]] = None,
+) -> TournamentResult:
+    """
+    Play a tournament and estimate the Elo of every player.
+
+    Games are played concurrently in a process pool, where each worker receives the
+    factories once and creates new players for every game, so the factories must be
+    picklable. With an SPRT, the scheduled rounds are an upper bound, and the
+    tournament stops as soon as the test of the first player against the others is
+    decided.
+
+    :param factories: the PlayerFactory of each player name, at least two
+    :param rounds: the number of rounds
+    :param kind: a Schedule
+    :param workers: the number of worker processes, 0 for none, None for one per CPU
+    :param seed: the random seed of the first pair of games
+    :param max_turns: the maximum number of turns per game, after which it is a draw
+    :param random_turns: the number of turns per game to play randomly
+    :param sprt: an optional SPRT to stop early
+    :param sink: an optional callable receiving each (Pairing, GameRecord)
+    :return: a TournamentResult
+    :raise: ValueError if there are fewer than two players
+    """
+    names = list(factories)
+    if len(names) < 2:
+        raise ValueError(f"Invalid number of players: {len(names)!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    result = TournamentResult(Standings(names))
+    pairings = schedule(names, rounds, kind, seed)
+    played = _play(factories, pairings, workers, max_turns, random_turns)
+    try:
+        for pairing, record in played:
+            result.standings.record(pairing, score(record))
+            if sink is not None:
+                sink(pairing, record)
+            if sprt is not None:
+                totals = result.standings.totals(names[0])
+                result.llr = sprt.llr(*totals)
+                result.hypothesis = sprt.decide(*totals)
+                if result.hypothesis is not None:
+                    break
+    finally:
+        played.close()
+    return result
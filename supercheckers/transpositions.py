@@ -0,0 +1,122 @@
+from typing import List, NamedTuple, Optional
+
+from . import enums
+
+
+class Entry(NamedTuple):
+    """A TranspositionTable Entry for a single position."""
+
+    key: int
+    depth: int
+    value: float
+    bound: enums.Bound = enums.Bound.EXACT
+    move: Optional[int] = None
+    generation: int = 0
+
+
+class TranspositionTable:
+    """
+    A fixed-size table of search results, keyed by position hash.
+
+    Each key maps to a single slot. When two positions map to the same slot, the
+    replacement policy decides which one is kept:
+
+    * Replacement.ALWAYS keeps the newest entry.
+    * Replacement.DEPTH_PREFERRED keeps the deeper entry, unless the stored entry is
+      for the same position or is left over from a previous search.
+    """
+
+    def __init__(
+        self,
+        size: int = 1 << 16,
+        policy: enums.Replacement = enums.Replacement.DEPTH_PREFERRED,
+    ):
+        """
+        Create a transposition table.
+
+        :param size: the number of slots, which must be a power of two
+        :param policy: a Replacement policy
+        :raise: ValueError if size is not a power of two
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Invalid size: {size!r}")
+        self.size = size
+        self.policy = policy
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._slots: List[Optional[Entry]] = [None] * size
+
+    def probe(self, key: int) -> Optional[Entry]:
+        """
+        Look up the Entry for a position.
+
+        :param key: a position hash
+        :return: the stored Entry, or None if the position is not stored
+        """
+        entry = self._slots[key & (self.size - 1)]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        value: float,
+        bound: enums.Bound = enums.Bound.EXACT,
+        move: Optional[int] = None,
+    ) -> bool:
+        """
+        Store the search result for a position, subject to the replacement policy.
+
+        :param key: a position hash
+        :param depth: the depth the position was searched to
+        :param value: the value of the position
+        :param bound: whether the value is exact, a lower bound or an upper bound
+        :param move: the best Move found, packed with moves.encode, if any
+        :return: True if the result was stored
+        """
+        index = key & (self.size - 1)
+        current = self._slots[index]
+        if (
+            current is not None
+            and self.policy == enums.Replacement.DEPTH_PREFERRED
+            and current.key != key
+            and current.generation == self.generation
+            and current.depth > depth
+        ):
+            return False
+        self._slots[index] = Entry(key, depth, value, bound, move, self.generation)
+        return True
+
+    def new_search(self) -> None:
+        """Mark every stored Entry as left over from a previous search."""
+        self.generation += 1
+
+    def clear(self) -> None:
+        """Remove every stored Entry and reset the counters."""
+        self._slots = [None] * self.size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the fraction of probes that found a stored Entry.
+
+        :return: a number between 0 and 1
+        """
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def __len__(self) -> int:
+        """
+        Return the number of stored Entries.
+
+        :return: the number of occupied slots
+        """
+        return sum(1 for entry in self._slots if entry is not None)
@@ -1,16 +1,8 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Tuple
 
-from . import enums
+from . import geometry
 
-
-@dataclass(frozen=True)
-class Description:
-    """A Description of two locations."""
-
-    direction: enums.Direction
-    move_type: enums.MoveType
-    jmp_loc: Optional[Tuple[int, int]]
+Description = geometry.Description
 
 
 def compare(src_loc: Tuple[int, int], dst_loc: Tuple[int, int]) -> Description:
@@ -21,64 +13,53 @@ def compare(src_loc: Tuple[int, int], dst_loc: Tuple[int, int]) -> Description:
     If they are separated by a slide or a jump, then the result will have a move type.
     If they are a jump apart, then the result will have a jumped location.
 
+    Locations on the default board are looked up in a precomputed table, see
+    geometry.Geometry.compare for other board sizes.
+
     :param src_loc: a (row_id, col_id) source location
     :param dst_loc: a (row_id, col_id) destination location
     :return: a Description of the locations
     """
-    src_row, src_col = src_loc
-    dst_row, dst_col = dst_loc
-    horizontal = src_row == dst_row
-    vertical = src_col == dst_col
-    if horizontal == vertical:
-        return Description(enums.Direction.UNKNOWN, enums.MoveType.UNKNOWN, None)
-    if horizontal:
-        if src_col < dst_col:
-            direction = enums.Direction.EAST
-        else:
-            direction = enums.Direction.WEST
-        distance = dst_col - src_col
-        jmp_loc = (src_row, src_col + (distance // 2)) if abs(distance) == 2 else None
-    else:
-        if src_row < dst_row:
-            direction = enums.Direction.NORTH
-        else:
-            direction = enums.Direction.SOUTH
-        distance = dst_row - src_row
-        jmp_loc = (src_row + (distance // 2), src_col) if abs(distance) == 2 else None
-    move_type = enums.MoveType.from_distance(abs(distance))
-    return Description(direction, move_type, jmp_loc)
+    return geometry.DEFAULT.compare(src_loc, dst_loc)
 
 
 def in_middle(location: Tuple[int, int]) -> bool:
     """
-    Determine if a location is in the middle of the Board.
+    Determine if a location is in the middle of the default Board.
 
     :param location: a (row_id, col_id) location
     :return: True if the location is in the middle of the Board
     """
-    row_id, col_id = location
-    return (1 < row_id < 6) and (1 < col_id < 6)
+    return geometry.DEFAULT.in_middle(location)
 
 
 def to_int(value: str) -> int:
     """
-    Convert a single character to an integer, where A equals 0.
+    Convert a column name to an integer, where A equals 0, Z equals 25 and AA equals 26.
 
     Note: This method is case insensitive.
 
-    :param value: a character
+    :param value: one or more letters
     :return: an integer representation
     """
-    return ord(value.upper()) - ord("A")
+    result = 0
+    for char in value.upper():
+        result = result * 26 + ord(char) - ord("A") + 1
+    return result - 1
 
 
 def to_char(value: int) -> str:
     """
-    Convert an integer to a single character, where 0 equals A.
+    Convert an integer to a column name, where 0 equals A, 25 equals Z and 26 equals AA.
 
-    Note: This method will return an uppercase character.
+    Note: This method will return uppercase characters.
 
-    :param value: an integer
-    :return: a character representation
+    :param value: a non-negative integer
+    :return: a column name
     """
-    return chr(ord("A") + value)
+    result = ""
+    value += 1
+    while value:
+        value, remainder = divmod(value - 1, 26)
+        result = chr(ord("A") + remainder) + result
+    return result
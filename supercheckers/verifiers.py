@@ -1,7 +1,8 @@
+import time
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, List, Optional
 
-from . import journals, moves, rules
+from . import journals, metrics, moves, rules
 
 
 @dataclass
@@ -18,25 +19,70 @@ class Result:
 class Verifier:
     """A Move Verifier."""
 
-    def __init__(self, all_rules: Iterable[rules.Rule]):
+    def __init__(
+        self,
+        all_rules: Iterable[rules.Rule],
+        metrics: Optional[metrics.Metrics] = None,
+    ):
         """
         Create a Move Verifier with an Iterable of Rules.
 
         :param all_rules: the Rules that will be checked.
+        :param metrics: optional Metrics to record every rule check
         """
         assert all_rules
         self.all_rules = all_rules
+        self.metrics = metrics
+        self._rules_by_cost = sorted(all_rules, key=lambda rule: rule.cost)
 
-    def verify(self, journal: journals.Journal, move: moves.Move) -> Result:
+    def verify(
+        self, journal: journals.Journal, move: moves.Move, fail_fast: bool = False
+    ) -> Result:
         """
         Given a Journal, verify a Move against all rules.
 
+        All rules share a single verification Context. If fail_fast is True, rules are
+        checked from cheapest to most expensive and verification stops at the first
+        failed rule, so the Result contains at most one failed rule.
+
         :param journal: a Game Journal
         :param move: a Move to validate
+        :param fail_fast: True to stop at the first failed rule
         :return: a Result, containing failed_rules
         """
+        context = rules.Context(journal, move)
+        if self.metrics is not None:
+            return self._verify_instrumented(context, fail_fast, self.metrics)
+        if fail_fast:
+            for rule in self._rules_by_cost:
+                if not rule.check(context):
+                    return Result([rule])
+            return Result([])
         failed_rules = []
         for rule in self.all_rules:
-            if not rule.is_valid(journal, move):
+            if not rule.check(context):
+                failed_rules.append(rule)
+        return Result(failed_rules)
+
+    def _verify_instrumented(
+        self, context: rules.Context, fail_fast: bool, recorder: metrics.Metrics
+    ) -> Result:
+        """
+        Verify a Move like verify, timing and counting every rule check.
+
+        :param context: the verification Context
+        :param fail_fast: True to stop at the first failed rule
+        :param recorder: the Metrics to record into
+        :return: a Result, containing failed_rules
+        """
+        failed_rules: List[rules.Rule] = []
+        for rule in self._rules_by_cost if fail_fast else self.all_rules:
+            start = time.perf_counter()
+            passed = rule.check(context)
+            seconds = time.perf_counter() - start
+            recorder.record_rule(type(rule).__name__, seconds, passed)
+            if not passed:
                 failed_rules.append(rule)
+                if fail_fast:
+                    break
         return Result(failed_rules)
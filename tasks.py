@@ -1,7 +1,10 @@
+import os
+
 import invoke
 
 PACKAGE = "supercheckers"
 REQUIRED_COVERAGE = 50
+BENCH_BASELINE = "benchmarks/baseline.json"
 
 
 @invoke.task
@@ -44,6 +47,37 @@ def test(ctx):
     ctx.run(f"pytest --cov={PACKAGE} --cov-fail-under={REQUIRED_COVERAGE}", echo=True)
 
 
+@invoke.task(iterable=["name"])
+def bench(
+    ctx,
+    name=None,
+    output="bench.json",
+    baseline=BENCH_BASELINE,
+    save_baseline=False,
+    threshold=0.2,
+    repeat=5,
+):
+    """Run benchmarks, save them as JSON and flag regressions against a baseline."""
+    from supercheckers import benchmarks
+
+    results = benchmarks.run(name or None, repeat=repeat)
+    benchmarks.save(results, output)
+    previous = benchmarks.load(baseline) if os.path.exists(baseline) else None
+    print(benchmarks.report(results, previous))
+    if save_baseline:
+        benchmarks.save(results, baseline)
+        print(f"Saved the baseline to {baseline}")
+    else:
+        regressions = benchmarks.compare(results, previous or {}, float(threshold))
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.name} {regression.metric}: "
+                f"{regression.baseline:.4g} -> {regression.current:.4g}"
+            )
+        if regressions:
+            raise invoke.Exit(f"{len(regressions)} regressions", code=1)
+
+
 @invoke.task
 def run(ctx):
     """Run the program."""
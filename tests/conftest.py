@@ -0,0 +1,35 @@
+import threading
+import time
+from typing import Type
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import movegen
+
+
+class FirstMovePlayer(sc.Player):
+    def __init__(self, team, delay=0.0):
+        super().__init__(team)
+        self.delay = delay
+        self.threads = set()
+
+    def create_move(self, journal):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return next(movegen.generate(journal))
+
+
+@pytest.fixture
+def court_board() -> sc.Board:
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.ONE)
+    board[(2, 1)] = sc.Piece(sc.Team.TWO)
+    board[(5, 5)] = sc.Piece(sc.Team.TWO)
+    board[(0, 0)] = sc.Piece(sc.Team.TWO)
+    return board
+
+
+@pytest.fixture
+def first_move_player() -> Type[FirstMovePlayer]:
+    return FirstMovePlayer
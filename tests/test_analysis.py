@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import analysis, benchmarks, notation, search
+
+
+@pytest.fixture
+def records():
+    return benchmarks._records()
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "games.txt"
+    path.write_text("\n".join(benchmarks.CORPUS) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(0.0, 0.5), (1e9, 1.0), (-1e9, 0.0), (4.0, 0.731)]
+)
+def test_win_chance(value, expected):
+    assert analysis.win_chance(value) == pytest.approx(expected, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    "value, played_value, loss, accuracy",
+    [(2.0, 2.0, 0.0, 100.0), (2.0, 5.0, 0.0, 100.0), (1e9, -1e9, 1.0, 0.0)],
+)
+def test_ply_analysis(value, played_value, loss, accuracy):
+    move = sc.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    ply = analysis.PlyAnalysis(1, sc.Team.ONE, move, move, value, played_value)
+    assert ply.loss == pytest.approx(loss, abs=1e-3)
+    assert ply.accuracy == pytest.approx(accuracy, abs=0.1)
+
+
+def test_analyze_game(records):
+    record = records[0]
+    result = analysis.analyze_game(7, record, search.Searcher(2))
+    assert [ply.ply for ply in result.plies] == list(range(1, len(record.moves) + 1))
+    assert [ply.move for ply in result.plies] == record.moves
+    assert len(result.evaluations) == len(record.moves) + 1
+    assert result.evaluations[-1] == -analysis.EVAL_CAP
+    for ply in result.plies:
+        if ply.move == ply.best_move:
+            assert ply.loss == pytest.approx(0.0)
+
+    summary = result.to_dict(blunder=0.0)
+    assert summary["game"] == 7
+    assert summary["result"] == sc.Team.TWO.value
+    assert len(summary["blunders"]) == len(record.moves)
+    assert summary["blunders"][0]["move"] == notation.format_move(record.moves[0])
+    assert set(summary["accuracy"]) == {team.value for team in sc.Team}
+    json.dumps(summary)
+
+
+def test_analyze_game_too_shallow(records):
+    with pytest.raises(ValueError):
+        analysis.analyze_game(0, records[0], search.Searcher(1))
+
+
+def test_swings(records):
+    result = analysis.GameAnalysis(0, records[0])
+    result.evaluations = [0.0, 4.0, 1.0, 5.0, -8.0, 4.0, -4.0]
+    assert result.swings(0.25) == [4]
+    assert result.swings(0.1) == [4, 6]
+
+
+def test_completed_drops_partial_line(tmp_path):
+    path = tmp_path / "analysis.jsonl"
+    assert analysis.completed(str(path)) == set()
+    path.write_text('{"game": 3}\n{"game": 1}\n{"game"')
+    assert analysis.completed(str(path)) == {1, 3}
+    assert path.read_text() == '{"game": 3}\n{"game": 1}\n'
+
+
+def test_read_records_archive(tmp_path, source, records):
+    path = str(tmp_path / "games.scar")
+    with open(source) as file:
+        notation.to_archive(file, path)
+    assert [record.moves for record in analysis.read_records(path)] == [
+        record.moves for record in records
+    ]
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_analyze_to_file_resumes(tmp_path, source, workers):
+    path = tmp_path / "analysis.jsonl"
+    kwargs = dict(workers=workers, max_depth=2, node_limit=200)
+    assert analysis.analyze_to_file(source, str(path), **kwargs) == (3, 0)
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text(lines[0] + lines[1][:10])
+
+    assert analysis.analyze_to_file(source, str(path), **kwargs) == (2, 1)
+    games = [json.loads(line)["game"] for line in path.read_text().splitlines()]
+    assert sorted(games) == [0, 1, 2]
+
+    assert analysis.analyze_to_file(source, str(path), False, **kwargs) == (3, 0)
+    assert len(path.read_text().splitlines()) == 3
@@ -0,0 +1,129 @@
+import os
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import archives, games, selfplay
+
+
+@pytest.fixture(scope="module")
+def records():
+    players = [sc.EnginePlayer(team, max_depth=1) for team in sc.Team]
+    result = [record for _, record in selfplay.run(*players, 5, seed=1)]
+    result.append(games.GameRecord([], sc.PlayState.IN_PROGRESS))
+    result.append(games.GameRecord(result[0].moves[:3], sc.PlayState.ERROR, seed=9))
+    return result
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "games.scar")
+
+
+def test_pack_unpack_moves(records):
+    for record in records:
+        stream = archives.pack_moves(record.moves)
+        assert len(stream) == sum(len(move) + 1 for move in record.moves)
+        assert archives.unpack_moves(stream) == record.moves
+
+
+@pytest.mark.parametrize("stream", [b"\x03\x00\x01", b"\x02\x00\x40"])
+def test_unpack_moves_invalid(stream):
+    with pytest.raises(archives.ArchiveError):
+        archives.unpack_moves(stream)
+
+
+def test_archive_round_trip(records, path):
+    with archives.ArchiveWriter(path) as writer:
+        for index, record in enumerate(records):
+            assert writer.append(record) == index
+    with archives.Archive(path) as archive:
+        assert len(archive) == len(records)
+        assert list(archive) == records
+        assert archive[-1] == records[-1]
+        info = archive.info(2)
+        assert info.plies == len(records[2].moves)
+        assert info.seed == records[2].seed
+        journal = archive.journal(0)
+        assert journal.move_history == records[0].moves
+
+
+def test_archive_append(records, path):
+    with archives.ArchiveWriter(path) as writer:
+        writer.append(records[0])
+    with archives.ArchiveWriter(path, append=True) as writer:
+        for record in records[1:]:
+            writer.append(record)
+    with archives.Archive(path) as archive:
+        assert list(archive) == records
+
+
+def test_archive_append_size(records, path):
+    with archives.ArchiveWriter(path) as writer:
+        writer.append(records[0])
+    with archives.ArchiveWriter(path, append=True) as writer:
+        for record in records[1:]:
+            writer.append(record)
+    streams = sum(len(archives.pack_moves(record.moves)) for record in records)
+    index = 3 * archives.SEGMENT.size + len(records) * archives.RECORD.size
+    assert os.path.getsize(path) == archives.HEADER.size + streams + index
+
+
+def test_archive_append_crash(records, path):
+    with archives.ArchiveWriter(path) as writer:
+        writer.append(records[0])
+    writer = archives.ArchiveWriter(path, append=True)
+    writer.append(records[1])
+    writer._file.close()
+    with archives.Archive(path) as archive:
+        assert list(archive) == records[:1]
+    with archives.ArchiveWriter(path, append=True) as writer:
+        assert writer.append(records[2]) == 1
+    with archives.Archive(path) as archive:
+        assert list(archive) == [records[0], records[2]]
+
+
+@pytest.mark.parametrize("checkpoint", [1, 2, 3])
+def test_archive_checkpoint(records, path, checkpoint):
+    writer = archives.ArchiveWriter(path, checkpoint=checkpoint)
+    for record in records[:5]:
+        writer.append(record)
+    writer._file.close()
+    committed = 5 - 5 % checkpoint
+    with archives.Archive(path) as archive:
+        assert list(archive) == records[:committed]
+        if committed:
+            assert archive[committed - 1] == records[committed - 1]
+
+
+def test_archive_index_error(records, path):
+    with archives.ArchiveWriter(path) as writer:
+        writer.append(records[0])
+    with archives.Archive(path) as archive:
+        with pytest.raises(IndexError):
+            archive[1]  # noqa: B018
+
+
+def test_archive_not_closed(path):
+    with open(path, "wb") as file:
+        file.write(archives.HEADER.pack(archives.MAGIC, archives.VERSION, 0, 0))
+    with pytest.raises(archives.ArchiveError):
+        archives.Archive(path)
+
+
+def test_archive_invalid_result(records, path):
+    with archives.ArchiveWriter(path) as writer:
+        writer.append(records[0])
+    with open(path, "r+b") as file:
+        file.seek(-2, os.SEEK_END)
+        file.write(b"\x09")
+    with archives.Archive(path) as archive:
+        with pytest.raises(archives.ArchiveError):
+            archive[0]  # noqa: B018
+
+
+def test_archive_invalid_file(path):
+    with open(path, "wb") as file:
+        file.write(b"not an archive" * 4)
+    with pytest.raises(archives.ArchiveError):
+        archives.Archive(path)
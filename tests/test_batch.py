@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import geometry, movegen
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("supercheckers.batch")
+
+
+def random_journals(count: int, turns: int):
+    rng = random.Random(count * 1000 + turns)
+    result = []
+    for _ in range(count):
+        journal = sc.Journal(sc.Board())
+        for _ in range(rng.randrange(turns + 1)):
+            legal_moves = list(movegen.generate(journal))
+            if not legal_moves:
+                break
+            journal.apply(rng.choice(legal_moves))
+        result.append(journal)
+    return result
+
+
+def to_square(location):
+    row_id, col_id = location
+    return row_id * sc.Board.MAX_COL + col_id
+
+
+def test_board_batch_round_trip():
+    board_list = [journal.current_board for journal in random_journals(20, 30)]
+    board_batch = batch.BoardBatch.from_boards(board_list)
+    assert board_batch.cells.shape == (20, 64)
+    assert board_batch.to_boards() == board_list
+
+
+@pytest.mark.parametrize("size", [6, 10, 16])
+def test_board_batch_rejects_other_geometries(size):
+    board = sc.Board(geometry=geometry.get(size))
+    with pytest.raises(ValueError):
+        batch.BoardBatch.from_boards([sc.Board(), board])
+
+
+def test_board_batch_middle_teams():
+    journals = random_journals(30, 40)
+    board_batch = batch.BoardBatch.from_boards(j.current_board for j in journals)
+    middle_teams = board_batch.middle_teams()
+    for journal, row in zip(journals, middle_teams):
+        expected = journal.current_board.get_middle_teams()
+        assert {team for team, present in zip(sc.Team, row) if present} == expected
+
+
+def test_board_batch_moves_match_movegen():
+    journals = random_journals(30, 40)
+    board_batch = batch.BoardBatch.from_boards(j.current_board for j in journals)
+    teams = np.array([batch.TEAM_VALUES[j.current_team] for j in journals])
+    opening = np.array([j.current_turn_number <= 4 for j in journals])
+    slides = board_batch.slides(teams, opening)
+    jumps = board_batch.jumps(teams, opening)
+    for k, journal in enumerate(journals):
+        expected = {
+            (to_square(move.locations[0]), to_square(move.locations[1]))
+            for move in movegen.generate(journal)
+            if len(move) == 2
+        }
+        actual = set()
+        for square, direction_id in zip(*np.nonzero(slides[k])):
+            actual.add((square, batch.SLIDE_DST[square, direction_id]))
+        for square, direction_id in zip(*np.nonzero(jumps[k])):
+            actual.add((square, batch.JUMP_DST[square, direction_id]))
+        assert actual == expected
+
+
+def test_board_batch_random_moves_apply_like_board():
+    journals = random_journals(30, 40)
+    board_list = [journal.current_board for journal in journals]
+    board_batch = batch.BoardBatch.from_boards(board_list)
+    teams = np.array([batch.TEAM_VALUES[j.current_team] for j in journals])
+    opening = np.array([j.current_turn_number <= 4 for j in journals])
+    src, dst = board_batch.random_moves(teams, np.random.default_rng(0), opening)
+    board_batch.apply(src, dst)
+    for journal, board, src_square, dst_square in zip(journals, board_list, src, dst):
+        assert src_square >= 0
+        move = sc.Move(
+            journal.current_team,
+            (divmod(int(src_square), 8), divmod(int(dst_square), 8)),
+        )
+        assert move in set(movegen.generate(journal))
+        board.apply(move)
+    assert board_batch.to_boards() == board_list
+
+
+def test_board_batch_apply_skips_boards_without_moves():
+    board_batch = batch.BoardBatch.from_boards([sc.Board(), sc.Board()])
+    board_batch.apply(np.array([-1, 10]), np.array([-1, 18]))
+    expected = sc.Board()
+    expected.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert board_batch.to_boards() == [sc.Board(), expected]
@@ -0,0 +1,102 @@
+import subprocess
+import sys
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import benchmarks
+
+
+def test_corpus_is_legal():
+    verifier = sc.Verifier(sc.all_rules())
+    positions = benchmarks._positions()
+    assert len(positions) == sum(len(r.moves) for r in benchmarks._records())
+    for journal, move in positions:
+        assert verifier.verify(journal, move).is_valid
+    for journal, move in benchmarks._illegal_moves(positions[:20], verifier):
+        assert not verifier.verify(journal, move).is_valid
+
+
+@pytest.mark.parametrize(
+    "name", [name for name in benchmarks.BENCHMARKS if "perft" not in name]
+)
+def test_benchmark_cases(name):
+    case = benchmarks.BENCHMARKS[name]()
+    assert case.operations > 0
+    case.run()
+
+
+def test_run():
+    results = benchmarks.run(["utils.compare"], repeat=1)
+    assert list(results) == ["utils.compare"]
+    assert results["utils.compare"].seconds > 0
+    assert results["utils.compare"].operations == 64 * 64
+
+
+def test_compare():
+    baseline = {
+        "a": benchmarks.Measurement(1.0, 1),
+        "b": benchmarks.Measurement(1.0, 1, nodes=10),
+    }
+    results = {
+        "a": benchmarks.Measurement(1.1, 1),
+        "b": benchmarks.Measurement(1.5, 1, nodes=11),
+        "c": benchmarks.Measurement(9.0, 1),
+    }
+    assert benchmarks.compare(results, baseline, threshold=0.2) == [
+        benchmarks.Regression("b", "seconds", 1.0, 1.5),
+        benchmarks.Regression("b", "nodes", 10, 11),
+    ]
+    assert len(benchmarks.compare(results, baseline, threshold=0.05)) == 3
+
+
+def test_compare_budget():
+    results = {
+        "startup.import": benchmarks.Measurement(9.0, 1),
+        "startup.cli": benchmarks.Measurement(0.001, 1),
+    }
+    assert benchmarks.compare(results, {}) == [
+        benchmarks.Regression(
+            "startup.import", "budget", benchmarks.BUDGETS["startup.import"], 9.0
+        )
+    ]
+
+
+def test_startup_import_is_lazy():
+    code = (
+        "import sys, supercheckers as sc; "
+        "loaded = {'click', 'supercheckers.boards', 'typing'} & set(sys.modules); "
+        "sc.Board; "
+        "print(sorted(loaded), 'supercheckers.boards' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE, text=True
+    )
+    assert result.stdout.split() == ["[]", "True"]
+
+
+def test_console_player_import_is_lazy():
+    code = (
+        "import sys, supercheckers as sc; "
+        "sc.ConsolePlayer; "
+        "heavy = {'asyncio', 'concurrent.futures', 'pickle', 'uuid', 'numpy'}; "
+        "heavy |= {f'supercheckers.{name}' for name in ('mcts', 'search', 'books')}; "
+        "print(sorted(heavy & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE, text=True
+    )
+    assert result.stdout.split() == ["[]"]
+
+
+def test_save_load_report(tmp_path):
+    path = str(tmp_path / "bench.json")
+    results = {
+        "board.copy": benchmarks.Measurement(2e-6, 10),
+        "movegen.perft5": benchmarks.Measurement(0.5, 1, nodes=139924),
+    }
+    benchmarks.save(results, path)
+    assert benchmarks.load(path) == results
+    lines = benchmarks.report(results, {"board.copy": benchmarks.Measurement(1e-6, 10)})
+    assert "2.0 us" in lines and "+100.0%" in lines
+    assert "500.0 ms" in lines
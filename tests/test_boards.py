@@ -0,0 +1,214 @@
+import pytest
+
+import supercheckers as sc
+from supercheckers import boards, geometry
+
+
+@pytest.fixture
+def board() -> boards.Board:
+    return boards.Board()
+
+
+@pytest.fixture
+def empty_board() -> boards.Board:
+    return boards.Board(populate=False)
+
+
+def test_board_reset_masks(board):
+    mask_1, mask_2 = board.masks
+    assert bin(mask_1).count("1") == 24
+    assert bin(mask_2).count("1") == 24
+    assert mask_1 & mask_2 == 0
+    assert (mask_1 | mask_2) & boards.MIDDLE_MASK == 0
+
+
+@pytest.mark.parametrize(
+    "location, team",
+    [((0, 0), sc.Team.TWO), ((0, 1), sc.Team.ONE), ((7, 0), sc.Team.ONE)],
+)
+def test_board_getitem(board, location, team):
+    assert board[location] == boards.Piece(team, location)
+
+
+def test_board_getitem_empty(board):
+    assert board[(3, 3)] is None
+
+
+@pytest.mark.parametrize("location", [(-1, 0), (0, -1), (8, 0), (0, 8)])
+def test_board_getitem_invalid(board, location):
+    with pytest.raises(ValueError):
+        board[location]  # noqa: B018
+
+
+@pytest.mark.parametrize("location", [(-1, 0), (0, -1), (8, 0), (0, 8)])
+def test_board_setitem_invalid(board, location):
+    with pytest.raises(ValueError):
+        board[location] = None
+
+
+def test_board_setitem(empty_board):
+    piece = boards.Piece(sc.Team.ONE)
+    empty_board[(2, 3)] = piece
+    assert piece.location == (2, 3)
+    assert empty_board[(2, 3)] == piece
+    empty_board[(2, 3)] = boards.Piece(sc.Team.TWO)
+    assert empty_board.masks == (0, 1 << 19)
+    empty_board[(2, 3)] = None
+    assert empty_board.masks == (0, 0)
+
+
+def test_board_apply_slide(board):
+    board.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert board[(1, 2)] is None
+    assert board[(2, 2)] == boards.Piece(sc.Team.ONE, (2, 2))
+
+
+def test_board_apply_jump_captures(empty_board):
+    empty_board[(2, 2)] = boards.Piece(sc.Team.ONE)
+    empty_board[(3, 2)] = boards.Piece(sc.Team.TWO)
+    empty_board[(4, 3)] = boards.Piece(sc.Team.TWO)
+    empty_board[(5, 3)] = boards.Piece(sc.Team.TWO)
+    empty_board.apply(sc.Move(sc.Team.ONE, [(2, 2), (4, 2), (4, 4)]))
+    assert empty_board.masks == (1 << 36, 1 << 43)
+
+
+def test_board_apply_jump_own_piece(empty_board):
+    empty_board[(2, 2)] = boards.Piece(sc.Team.ONE)
+    empty_board[(2, 3)] = boards.Piece(sc.Team.ONE)
+    empty_board.apply(sc.Move(sc.Team.ONE, [(2, 2), (2, 4)]))
+    assert empty_board[(2, 3)] == boards.Piece(sc.Team.ONE, (2, 3))
+    assert empty_board[(2, 4)] == boards.Piece(sc.Team.ONE, (2, 4))
+
+
+def test_board_get_middle_teams(board):
+    assert board.get_middle_teams() == set()
+    board.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert board.get_middle_teams() == {sc.Team.ONE}
+    board.apply(sc.Move(sc.Team.TWO, [(1, 3), (2, 3)]))
+    assert board.get_middle_teams() == {sc.Team.ONE, sc.Team.TWO}
+
+
+def test_board_court_counts(board):
+    assert board.court_counts == (0, 0)
+    board.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    board.apply(sc.Move(sc.Team.ONE, [(1, 4), (2, 4)]))
+    assert board.court_counts == (2, 0)
+    board.apply(sc.Move(sc.Team.TWO, [(1, 3), (2, 3)]))
+    assert board.court_counts == (2, 1)
+    board[(2, 2)] = None
+    assert board.court_counts == (1, 1)
+
+
+def test_board_copy(board):
+    board_copy = board.copy()
+    board_copy.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert board.masks != board_copy.masks
+    assert boards.Board().masks == board.masks
+
+
+def test_board_from_masks(board):
+    assert boards.Board.from_masks(*board.masks).masks == board.masks
+
+
+def test_board_mask(board):
+    assert board.mask(sc.Team.ONE) == board.masks[0]
+    assert board.mask(sc.Team.TWO) == board.masks[1]
+
+
+def test_board_zobrist_hash_incremental(board):
+    board.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    board[(3, 2)] = boards.Piece(sc.Team.TWO)
+    board[(0, 0)] = None
+    board.apply(sc.Move(sc.Team.ONE, [(2, 2), (4, 2)]))
+    assert board.zobrist_hash == boards.Board.from_masks(*board.masks).zobrist_hash
+
+
+def test_board_zobrist_hash_changes(board):
+    before = board.zobrist_hash
+    board.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert board.zobrist_hash != before
+    board.apply(sc.Move(sc.Team.ONE, [(2, 2), (1, 2)]))
+    assert board.zobrist_hash == before
+
+
+def test_board_eq_and_hash(board):
+    other = boards.Board()
+    assert board == other
+    assert hash(board) == hash(other)
+    other[(0, 0)] = None
+    assert board != other
+    assert len({board, other, boards.Board()}) == 2
+
+
+def test_board_position_hash(board):
+    assert board.position_hash(sc.Team.ONE) == board.zobrist_hash
+    assert board.position_hash(sc.Team.TWO) != board.zobrist_hash
+
+
+def test_board_str(board):
+    lines = str(board).splitlines()
+    assert lines[0] == "   A B C D E F G H "
+    assert lines[2] == "8 |X|O|X|O|X|O|X|O| 8"
+    assert lines[4] == "6 |X|O# # # # #X|O| 6"
+
+
+def test_board_large():
+    large_geometry = geometry.get(10)
+    large_board = boards.Board(geometry=large_geometry)
+    assert large_board.masks == large_geometry.initial_masks
+    assert large_board != boards.Board.from_masks(
+        *large_board.masks, geometry.get(10, 10, 4)
+    )
+    assert repr(large_board) == "Board(geometry=Geometry(rows=10, cols=10, court=6))"
+    lines = str(large_board).splitlines()
+    assert lines[0] == "    A B C D E F G H I J "
+    assert lines[2] == "10 |X|O|X|O|X|O|X|O|X|O| 10"
+    assert lines[4] == " 8 |X|O# # # # # # #X|O| 8"
+
+    empty_board = boards.Board(populate=False, geometry=large_geometry)
+    empty_board[(9, 9)] = boards.Piece(sc.Team.ONE)
+    empty_board[(8, 9)] = boards.Piece(sc.Team.TWO)
+    empty_board[(7, 8)] = boards.Piece(sc.Team.TWO)
+    empty_board.apply(sc.Move(sc.Team.ONE, [(9, 9), (7, 9), (7, 7)]))
+    assert empty_board.masks == (1 << 77, 0)
+    assert empty_board.court_counts == (1, 0)
+    assert (
+        empty_board.zobrist_hash
+        == boards.Board.from_masks(1 << 77, 0, large_geometry).zobrist_hash
+    )
+
+
+@pytest.mark.parametrize(
+    "locations",
+    [[(2, 3), (1, 3)], [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)], [(2, 2), (2, 4)]],
+)
+def test_board_make_unmake(empty_board, locations):
+    empty_board[(2, 2)] = boards.Piece(sc.Team.ONE)
+    empty_board[(2, 3)] = boards.Piece(sc.Team.ONE)
+    empty_board[(3, 2)] = boards.Piece(sc.Team.TWO)
+    empty_board[(4, 3)] = boards.Piece(sc.Team.TWO)
+    empty_board[(3, 4)] = boards.Piece(sc.Team.TWO)
+    before = empty_board.copy()
+    move = sc.Move(sc.Team.ONE, locations)
+    applied = empty_board.copy()
+    applied.apply(move)
+
+    undo = empty_board.make(move)
+    assert empty_board == applied
+    assert empty_board.zobrist_hash == applied.zobrist_hash
+    empty_board.unmake(undo)
+    assert empty_board == before
+    assert empty_board.zobrist_hash == before.zobrist_hash
+
+
+def test_board_make_unmake_nested(board):
+    first = board.make(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    after_first = board.copy()
+    second = board.make(sc.Move(sc.Team.TWO, [(1, 3), (2, 3)]))
+    third = board.make(sc.Move(sc.Team.ONE, [(2, 2), (2, 4)]))
+    board.unmake(third)
+    board.unmake(second)
+    assert board == after_first
+    board.unmake(first)
+    assert board == boards.Board()
+    assert board.zobrist_hash == boards.Board().zobrist_hash
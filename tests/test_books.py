@@ -0,0 +1,78 @@
+import pickle
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import books, movegen
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "openings.scbk")
+
+
+@pytest.mark.parametrize("depth, expected", [(1, 1), (2, 9), (3, 73)])
+def test_positions(depth, expected):
+    keys = [key for key, _ in books.positions(depth)]
+    assert len(keys) == len(set(keys)) == expected
+
+
+def test_build_and_lookup(path):
+    assert books.build(path, depth=3, max_depth=1, workers=0) == 73
+    with books.Book(path) as book:
+        assert len(book) == 73
+        keys = [entry.key for entry in book]
+        assert keys == sorted(keys)
+        for key, (mask_1, mask_2, team_bit, turn_number) in books.positions(3):
+            board = sc.Board.from_masks(mask_1, mask_2)
+            team = sc.Board.TEAMS[team_bit]
+            entry = book.lookup(board, team, turn_number)
+            assert entry.key == key
+            assert entry.depth == 1
+            assert entry.move in movegen.generate(board, team, opening=True)
+        assert book.lookup(sc.Board(), sc.Team.ONE, 5) is None
+
+
+def test_build_extend(path):
+    books.build(path, depth=1, max_depth=2, workers=0)
+    assert books.build(path, depth=2, max_depth=1, workers=0, extend=True) == 9
+    with books.Book(path) as book:
+        assert book.lookup(sc.Board(), sc.Team.ONE, 1).depth == 2
+        assert sorted(entry.depth for entry in book) == [1] * 8 + [2]
+
+
+def test_build_workers(path):
+    assert books.build(path, depth=2, max_depth=1, workers=1) == 9
+
+
+def test_engine_player_uses_book(path):
+    books.build(path, depth=1, max_depth=2, workers=0)
+    with books.Book(path) as book:
+        player = sc.EnginePlayer(sc.Team.ONE, book=book)
+        move = player.create_move(sc.Journal(sc.Board()))
+        assert move == book.lookup(sc.Board(), sc.Team.ONE, 1).move
+        assert player.last_result.nodes == 0
+
+
+def test_pickle(path):
+    books.build(path, depth=1, max_depth=1, workers=0)
+    with books.Book(path) as book:
+        copy = pickle.loads(pickle.dumps(book))
+        assert list(copy) == list(book)
+        copy.close()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"not an opening book" * 4,
+        books.HEADER.pack(books.MAGIC, 2, 0),
+        books.HEADER.pack(books.MAGIC, books.VERSION, 1),
+    ],
+)
+def test_invalid_file(path, data):
+    with open(path, "wb") as file:
+        file.write(data)
+    with pytest.raises(books.BookError):
+        books.Book(path)
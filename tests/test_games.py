@@ -1,9 +1,10 @@
+import asyncio
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
 import supercheckers as sc
-from supercheckers import games
+from supercheckers import games, geometry, movegen
 
 
 @pytest.fixture
@@ -35,3 +36,132 @@ def test_games_current_player(game_state, mock_journal, turn_number):
 
 def test_games_current_player_starts(game_state, mock_player_1):
     assert game_state.current_player == mock_player_1
+
+
+@pytest.mark.parametrize(
+    "turn_number, court_counts, play_state, winner",
+    [
+        (4, (0, 0), sc.PlayState.NOT_STARTED, None),
+        (5, (2, 1), sc.PlayState.NOT_STARTED, None),
+        (5, (3, 0), sc.PlayState.COMPLETE, sc.Team.ONE),
+        (5, (0, 1), sc.PlayState.COMPLETE, sc.Team.TWO),
+        (5, (0, 0), sc.PlayState.COMPLETE, None),
+    ],
+)
+def test_games_update_play_state(
+    game_state, mock_journal, turn_number, court_counts, play_state, winner
+):
+    mock_journal.current_turn_number = turn_number
+    mock_journal.court_counts = court_counts
+    game_state.update_play_state()
+    assert game_state.play_state == play_state
+    assert game_state.winner == winner
+
+
+def test_game_record_to_dict():
+    record = games.GameRecord(
+        [sc.Move(sc.Team.ONE, [(1, 2), (2, 2)])], sc.PlayState.COMPLETE, sc.Team.ONE, 7
+    )
+    assert record.to_dict() == {
+        "play_state": "COMPLETE",
+        "winner": "X",
+        "turns": 1,
+        "seed": 7,
+        "moves": ["C2-C3"],
+    }
+
+
+@pytest.mark.parametrize("verbose", [True, False])
+def test_game_verbose(capsys, game_state, verbose):
+    game = games.Game(game_state, Mock(sc.Verifier), verbose=verbose)
+    game.begin()
+    assert bool(capsys.readouterr().out) is verbose
+
+
+def test_game_play_move(mock_player_1, mock_player_2):
+    state = games.GameState(mock_player_1, mock_player_2, sc.Journal(sc.Board()))
+    game = games.Game(state, sc.Verifier(sc.all_rules()), verbose=False)
+    game.begin()
+    assert not game.play_move(sc.Move(sc.Team.ONE, [(0, 0), (7, 7)]))
+    assert state.journal.current_turn_number == 1
+    move = next(movegen.generate(state.journal))
+    assert game.play_move(move)
+    assert state.journal.move_history == [move]
+    mock_player_1.create_move.assert_not_called()
+
+
+class FirstMoveAsyncPlayer(sc.AsyncPlayer):
+    async def create_move(self, journal):
+        await asyncio.sleep(0)
+        return next(movegen.generate(journal))
+
+
+def async_game(player_1, player_2):
+    state = games.GameState(player_1, player_2, sc.Journal(sc.Board()))
+    return games.AsyncGame(state, sc.Verifier(sc.all_rules()), verbose=False)
+
+
+def test_async_game_play():
+    game = async_game(
+        FirstMoveAsyncPlayer(sc.Team.ONE),
+        sc.EnginePlayer(sc.Team.TWO, max_depth=1),
+    )
+    record = asyncio.run(game.play(max_turns=8))
+    assert len(record.moves) == 8
+    assert record.replay().current_board == game.state.journal.current_board
+
+
+def test_async_games_share_a_loop():
+    async def play_all():
+        async_games = [
+            async_game(
+                FirstMoveAsyncPlayer(sc.Team.ONE), FirstMoveAsyncPlayer(sc.Team.TWO)
+            )
+            for _ in range(10)
+        ]
+        return await asyncio.gather(*(game.play(max_turns=6) for game in async_games))
+
+    records = asyncio.run(play_all())
+    assert all(record.moves == records[0].moves for record in records)
+    assert all(len(record.moves) == 6 for record in records)
+
+
+def test_game_rejects_async_players(game_state):
+    game_state.player_1 = FirstMoveAsyncPlayer(sc.Team.ONE)
+    game_state.journal.current_turn_number = 1
+    with pytest.raises(TypeError):
+        games.Game(game_state, Mock(sc.Verifier)).take_turn()
+
+
+def test_games_without_players():
+    state = games.GameState(None, None, sc.Journal(sc.Board()))
+    with pytest.raises(TypeError):
+        games.Game(state, Mock(sc.Verifier)).take_turn()
+    with pytest.raises(TypeError):
+        asyncio.run(games.AsyncGame(state, Mock(sc.Verifier)).play_turn())
+
+
+def test_async_game_error():
+    class FailingPlayer(sc.AsyncPlayer):
+        async def create_move(self, journal):
+            raise RuntimeError("disconnected")
+
+    game = async_game(FailingPlayer(sc.Team.ONE), FailingPlayer(sc.Team.TWO))
+    with pytest.raises(RuntimeError):
+        asyncio.run(game.play())
+    assert game.state.play_state == sc.PlayState.ERROR
+
+
+def test_game_large_board(monkeypatch):
+    inputs = iter(["B3 C3", "D2 D3", "E2 E3", "F2 F3", "E3 G3", "D3 B3"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(inputs))
+    journal = sc.Journal(sc.Board(geometry=geometry.get(10)))
+    state = games.GameState(
+        sc.ConsolePlayer(sc.Team.ONE), sc.ConsolePlayer(sc.Team.TWO), journal
+    )
+    with games.Game(state, sc.Verifier(sc.all_rules()), verbose=False) as game:
+        while game.in_progress:
+            game.take_turn()
+    assert journal.current_turn_number == 7
+    assert journal.court_counts == (1, 0)
+    assert state.winner == sc.Team.ONE
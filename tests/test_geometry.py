@@ -0,0 +1,128 @@
+import itertools
+import pickle
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import geometry, utils
+
+
+def test_descriptions_match_describe():
+    for src, dst in itertools.product(range(geometry.SQUARES), repeat=2):
+        src_loc, dst_loc = geometry.LOCATIONS[src], geometry.LOCATIONS[dst]
+        description = geometry.DESCRIPTIONS[src][dst]
+        assert description == geometry.describe(src_loc, dst_loc)
+        assert utils.compare(src_loc, dst_loc) is description
+
+
+def test_descriptions_are_interned():
+    unknown = geometry.DESCRIPTIONS[0][63]
+    assert geometry.DESCRIPTIONS[63][0] is unknown
+    descriptions = [d for row in geometry.DESCRIPTIONS for d in row]
+    assert len({id(d) for d in descriptions}) == len(set(descriptions))
+
+
+@pytest.mark.parametrize(
+    "src_loc, dst_loc", [((0, 0), (-1, 0)), ((7, 7), (7, 9)), ((-2, 3), (0, 3))]
+)
+def test_compare_off_the_board(src_loc, dst_loc):
+    assert utils.compare(src_loc, dst_loc) == geometry.describe(src_loc, dst_loc)
+
+
+def test_in_middle_off_the_board():
+    assert utils.in_middle((-1, 3)) is False
+    assert utils.in_middle((3, 8)) is False
+
+
+@pytest.mark.parametrize("square", range(geometry.SQUARES))
+def test_neighbors(square):
+    src_loc = geometry.LOCATIONS[square]
+    for dst in geometry.SLIDES[square]:
+        description = utils.compare(src_loc, geometry.LOCATIONS[dst])
+        assert description.move_type == sc.MoveType.SLIDE
+    for over, dst in geometry.JUMPS[square]:
+        description = utils.compare(src_loc, geometry.LOCATIONS[dst])
+        assert description.move_type == sc.MoveType.JUMP
+        assert geometry.to_square(description.jmp_loc) == over
+    row_id, col_id = src_loc
+    edges = (row_id in (0, 7)) + (col_id in (0, 7))
+    assert len(geometry.SLIDES[square]) == 4 - edges
+
+
+def test_middle_mask():
+    assert bin(geometry.MIDDLE_MASK).count("1") == 16
+
+
+@pytest.mark.parametrize("size", [10, 12, 14, 16])
+def test_geometry_sizes(size):
+    board_geometry = geometry.get(size)
+    assert board_geometry is geometry.get(size, size, size - 4)
+    assert board_geometry.squares == len(board_geometry.locations) == size * size
+    assert bin(board_geometry.middle_mask).count("1") == (size - 4) ** 2
+    mask_1, mask_2 = board_geometry.initial_masks
+    assert mask_1 & mask_2 == 0
+    assert (mask_1 | mask_2) & board_geometry.middle_mask == 0
+    assert bin(mask_1).count("1") == bin(mask_2).count("1")
+    assert bin(mask_1 | mask_2).count("1") == size * size - (size - 4) ** 2
+    for square, (row_id, col_id) in enumerate(board_geometry.locations):
+        edges = (row_id in (0, size - 1)) + (col_id in (0, size - 1))
+        assert len(board_geometry.slides[square]) == 4 - edges
+        for over, dst in board_geometry.jumps[square]:
+            description = board_geometry.descriptions[square][dst]
+            assert description.move_type == sc.MoveType.JUMP
+            assert board_geometry.to_square(description.jmp_loc) == over
+
+
+def test_geometry_default():
+    assert geometry.DEFAULT is geometry.get(8, 8, 4)
+    assert geometry.DEFAULT.descriptions is geometry.DESCRIPTIONS
+    assert sc.Board().masks == geometry.DEFAULT.initial_masks
+
+
+@pytest.mark.parametrize(
+    "src_loc, dst_loc", [((8, 2), (8, 4)), ((9, 9), (7, 9)), ((9, 9), (10, 9))]
+)
+def test_geometry_compare(src_loc, dst_loc):
+    board_geometry = geometry.get(10)
+    assert board_geometry.compare(src_loc, dst_loc) == geometry.describe(
+        src_loc, dst_loc
+    )
+
+
+@pytest.mark.parametrize(
+    "location, on_board, in_middle",
+    [
+        ((0, 0), True, False),
+        ((2, 2), True, True),
+        ((7, 7), True, True),
+        ((9, 9), True, False),
+        ((10, 0), False, False),
+        ((0, -1), False, False),
+    ],
+)
+def test_geometry_locations(location, on_board, in_middle):
+    board_geometry = geometry.get(10)
+    assert board_geometry.on_board(location) is on_board
+    assert board_geometry.in_middle(location) is in_middle
+
+
+@pytest.mark.parametrize(
+    "rows, cols, court",
+    [
+        (2, 2, None),
+        (9, 9, None),
+        (28, 28, None),
+        (10, 10, 0),
+        (10, 10, 3),
+        (10, 10, 10),
+        (12, 10, 10),
+    ],
+)
+def test_geometry_invalid(rows, cols, court):
+    with pytest.raises(ValueError):
+        geometry.get(rows, cols, court)
+
+
+def test_geometry_pickle():
+    board_geometry = geometry.get(12, 10, 4)
+    assert pickle.loads(pickle.dumps(board_geometry)) is board_geometry
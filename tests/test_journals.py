@@ -0,0 +1,104 @@
+import pytest
+
+import supercheckers as sc
+from supercheckers import geometry, journals, movegen
+
+
+@pytest.fixture
+def journal() -> journals.Journal:
+    return journals.Journal(sc.Board())
+
+
+def play(journal: journals.Journal, turns: int) -> None:
+    for _ in range(turns):
+        journal.apply(next(movegen.generate(journal)))
+
+
+def test_journal_init(journal):
+    assert journal.current_turn_number == 1
+    assert journal.current_team == sc.Team.ONE
+    assert journal.current_board.masks == sc.Board().masks
+    assert journal.move_history == []
+
+
+def test_journal_current_board_is_a_copy(journal):
+    journal.current_board.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert journal.current_board.masks == sc.Board().masks
+
+
+def test_journal_apply(journal):
+    move = sc.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    journal.apply(move)
+    board = sc.Board()
+    board.apply(move)
+    assert journal.current_turn_number == 2
+    assert journal.current_team == sc.Team.TWO
+    assert journal.current_board.masks == board.masks
+    assert journal.move_history == [move]
+
+
+@pytest.mark.parametrize("turns", [0, 1, 31, 32, 33, 70])
+def test_journal_board_at(journal, turns):
+    play(journal, turns)
+    board = sc.Board()
+    assert journal.board_at(1).masks == board.masks
+    for turn_number, move in enumerate(journal.move_history, start=2):
+        board.apply(move)
+        assert journal.board_at(turn_number).masks == board.masks
+    assert board.masks == journal.current_board.masks
+
+
+@pytest.mark.parametrize("turn_number", [0, 3])
+def test_journal_board_at_invalid(journal, turn_number):
+    play(journal, 1)
+    with pytest.raises(ValueError):
+        journal.board_at(turn_number)
+
+
+def test_journal_entries(journal):
+    play(journal, 40)
+    entries = list(journal.entries())
+    assert len(entries) == 41
+    assert entries[0][0] is None
+    for turn_number, (move, board) in enumerate(entries, start=1):
+        assert board.masks == journal.board_at(turn_number).masks
+    assert [move for move, _ in entries[1:]] == journal.move_history
+
+
+def test_journal_copy_shares_history(journal):
+    play(journal, 40)
+    journal_copy = journal.copy()
+    play(journal, 3)
+    play(journal_copy, 5)
+    assert journal.current_turn_number == 44
+    assert journal_copy.current_turn_number == 46
+    assert journal.move_history[:40] == journal_copy.move_history[:40]
+    for journal_ in (journal, journal_copy):
+        board = sc.Board()
+        for move in journal_.move_history:
+            board.apply(move)
+        assert board.masks == journal_.current_board.masks
+        assert journal_.board_at(41).masks == journal.board_at(41).masks
+
+
+def test_journal_position_hash(journal):
+    board_hash = journal.current_board.zobrist_hash
+    assert journal.position_hash == board_hash
+    journal.apply(sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]))
+    assert journal.position_hash == journal.current_board.position_hash(sc.Team.TWO)
+
+
+def test_journal_large_board():
+    board = sc.Board(populate=False, geometry=geometry.get(12))
+    board[(10, 3)] = sc.Piece(sc.Team.ONE)
+    journal = journals.Journal(board)
+    assert journal.geometry is board.geometry
+    move = sc.Move(sc.Team.ONE, [(10, 3), (10, 4)])
+    for _ in range(journal.SNAPSHOT_INTERVAL + 2):
+        journal.apply(move)
+        move = sc.Move(move.team, move.locations[::-1])
+    entries = list(journal.entries())
+    assert entries[0][1] == board
+    assert entries[1][1] == journal.board_at(2) != board
+    assert journal.board_at(journal.SNAPSHOT_INTERVAL + 1) == board
+    assert journal.current_board == journal.board_at(journal.current_turn_number)
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import mcts
+
+
+def test_encode(court_board):
+    board = court_board
+    assert mcts.encode(board, sc.Team.TWO, 7) == board.masks + (1, 7)
+
+
+def test_playout_game_over(court_board):
+    board = court_board
+    board[(2, 2)] = None
+    assert mcts.playout(mcts.encode(board, sc.Team.ONE, 5), random.Random(0)) == 1
+
+
+def test_playout_draw_after_max_turns():
+    assert (
+        mcts.playout(mcts.encode(sc.Board(), sc.Team.ONE, 1), random.Random(0), 0)
+        == mcts.DRAW
+    )
+
+
+def test_run_playouts(court_board):
+    batch = mcts.run_playouts(mcts.encode(court_board, sc.Team.TWO, 12), 5, 0)
+    assert batch.count == 5
+    assert batch.elapsed >= 0
+
+
+def test_search_finds_winning_capture(court_board):
+    searcher = mcts.MonteCarloSearcher(workers=0, playouts=300, batch_size=1, seed=0)
+    result = searcher.search(court_board, sc.Team.TWO, 12)
+    assert result.move == sc.Move(sc.Team.TWO, ((2, 1), (2, 3)))
+    assert result.playouts == 300
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_search_tiny_time_limit(workers, court_board):
+    searcher = mcts.MonteCarloSearcher(
+        workers=workers, time_limit=1e-9, batch_size=2, seed=0
+    )
+    try:
+        result = searcher.search(court_board, sc.Team.TWO, 12)
+    finally:
+        searcher.close()
+    assert result.move.team == sc.Team.TWO
+    assert result.playouts == 2
+
+
+def test_search_no_moves():
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.TWO)
+    with pytest.raises(ValueError):
+        mcts.MonteCarloSearcher(workers=0).search(board, sc.Team.ONE, 11)
+
+
+def test_monte_carlo_player_process_pool():
+    player = sc.MonteCarloPlayer(sc.Team.ONE, workers=2, playouts=32, seed=0)
+    journal = sc.Journal(sc.Board())
+    try:
+        move = player.create_move(journal)
+    finally:
+        player.close()
+    assert sc.Verifier(sc.all_rules()).verify(journal, move).is_valid
+    assert player.last_result.playouts == 32
+    assert sum(player.playout_rates.values()) > 0
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import games, metrics
+
+
+@pytest.fixture
+def recorded(first_move_player):
+    recorded = sc.Metrics()
+    state = sc.GameState(
+        first_move_player(sc.Team.ONE),
+        first_move_player(sc.Team.TWO),
+        sc.Journal(sc.Board()),
+    )
+    verifier = sc.Verifier(sc.all_rules(), recorded)
+    game = games.Game(state, verifier, verbose=False, metrics=recorded)
+    game.begin()
+    for _ in range(3):
+        game.take_turn()
+    verifier.verify(state.journal, sc.Move(sc.Team.TWO, [(0, 0), (0, 1)]))
+    return recorded
+
+
+def test_game_metrics(recorded):
+    assert [turn.turn_number for turn in recorded.turns] == [1, 2, 3]
+    assert set(recorded.turns[0].stages) == {stage.value for stage in sc.Stage}
+    assert recorded.stage_calls == {stage.value: 3 for stage in sc.Stage}
+    assert recorded.rule_calls["FirstFourMovesRule"] == 4
+    assert recorded.rule_failures["FirstFourMovesRule"] == 1
+
+
+def test_snapshot(recorded):
+    snapshot = json.loads(recorded.to_json())
+    assert snapshot["rules"]["CorrectTeamRule"]["calls"] == 4
+    assert snapshot["stages"]["verify"]["calls"] == 3
+    assert [turn["turn"] for turn in snapshot["turns"]] == [1, 2, 3]
+
+
+def test_to_prometheus(recorded):
+    lines = recorded.to_prometheus().splitlines()
+    assert "# TYPE supercheckers_rule_calls_total counter" in lines
+    assert 'supercheckers_rule_calls_total{rule="CorrectTeamRule"} 4' in lines
+    assert 'supercheckers_stage_calls_total{stage="apply"} 3' in lines
+
+
+@pytest.mark.parametrize("format_", ["json", "prometheus"])
+def test_export(tmp_path, recorded, format_):
+    path = tmp_path / "metrics.txt"
+    recorded.export(str(path), format_)
+    text = path.read_text()
+    assert "CorrectTeamRule" in text
+    assert text.endswith("\n")
+
+
+def test_export_unknown_format(tmp_path, recorded):
+    with pytest.raises(ValueError):
+        recorded.export(str(tmp_path / "metrics.txt"), "xml")
+
+
+def test_reset_and_max_turns():
+    recorded = metrics.Metrics(max_turns=2)
+    for turn_number in range(5):
+        recorded.record_turn(turn_number, metrics.Stopwatch())
+    assert [turn.turn_number for turn in recorded.turns] == [3, 4]
+    recorded.record_rule("Rule", 0.5, passed=False)
+    recorded.reset()
+    assert recorded.snapshot() == {"rules": {}, "stages": {}, "turns": []}
@@ -0,0 +1,155 @@
+import itertools
+import random
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import geometry, movegen, moves, notation, rules
+
+LOCATIONS = list(itertools.product(range(8), range(8)))
+
+
+def random_journal(seed: int, turns: int) -> sc.Journal:
+    rng = random.Random(seed)
+    journal = sc.Journal(sc.Board())
+    for _ in range(turns):
+        legal_moves = list(movegen.generate(journal))
+        if not legal_moves:
+            break
+        journal.apply(rng.choice(legal_moves))
+    return journal
+
+
+def test_generate_opening():
+    journal = sc.Journal(sc.Board())
+    legal_moves = list(movegen.generate(journal))
+    assert len(legal_moves) == 8
+    for move in legal_moves:
+        assert move.team == sc.Team.ONE
+        assert sc.in_middle(move.locations[-1])
+
+
+def test_generate_board_requires_team():
+    with pytest.raises(ValueError):
+        movegen.generate(sc.Board())
+
+
+def test_generate_board_defaults_to_not_opening():
+    board = sc.Board(populate=False)
+    board[(0, 0)] = sc.Piece(sc.Team.ONE)
+    legal_moves = set(movegen.generate(board, sc.Team.ONE))
+    assert legal_moves == {
+        sc.Move(sc.Team.ONE, ((0, 0), (1, 0))),
+        sc.Move(sc.Team.ONE, ((0, 0), (0, 1))),
+    }
+
+
+def test_generate_jump_chain_terminates():
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.ONE)
+    board[(2, 3)] = sc.Piece(sc.Team.ONE)
+    board[(3, 4)] = sc.Piece(sc.Team.ONE)
+    board[(4, 3)] = sc.Piece(sc.Team.ONE)
+    board[(3, 2)] = sc.Piece(sc.Team.TWO)
+    legal_moves = list(movegen.generate(board, sc.Team.ONE))
+    assert sc.Move(sc.Team.ONE, ((2, 2), (4, 2))) in legal_moves
+    assert sc.Move(sc.Team.ONE, ((2, 2), (2, 4), (4, 4), (4, 2))) in legal_moves
+    assert sc.Move(sc.Team.ONE, ((2, 2), (4, 2), (4, 4), (2, 4))) in legal_moves
+    assert max(len(move) for move in legal_moves) == 4
+
+
+def test_generate_jump_chain_fits_in_a_code():
+    board = sc.Board.from_masks(0x55AA41A2048A1583, 0x40051204028)
+    codes = list(movegen.generate_codes(board, sc.Team.ONE))
+    assert max(moves.length(code) for code in codes) <= moves.MAX_LOCATIONS
+    assert len(codes) == len(set(codes))
+    for code in codes:
+        move = moves.decode(code)
+        assert move.team == sc.Team.ONE
+        assert len(move) >= 2
+        assert moves.encode(move) == code
+
+
+def outcome(board: sc.Board, move: sc.Move):
+    after = board.copy()
+    after.make(move)
+    return move.locations[-1], after.masks
+
+
+def test_generate_shortest_jump_chains():
+    board = sc.Board.from_masks(0x55AA41A2048A1583, 0x40051204028)
+    move = notation.parse_move(
+        "A1-A3-A5-A7-C7-C5-C3-C1-E1-E3-G3-G5-E5-E3-E1-G1", sc.Team.ONE
+    )
+    outcomes = {outcome(board, move) for move in movegen.generate(board, sc.Team.ONE)}
+    assert outcome(board, move) in outcomes
+
+
+@pytest.mark.parametrize(
+    "masks",
+    [
+        (0x55AA41A2048A1583, 0x40051204028),
+        (0x55AA41A2048A1583, 0x40051204029),
+        (0x5500550055005500, 0x0055005500550055),
+    ],
+)
+def test_generate_jump_chains_are_complete(masks):
+    board = sc.Board.from_masks(*masks)
+    journal = sc.Journal(board)
+    verifier = sc.Verifier(
+        [
+            rule
+            for rule in sc.all_rules()
+            if not isinstance(rule, rules.FirstFourMovesRule)
+        ]
+    )
+    outcomes = {outcome(board, move) for move in movegen.generate(board, sc.Team.ONE)}
+    sources = [location for location in LOCATIONS if board[location] is not None]
+    rng = random.Random(0)
+    for _ in range(500):
+        locations = [rng.choice(sources)]
+        while len(locations) < moves.MAX_LOCATIONS:
+            row_id, col_id = locations[-1]
+            candidates = [
+                candidate
+                for candidate in (
+                    locations + [(row_id + row_step, col_id + col_step)]
+                    for row_step, col_step in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                )
+                if candidate[-1] in LOCATIONS
+                and verifier.verify(journal, sc.Move(sc.Team.ONE, candidate)).is_valid
+            ]
+            if not candidates:
+                break
+            locations = rng.choice(candidates)
+            move = sc.Move(sc.Team.ONE, locations)
+            assert outcome(board, move) in outcomes, move
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("turns", [0, 2, 4, 8, 20])
+def test_generate_matches_verifier(seed, turns):
+    journal = random_journal(seed, turns)
+    verifier = sc.Verifier(sc.all_rules())
+    team = journal.current_team
+    legal_moves = list(movegen.generate(journal))
+    assert len(legal_moves) == len(set(legal_moves))
+    for move in legal_moves:
+        assert verifier.verify(journal, move).is_valid, move
+    slides_and_jumps = {move for move in legal_moves if len(move) == 2}
+    expected = set()
+    for src_loc, dst_loc in itertools.product(LOCATIONS, LOCATIONS):
+        move = sc.Move(team, (src_loc, dst_loc))
+        if verifier.verify(journal, move).is_valid:
+            expected.add(move)
+    assert slides_and_jumps == expected
+
+
+@pytest.mark.parametrize("depth, expected", [(0, 1), (1, 8), (2, 64), (3, 556)])
+def test_perft(depth, expected):
+    assert movegen.perft(sc.Board(), sc.Team.ONE, depth) == expected
+
+
+def test_generate_large_board():
+    with pytest.raises(ValueError):
+        movegen.generate(sc.Board(geometry=geometry.get(10)), sc.Team.ONE)
@@ -1,3 +1,4 @@
+import pickle
 from unittest.mock import sentinel
 
 import pytest
@@ -26,3 +27,54 @@ def test_move_len(locations):
 def test_move_str(team, locations, expected):
     move = moves.Move(team, locations)
     assert str(move) == expected
+
+
+def test_move_locations_are_a_tuple():
+    move = moves.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    assert move.locations == ((1, 2), (2, 2))
+    assert move == moves.Move(sc.Team.ONE, ((1, 2), (2, 2)))
+    assert hash(move) == hash(moves.Move(sc.Team.ONE, ((1, 2), (2, 2))))
+
+
+def test_move_has_slots():
+    move = moves.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    assert not hasattr(move, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "team, locations, expected",
+    [
+        (sc.Team.ONE, [], 0),
+        (sc.Team.TWO, [(0, 0)], 0b11),
+        (sc.Team.ONE, [(1, 2), (2, 2)], 4 | 10 << 6 | 18 << 12),
+        (sc.Team.TWO, [(7, 7), (5, 7), (5, 5)], 7 | 63 << 6 | 47 << 12 | 45 << 18),
+    ],
+)
+def test_move_encode_decode(team, locations, expected):
+    move = moves.Move(team, locations)
+    assert moves.encode(move) == move.code == expected
+    assert moves.decode(expected) == move
+    assert moves.length(expected) == len(locations)
+
+
+@pytest.mark.parametrize(
+    "locations", [[(0, 0), (-1, 0)], [(8, 0)], [(0, 0), (0, 2)] * 16]
+)
+def test_move_encode_invalid(locations):
+    with pytest.raises(ValueError):
+        moves.encode(moves.Move(sc.Team.ONE, locations))
+
+
+def test_move_intern():
+    move = moves.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    interned = moves.intern(move)
+    assert interned == move
+    assert moves.intern(moves.Move(sc.Team.ONE, [(1, 2), (2, 2)])) is interned
+
+
+@pytest.mark.parametrize(
+    "locations", [[(1, 2), (2, 2)], [(1, 2), (-1, 2)], [(0, 0), (0, 2)] * 16]
+)
+def test_move_pickle(locations):
+    move = moves.Move(sc.Team.TWO, locations)
+    assert pickle.loads(pickle.dumps(move)) == move
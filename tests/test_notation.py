@@ -0,0 +1,128 @@
+import io
+import pathlib
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import archives, games, notation, rules, selfplay, verifiers
+
+
+@pytest.fixture(scope="module")
+def records():
+    players = [sc.EnginePlayer(team, max_depth=1) for team in sc.Team]
+    result = [record for _, record in selfplay.run(*players, 4, seed=2)]
+    result.append(games.GameRecord([], sc.PlayState.IN_PROGRESS))
+    result.append(games.GameRecord(result[0].moves[:3], sc.PlayState.ERROR, seed=9))
+    result.append(games.GameRecord(result[0].moves[:5], sc.PlayState.COMPLETE))
+    return result
+
+
+def test_format_move():
+    move = sc.Move(sc.Team.ONE, [(2, 2), (4, 2), (4, 4)])
+    assert notation.format_move(move) == "C3-C5-E5"
+
+
+def test_format_game():
+    record = games.GameRecord(
+        [
+            sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]),
+            sc.Move(sc.Team.TWO, [(6, 3), (5, 3)]),
+        ],
+        sc.PlayState.COMPLETE,
+        sc.Team.TWO,
+        seed=7,
+    )
+    assert notation.format_game(record) == "O @7 C2-C3 D7-D6"
+
+
+def test_round_trip(records):
+    text = io.StringIO()
+    assert notation.write_games(text, records) == len(records)
+    text.seek(0)
+    assert list(notation.read_games(text)) == records
+
+
+def test_readme_example():
+    readme = pathlib.Path(__file__).parent.parent / "README.md"
+    lines = readme.read_text().split("# result seed moves...\n", 1)[1]
+    line = lines.split("\n", 1)[0]
+    record = notation.parse_game(line)
+    assert notation.format_game(record) == line
+    verifier = verifiers.Verifier(rules.all_rules())
+    journal = sc.Journal(sc.Board())
+    for move in record.moves:
+        assert verifier.verify(journal, move).is_valid
+        journal.apply(move)
+    assert record.play_state == sc.PlayState.COMPLETE
+    assert journal.current_board.get_middle_teams() == {record.winner}
+
+
+def test_read_games_comments():
+    lines = ["# a comment\n", "\n", "* c2-c3 D7-d6\n", "   \n", "=\n"]
+    records = list(notation.read_games(lines))
+    assert len(records) == 2
+    assert records[0].moves == [
+        sc.Move(sc.Team.ONE, [(1, 2), (2, 2)]),
+        sc.Move(sc.Team.TWO, [(6, 3), (5, 3)]),
+    ]
+    assert records[0].play_state == sc.PlayState.IN_PROGRESS
+    assert records[1].play_state == sc.PlayState.COMPLETE
+    assert records[1].winner is None
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("Y C2-C3", "Invalid result 'Y'"),
+        ("X @seed C2-C3", "Invalid seed '@seed'"),
+        ("X C2-C3 Z9-C3", "Invalid square 'Z9'"),
+        ("X C2-C3 C3", "Invalid number of squares"),
+        ("X C2-C3 C3--C4", "Invalid square ''"),
+    ],
+)
+def test_read_games_invalid(line, message):
+    with pytest.raises(notation.NotationError, match=message) as info:
+        list(notation.read_games(["# header\n", "X C2-C3\n", line]))
+    assert info.value.line_number == 3
+    assert str(info.value).startswith("line 3: ")
+
+
+def test_archive_conversion(records, tmp_path):
+    path = str(tmp_path / "games.scar")
+    lines = [notation.format_game(record) + "\n" for record in records]
+    assert notation.to_archive(lines, path) == len(records)
+    with archives.Archive(path) as archive:
+        assert list(archive) == records
+    text = io.StringIO()
+    assert notation.from_archive(path, text) == len(records)
+    assert text.getvalue() == "".join(lines)
+
+
+def test_to_archive_invalid(records, tmp_path):
+    path = str(tmp_path / "games.scar")
+    lines = [notation.format_game(record) for record in records]
+    notation.to_archive(lines, path)
+    with open(path, "rb") as file:
+        before = file.read()
+    # Enough games to pass a checkpoint before the invalid line.
+    invalid_lines = lines * (archives.CHECKPOINT_GAMES // len(lines) + 1)
+    with pytest.raises(notation.NotationError):
+        notation.to_archive(invalid_lines + ["X C2-Z9"], path, append=True)
+    with open(path, "rb") as file:
+        assert file.read() == before
+    with archives.Archive(path) as archive:
+        assert len(archive) == len(records)
+
+
+def test_to_archive_invalid_new(tmp_path):
+    path = tmp_path / "games.scar"
+    with pytest.raises(notation.NotationError):
+        notation.to_archive(["X C2-C3", "X C2-Z9"], str(path))
+    assert not path.exists()
+
+
+def test_parse_move():
+    move = notation.parse_move("c3-C5-e5", sc.Team.TWO)
+    assert move == sc.Move(sc.Team.TWO, [(2, 2), (4, 2), (4, 4)])
+    with pytest.raises(notation.NotationError, match="Invalid square 'Z3'"):
+        notation.parse_move("C3-Z3", sc.Team.ONE)
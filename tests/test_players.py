@@ -0,0 +1,73 @@
+import asyncio
+import concurrent.futures
+import pickle
+import threading
+import time
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import movegen, players
+
+
+def test_console_player_parse_move_input():
+    player = sc.ConsolePlayer(sc.Team.ONE)
+    assert player.parse_move_input("c2, C3") == sc.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    with pytest.raises(ValueError):
+        player.parse_move_input("c2 to c3")
+
+
+def test_thread_player(first_move_player):
+    player = first_move_player(sc.Team.ONE)
+    async_player = sc.ThreadPlayer(player)
+    assert async_player.team == sc.Team.ONE
+    move = asyncio.run(async_player.create_move(sc.Journal(sc.Board())))
+    assert move == next(movegen.generate(sc.Journal(sc.Board())))
+    assert threading.get_ident() not in player.threads
+
+
+def test_thread_players_think_at_the_same_time(first_move_player):
+    async def think(count):
+        with concurrent.futures.ThreadPoolExecutor(count) as executor:
+            async_players = [
+                sc.ThreadPlayer(first_move_player(sc.Team.ONE, 0.2), executor)
+                for _ in range(count)
+            ]
+            journal = sc.Journal(sc.Board())
+            await asyncio.gather(*(p.create_move(journal) for p in async_players))
+
+    start = time.perf_counter()
+    asyncio.run(think(8))
+    assert time.perf_counter() - start < 0.2 * 4
+
+
+def test_process_player():
+    player = sc.EnginePlayer(sc.Team.ONE, max_depth=1)
+    journal = sc.Journal(sc.Board())
+
+    async def create_moves():
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            async_player = sc.ProcessPlayer(player, executor)
+            return [await async_player.create_move(journal) for _ in range(2)]
+
+    assert asyncio.run(create_moves()) == [player.create_move(journal)] * 2
+
+
+def test_process_player_cache(first_move_player):
+    players._process_players.clear()
+    payload = pickle.dumps(first_move_player(sc.Team.ONE))
+    journal = sc.Journal(sc.Board())
+    for key in range(players._PROCESS_PLAYERS_SIZE + 1):
+        players._create_move_in_process(str(key), payload, journal)
+    assert len(players._process_players) == players._PROCESS_PLAYERS_SIZE
+    assert "0" not in players._process_players
+    players._process_players.clear()
+
+
+@pytest.mark.parametrize(
+    "move_input, locations",
+    [("j10 J12", [(9, 9), (11, 9)]), ("P16,p14, n14", [(15, 15), (13, 15), (13, 13)])],
+)
+def test_console_player_parse_move_input_large(move_input, locations):
+    player = sc.ConsolePlayer(sc.Team.TWO)
+    assert player.parse_move_input(move_input) == sc.Move(sc.Team.TWO, locations)
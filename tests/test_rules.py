@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import geometry, rules
+
+
+@pytest.fixture
+def journal() -> sc.Journal:
+    return sc.Journal(sc.Board())
+
+
+def test_context_board_is_cached():
+    mock_journal = MagicMock(sc.Journal)
+    context = rules.Context(mock_journal, sc.Move(sc.Team.ONE, []))
+    assert context.board is context.board
+    assert context.board is mock_journal.current_board
+
+
+def test_context_descriptions(journal):
+    move = sc.Move(sc.Team.ONE, [(4, 4), (6, 4), (6, 2), (7, 2)])
+    context = rules.Context(journal, move)
+    assert context.descriptions == [
+        sc.Description(sc.Direction.NORTH, sc.MoveType.JUMP, (5, 4)),
+        sc.Description(sc.Direction.WEST, sc.MoveType.JUMP, (6, 3)),
+        sc.Description(sc.Direction.NORTH, sc.MoveType.SLIDE, None),
+    ]
+    assert context.descriptions is context.descriptions
+
+
+def test_jump_over_a_piece_rule_captures():
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.ONE)
+    board[(3, 2)] = sc.Piece(sc.Team.TWO)
+    journal = sc.Journal(board)
+    rule = rules.JumpOverAPieceRule()
+    context = rules.Context(journal, sc.Move(sc.Team.ONE, [(2, 2), (4, 2), (2, 2)]))
+    assert not rule.check(context)
+    assert context.board[(3, 2)] == sc.Piece(sc.Team.TWO, (3, 2))
+    assert rule.is_valid(journal, sc.Move(sc.Team.ONE, [(2, 2), (4, 2)]))
+
+
+class LegacyRule(rules.Rule):
+    message = "Only team one may move."
+
+    def is_valid(self, journal, move):
+        return move.team == sc.Team.ONE
+
+
+class EmptyRule(rules.Rule):
+    message = "Nothing is checked."
+
+
+def test_rule_check_delegates_to_is_valid(journal):
+    rule = LegacyRule()
+    assert rule.check(rules.Context(journal, sc.Move(sc.Team.ONE, [])))
+    assert not rule.check(rules.Context(journal, sc.Move(sc.Team.TWO, [])))
+
+
+def test_rule_without_check_or_is_valid(journal):
+    rule = EmptyRule()
+    move = sc.Move(sc.Team.ONE, [])
+    with pytest.raises(NotImplementedError):
+        rule.check(rules.Context(journal, move))
+    with pytest.raises(NotImplementedError):
+        rule.is_valid(journal, move)
+
+
+def test_all_rules_cost_order():
+    ordered = sorted(rules.all_rules(), key=lambda rule: rule.cost)
+    names = [rule.__class__.__name__ for rule in ordered]
+    board_rules = ["CorrectTeamRule", "FinalLandingLocationRule"]
+    for name in board_rules:
+        assert names.index("AlwaysOnTheBoardRule") < names.index(name)
+
+
+@pytest.mark.parametrize("rule_set", list(rules.RULE_SETS))
+def test_all_rules_rule_sets(rule_set):
+    names = [rule.__class__.__name__ for rule in rules.all_rules(rule_set)]
+    assert names == sorted(names)
+    assert set(names) <= set(rules.RULE_SETS["standard"])
+
+
+def test_all_rules_standard():
+    names = [rule.__class__.__name__ for rule in rules.all_rules()]
+    assert names == sorted(rules.RULES)
+    assert len(names) == 9
+
+
+def test_all_rules_invalid_rule_set():
+    with pytest.raises(ValueError):
+        rules.all_rules("chess")
+
+
+@pytest.mark.parametrize(
+    "locations, expected",
+    [([(9, 9), (9, 8)], True), ([(9, 9), (10, 9)], False), ([(0, 0), (-1, 0)], False)],
+)
+def test_always_on_the_board_rule_large(locations, expected):
+    journal = sc.Journal(sc.Board(geometry=geometry.get(10)))
+    move = sc.Move(sc.Team.ONE, locations)
+    assert rules.AlwaysOnTheBoardRule().is_valid(journal, move) is expected
+
+
+@pytest.mark.parametrize(
+    "locations, expected", [([(3, 2), (3, 3)], True), ([(1, 2), (2, 2)], False)]
+)
+def test_first_four_moves_rule_large(locations, expected):
+    journal = sc.Journal(sc.Board(geometry=geometry.get(10, court=4)))
+    move = sc.Move(sc.Team.ONE, locations)
+    assert rules.FirstFourMovesRule().is_valid(journal, move) is expected
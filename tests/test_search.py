@@ -0,0 +1,94 @@
+import pytest
+
+import supercheckers as sc
+from supercheckers import search
+
+
+def test_evaluate(court_board):
+    board = court_board
+    assert search.evaluate(board, sc.Team.ONE) == -2
+    assert search.evaluate(board, sc.Team.TWO) == 2
+    board[(5, 4)] = sc.Piece(sc.Team.ONE)
+    assert search.evaluate(board, sc.Team.ONE) == search.COURT_WEIGHT - 1
+
+
+@pytest.mark.parametrize(
+    "turn_number, expected", [(4, (False, None)), (5, (False, None))]
+)
+def test_winner_in_progress(turn_number, expected, court_board):
+    assert search.winner(court_board, turn_number) == expected
+
+
+def test_winner(court_board):
+    board = court_board
+    board[(5, 5)] = None
+    assert search.winner(board, 5) == (True, sc.Team.ONE)
+    board[(2, 2)] = None
+    assert search.winner(board, 5) == (True, None)
+
+
+def test_search_finds_winning_capture(court_board):
+    board = court_board
+    result = search.Searcher(max_depth=3).search(board, sc.Team.TWO, 12)
+    assert result.move == sc.Move(sc.Team.TWO, ((2, 1), (2, 3)))
+    assert result.value == search.WIN_SCORE - 1
+
+
+def test_search_table_mate_scores_are_ply_independent(court_board):
+    board = court_board
+    searcher = search.Searcher(max_depth=3)
+    window = (-search.WIN_SCORE - 1, search.WIN_SCORE + 1)
+    assert searcher._negamax(board, sc.Team.TWO, 12, 2, 5, *window) == (
+        search.WIN_SCORE - 6
+    )
+    key = search.position_key(board, sc.Team.TWO, 12)
+    assert searcher.table.probe(key).value == search.WIN_SCORE - 1
+    assert searcher._negamax(board, sc.Team.TWO, 12, 2, 1, *window) == (
+        search.WIN_SCORE - 2
+    )
+
+
+@pytest.mark.parametrize("value", [search.WIN_SCORE - 3, 1.5, 3 - search.WIN_SCORE])
+def test_table_value_round_trip(value):
+    assert search._from_table(search._to_table(value, 7), 7) == value
+
+
+def test_search_node_limit():
+    searcher = search.Searcher(max_depth=10, node_limit=500)
+    result = searcher.search(sc.Board(), sc.Team.ONE, 1)
+    assert searcher.nodes <= 501
+    assert result.depth < 10
+
+
+@pytest.mark.parametrize("node_limit", [None, 300])
+def test_search_leaves_board_unchanged(node_limit, court_board):
+    board = court_board
+    board[(5, 4)] = sc.Piece(sc.Team.ONE)
+    before = board.copy()
+    search.Searcher(max_depth=4, node_limit=node_limit).search(board, sc.Team.ONE, 9)
+    assert board == before
+    assert board.zobrist_hash == before.zobrist_hash
+
+
+def test_search_no_moves():
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.TWO)
+    with pytest.raises(ValueError):
+        search.Searcher().search(board, sc.Team.ONE, 11)
+
+
+def test_engine_player_moves_are_valid():
+    players = [sc.EnginePlayer(team, max_depth=2) for team in sc.Team]
+    journal = sc.Journal(sc.Board())
+    verifier = sc.Verifier(sc.all_rules())
+    for turn in range(12):
+        move = players[turn % 2].create_move(journal.copy())
+        assert verifier.verify(journal, move).is_valid
+        journal.apply(move)
+
+
+def test_position_key_opening():
+    board = sc.Board()
+    assert search.position_key(board, sc.Team.ONE, 4) != search.position_key(
+        board, sc.Team.ONE, 5
+    )
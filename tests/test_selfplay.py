@@ -0,0 +1,53 @@
+from unittest.mock import Mock
+
+import supercheckers as sc
+from supercheckers import selfplay
+
+
+def engine_players():
+    return (
+        sc.EnginePlayer(sc.Team.ONE, max_depth=1),
+        sc.EnginePlayer(sc.Team.TWO, max_depth=1),
+    )
+
+
+def test_play_game():
+    record = selfplay.play_game(*engine_players(), seed=3, random_turns=4)
+    assert record.seed == 3
+    assert record.play_state == sc.PlayState.COMPLETE
+    journal = record.replay()
+    assert journal.move_history == record.moves
+    assert journal.current_board.get_middle_teams() == (
+        {record.winner} if record.winner else set()
+    )
+
+
+def test_play_game_max_turns():
+    record = selfplay.play_game(*engine_players(), max_turns=2)
+    assert len(record.moves) == 2
+    assert record.play_state == sc.PlayState.IN_PROGRESS
+
+
+def test_play_game_invalid_move():
+    player_1 = Mock(sc.Player)
+    player_1.create_move.return_value = sc.Move(sc.Team.ONE, [(0, 0), (7, 7)])
+    record = selfplay.play_game(player_1, Mock(sc.Player))
+    assert record.play_state == sc.PlayState.ERROR
+    assert record.moves == []
+
+
+def test_run_is_reproducible_across_workers():
+    in_process = dict(selfplay.run(*engine_players(), 4, workers=0, seed=10))
+    in_pool = dict(selfplay.run(*engine_players(), 4, workers=2, seed=10))
+    assert sorted(in_process) == [0, 1, 2, 3]
+    assert in_process == in_pool
+
+
+def test_run_to_sink():
+    records = {}
+    results = selfplay.run_to_sink(
+        *engine_players(), 3, records.__setitem__, seed=5, max_turns=50
+    )
+    assert sorted(records) == [0, 1, 2]
+    assert sum(results.values()) == 3
+    assert records[1].seed == 6
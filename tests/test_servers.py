@@ -0,0 +1,186 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from supercheckers import enums, servers
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 30))
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, server):
+        return cls(*await asyncio.open_connection(server.host, server.port))
+
+    def send(self, **message):
+        self.writer.write(json.dumps(message).encode() + b"\n")
+
+    async def receive(self):
+        line = await self.reader.readline()
+        return json.loads(line) if line else None
+
+    async def join(self):
+        self.send(type="join")
+        return await self.receive()
+
+
+async def started(**kwargs):
+    server = servers.Server(port=0, **kwargs)
+    await server.start()
+    client_1, client_2 = await Client.connect(server), await Client.connect(server)
+    assert await client_1.join() == {"type": "waiting"}
+    client_2.send(type="join")
+    assert await client_1.receive() == {"type": "start", "game": 1, "team": "X"}
+    assert await client_2.receive() == {"type": "start", "game": 1, "team": "O"}
+    return server, client_1, client_2
+
+
+def test_play_and_resign():
+    async def scenario():
+        server, client_1, client_2 = await started()
+        client_2.send(type="move", move="D7-D6")
+        assert (await client_2.receive())["message"] == "Not your turn"
+        client_1.send(type="move", move="C2-Z3")
+        assert "Invalid square" in (await client_1.receive())["message"]
+        client_1.send(type="move", move="A1-A2")
+        error = await client_1.receive()
+        assert error["type"] == "error" and error["rules"]
+        client_1.send(type="move", move="c2-c3")
+        expected = {"type": "move", "game": 1, "turn": 1, "team": "X", "move": "C2-C3"}
+        assert await client_1.receive() == expected
+        assert await client_2.receive() == expected
+        client_2.send(type="resign")
+        end = {"type": "end", "game": 1, "winner": "X", "reason": "resign"}
+        assert await client_1.receive() == end
+        assert await client_2.receive() == end
+        assert await client_1.join() == {"type": "waiting"}
+        await server.shutdown()
+        assert server.results == {enums.EndReason.RESIGN: 1}
+
+    run(scenario())
+
+
+def test_move_timeout():
+    async def scenario():
+        server, client_1, client_2 = await started(move_timeout=0.05)
+        end = await client_2.receive()
+        assert end["winner"] == "O" and end["reason"] == "timeout"
+        await server.shutdown()
+
+    run(scenario())
+
+
+def test_disconnect():
+    async def scenario():
+        server, client_1, client_2 = await started()
+        client_2.writer.close()
+        end = await client_1.receive()
+        assert end["winner"] == "X" and end["reason"] == "disconnect"
+        await server.shutdown()
+
+    run(scenario())
+
+
+def test_shutdown():
+    async def scenario():
+        server, client_1, client_2 = await started()
+        waiting = await Client.connect(server)
+        assert await waiting.join() == {"type": "waiting"}
+        assert server.sessions == 1
+        await server.shutdown()
+        end = await client_1.receive()
+        assert end["winner"] is None and end["reason"] == "shutdown"
+        assert await client_1.receive() is None
+        assert await waiting.receive() is None
+        assert server.sessions == 0
+
+    run(scenario())
+
+
+@pytest.mark.parametrize("buffered, aborted", [(0, False), (1 << 21, True)])
+def test_connection_aborts_stalled_client(buffered, aborted):
+    writer = Mock(asyncio.StreamWriter)
+    writer.is_closing.return_value = False
+    writer.transport.get_write_buffer_size.return_value = buffered
+    servers.Connection(Mock(asyncio.StreamReader), writer).send(dict(type="waiting"))
+    writer.write.assert_called_once_with(b'{"type": "waiting"}\n')
+    assert writer.transport.abort.called is aborted
+
+
+def test_stalled_client(monkeypatch):
+    async def scenario():
+        server, client_1, client_2 = await started()
+        monkeypatch.setattr(servers, "MAX_WRITE_BUFFER", -1)
+        client_2.send(type="move", move="D7-D6")
+        assert (await client_2.receive())["message"] == "Not your turn"
+        assert await client_2.receive() is None
+        await server.shutdown()
+        assert server.results == {enums.EndReason.DISCONNECT: 1}
+
+    run(scenario())
+
+
+def test_match_timeout():
+    async def scenario():
+        server = servers.Server(port=0, match_timeout=0.05)
+        await server.start()
+        client = await Client.connect(server)
+        assert await client.join() == {"type": "waiting"}
+        assert await client.receive() == {
+            "type": "error",
+            "message": "No opponent found",
+        }
+        await server.shutdown()
+
+    run(scenario())
+
+
+def test_invalid_messages():
+    async def scenario():
+        server = servers.Server(port=0)
+        await server.start()
+        client = await Client.connect(server)
+        client.writer.write(b"not json\n")
+        assert "Invalid message" in (await client.receive())["message"]
+        client.writer.write(b"[1, 2]\n")
+        assert "JSON objects" in (await client.receive())["message"]
+        client.send(type="move", move="C2-C3")
+        assert (await client.receive())["message"] == "Join a game first"
+        await client.join()
+        assert (await client.join())["message"] == "Already waiting for an opponent"
+        await server.shutdown()
+
+    run(scenario())
+
+
+def test_load_test():
+    async def scenario():
+        server = servers.Server(port=0)
+        await server.start()
+        result = await servers.load_test(
+            server.host, server.port, games_count=4, max_turns=20
+        )
+        await server.shutdown()
+        return server, result
+
+    server, result = run(scenario())
+    assert sum(server.results.values()) == 4
+    assert result.moves == len(result.latencies) > 0
+    assert result.moves_per_second > 0
+    assert 0 < result.percentile(50) <= result.percentile(99)
+
+
+@pytest.mark.parametrize(
+    "percent, expected", [(0, 1.0), (50, 3.0), (99, 4.0), (100, 4.0)]
+)
+def test_percentile(percent, expected):
+    result = servers.LoadTestResult(1, 4, 1.0, [4.0, 2.0, 1.0, 3.0])
+    assert result.percentile(percent) == expected
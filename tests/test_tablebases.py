@@ -0,0 +1,155 @@
+import itertools
+import pickle
+import random
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import movegen, moves, search, tablebases
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tablebase") / "endgames.sctb")
+    assert tablebases.generate(path, 3) == tablebases.offsets(3)[-1]
+    with tablebases.Tablebase(path) as result:
+        yield result
+
+
+def random_positions(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        squares = rng.sample(range(64), 3)
+        mask_1 = mask_2 = 0
+        for square in squares:
+            if rng.getrandbits(1):
+                mask_2 |= 1 << square
+            else:
+                mask_1 |= 1 << square
+        yield sc.Board.from_masks(mask_1, mask_2), rng.choice(list(sc.Team))
+
+
+def test_index_is_perfect():
+    offsets = tablebases.offsets(2)
+    seen = set()
+    for pieces in range(3):
+        for squares in itertools.combinations(range(64), pieces):
+            for teams in range(1 << pieces):
+                mask_2 = sum(1 << s for i, s in enumerate(squares) if teams >> i & 1)
+                mask_1 = sum(1 << s for s in squares) ^ mask_2
+                for team_bit in (0, 1):
+                    seen.add(tablebases.index(mask_1, mask_2, team_bit, offsets))
+    assert seen == set(range(offsets[-1]))
+
+
+def test_index_too_many_pieces():
+    assert tablebases.index(0b111, 0, 0, tablebases.offsets(2)) == -1
+
+
+def test_play_matches_board():
+    for board, team in random_positions(200, seed=1):
+        for code in movegen.generate_codes(board, team, opening=False):
+            child = board.copy()
+            child.apply(moves.decode(code))
+            assert tablebases._play(code, *board.masks) == child.masks
+
+
+@pytest.mark.parametrize(
+    "team, expected", [(sc.Team.ONE, sc.Outcome.WIN), (sc.Team.TWO, sc.Outcome.LOSS)]
+)
+def test_probe_game_over(tablebase, team, expected):
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.ONE)
+    board[(0, 0)] = sc.Piece(sc.Team.TWO)
+    assert tablebase.probe(board, team) == tablebases.Probe(expected, 0)
+
+
+def test_probe_too_many_pieces(tablebase):
+    assert tablebase.probe(sc.Board(), sc.Team.ONE) is None
+    assert tablebase.best_move(sc.Board(), sc.Team.ONE) is None
+
+
+def test_probe_matches_search(tablebase):
+    checked = 0
+    for board, team in random_positions(2000, seed=2):
+        probe = tablebase.probe(board, team)
+        if probe.outcome == sc.Outcome.DRAW or not 0 < probe.distance <= 3:
+            continue
+        result = search.Searcher(max_depth=probe.distance).search(board, team, 10)
+        if probe.outcome == sc.Outcome.WIN:
+            assert result.value == search.WIN_SCORE - probe.distance
+        else:
+            assert result.value == probe.distance - search.WIN_SCORE
+        checked += 1
+    assert checked > 10
+
+
+def test_best_move_wins(tablebase):
+    for board, team in random_positions(2000, seed=3):
+        probe = tablebase.probe(board, team)
+        if probe.outcome == sc.Outcome.WIN and probe.distance >= 5:
+            break
+    else:
+        pytest.fail("No long win found")
+    winning_team = team
+    for ply in range(probe.distance):
+        assert search.winner(board, 10) == (False, None)
+        board.apply(tablebase.best_move(board, team))
+        team = search.opponent(team)
+    assert search.winner(board, 10) == (True, winning_team)
+
+
+def test_searcher_uses_tablebase(tablebase):
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.ONE)
+    board[(2, 3)] = sc.Piece(sc.Team.TWO)
+    board[(0, 0)] = sc.Piece(sc.Team.TWO)
+    searcher = search.Searcher(max_depth=4, tablebase=tablebase)
+    result = searcher.search(board, sc.Team.ONE, 10)
+    assert result.depth == 0
+    assert result.value == search.WIN_SCORE - 1
+    assert result.move == sc.Move(sc.Team.ONE, [(2, 2), (2, 4)])
+
+
+def test_generate_no_moves_is_a_loss(tmp_path, monkeypatch):
+    monkeypatch.setattr(movegen, "generate_codes", lambda *args, **kwargs: [])
+    path = str(tmp_path / "stuck.sctb")
+    tablebases.generate(path, 2)
+    board = sc.Board(populate=False)
+    board[(2, 2)] = sc.Piece(sc.Team.ONE)
+    board[(3, 3)] = sc.Piece(sc.Team.TWO)
+    with tablebases.Tablebase(path) as tablebase:
+        for team in sc.Team:
+            assert tablebase.probe(board, team) == (sc.Outcome.LOSS, 0)
+
+
+@pytest.mark.parametrize("max_pieces", [0, tablebases.MAX_PIECES + 1])
+def test_generate_invalid_max_pieces(tmp_path, max_pieces):
+    with pytest.raises(ValueError):
+        tablebases.generate(str(tmp_path / "invalid.sctb"), max_pieces)
+
+
+def test_pickle(tablebase):
+    copy = pickle.loads(pickle.dumps(tablebase))
+    assert copy.path == tablebase.path
+    assert len(copy) == len(tablebase)
+    copy.close()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"not a tablebase" * 4,
+        tablebases.HEADER.pack(tablebases.MAGIC, 2, 2, tablebases.offsets(2)[-1]),
+        tablebases.HEADER.pack(tablebases.MAGIC, tablebases.VERSION, 2, 5),
+        tablebases.HEADER.pack(
+            tablebases.MAGIC, tablebases.VERSION, 2, tablebases.offsets(2)[-1]
+        ),
+    ],
+)
+def test_invalid_file(tmp_path, data):
+    path = tmp_path / "invalid.sctb"
+    path.write_bytes(data)
+    with pytest.raises(tablebases.TablebaseError):
+        tablebases.Tablebase(str(path))
@@ -0,0 +1,161 @@
+import collections
+import functools
+import math
+from unittest import mock
+
+import pytest
+
+import supercheckers as sc
+from supercheckers import games, players, tournaments
+
+
+def factories():
+    return {
+        "shallow": functools.partial(sc.EnginePlayer, max_depth=1),
+        "deep": functools.partial(sc.EnginePlayer, max_depth=2),
+    }
+
+
+@pytest.mark.parametrize(
+    "kind, rounds, expected",
+    [
+        (sc.Schedule.ROUND_ROBIN, 1, 12),
+        (sc.Schedule.ROUND_ROBIN, 3, 36),
+        (sc.Schedule.GAUNTLET, 2, 12),
+    ],
+)
+def test_schedule(kind, rounds, expected):
+    names = ["a", "b", "c", "d"]
+    pairings = list(tournaments.schedule(names, rounds, kind, seed=10))
+    assert len(pairings) == expected
+    assert [pairing.game for pairing in pairings] == list(range(expected))
+    as_one = collections.Counter(pairing.player_1 for pairing in pairings)
+    as_two = collections.Counter(pairing.player_2 for pairing in pairings)
+    assert as_one == as_two
+    for first, second in zip(pairings[::2], pairings[1::2]):
+        assert (first.player_1, first.player_2) == (second.player_2, second.player_1)
+        assert first.seed == second.seed
+    if kind == sc.Schedule.GAUNTLET:
+        assert all("a" in (pairing.player_1, pairing.player_2) for pairing in pairings)
+
+
+@pytest.mark.parametrize(
+    "play_state, winner, moves_count, expected",
+    [
+        (sc.PlayState.COMPLETE, sc.Team.ONE, 9, 1.0),
+        (sc.PlayState.COMPLETE, sc.Team.TWO, 10, 0.0),
+        (sc.PlayState.COMPLETE, None, 10, 0.5),
+        (sc.PlayState.IN_PROGRESS, None, 500, 0.5),
+        (sc.PlayState.ERROR, None, 4, 0.0),
+        (sc.PlayState.ERROR, None, 5, 1.0),
+    ],
+)
+def test_score(play_state, winner, moves_count, expected):
+    move = sc.Move(sc.Team.ONE, [(1, 2), (2, 2)])
+    record = games.GameRecord([move] * moves_count, play_state, winner)
+    assert tournaments.score(record) == expected
+
+
+@pytest.mark.parametrize("elo", [-300.0, 0.0, 12.5, 400.0])
+def test_elo_difference(elo):
+    score = tournaments.expected_score(elo)
+    assert tournaments.elo_difference(score) == pytest.approx(elo)
+
+
+def test_standings():
+    standings = tournaments.Standings(["a", "b"])
+    for game, result in enumerate([1.0, 1.0, 0.5, 0.0]):
+        standings.record(tournaments.Pairing(game, "a", "b", 0), result)
+    assert standings.totals("a") == (2, 1, 1)
+    assert standings.totals("b") == (1, 1, 2)
+    assert standings.games == 4
+    elo = standings.elo("a")
+    assert elo.lower < elo.elo < elo.upper
+    assert standings.elo("b").elo == pytest.approx(-elo.elo)
+    report = standings.report()
+    assert "2-1-1" in report and "1-1-2" in report
+
+
+def test_standings_perfect_score():
+    standings = tournaments.Standings(["a", "b"])
+    standings.record(tournaments.Pairing(0, "b", "a", 0), 0.0)
+    assert standings.elo("a").elo == math.inf
+    assert standings.elo("b").elo == -math.inf
+
+
+@pytest.mark.parametrize(
+    "wins, draws, losses, expected",
+    [
+        (0, 0, 0, None),
+        (10, 10, 10, None),
+        (60, 20, 20, sc.Hypothesis.H1),
+        (20, 20, 60, sc.Hypothesis.H0),
+    ],
+)
+def test_sprt(wins, draws, losses, expected):
+    sprt = tournaments.SPRT(elo0=0.0, elo1=50.0)
+    lower, upper = sprt.bounds
+    assert lower == pytest.approx(-upper)
+    assert sprt.decide(wins, draws, losses) == expected
+
+
+@pytest.mark.parametrize(
+    "spec, name, max_depth",
+    [("a=engine", "a", 4), ("deep=engine:max_depth=6,node_limit=100", "deep", 6)],
+)
+def test_parse_player(spec, name, max_depth):
+    player_name, factory = tournaments.parse_player(spec)
+    player = factory(sc.Team.TWO)
+    assert player_name == name
+    assert player.team == sc.Team.TWO
+    assert player.searcher.max_depth == max_depth
+
+
+@pytest.mark.parametrize(
+    "spec", ["engine", "=engine", "a=chess", "a=engine:depth=2", "a=engine:x=y"]
+)
+def test_parse_player_invalid(spec):
+    with pytest.raises(ValueError):
+        tournaments.parse_player(spec)
+
+
+def test_parse_player_does_not_create_a_player():
+    with mock.patch.object(
+        players.MonteCarloPlayer, "__init__", autospec=True, return_value=None
+    ) as init:
+        tournaments.parse_player("mc=montecarlo:playouts=10")
+        with pytest.raises(ValueError):
+            tournaments.parse_player("mc=montecarlo:depth=2")
+    init.assert_not_called()
+
+
+def test_play_worker_game_closes_players():
+    factory = functools.partial(sc.MonteCarloPlayer, workers=0, playouts=4, seed=1)
+    tournaments._init_worker({"mc": factory}, max_turns=2, random_turns=0)
+    with mock.patch.object(players.MonteCarloPlayer, "close") as close:
+        pairing = tournaments.Pairing(0, "mc", "mc", 3)
+        assert tournaments._play_worker_game(pairing)[0] == pairing
+    assert close.call_count == 2
+
+
+def test_run():
+    played = []
+    result = tournaments.run(
+        factories(), rounds=1, workers=0, sink=lambda *args: played.append(args)
+    )
+    assert result.standings.games == len(played) == 2
+    assert result.hypothesis is None
+    assert sum(result.standings.totals("shallow")) == 2
+
+
+def test_run_sprt_stops_early():
+    sprt = tournaments.SPRT(elo0=0.0, elo1=400.0, alpha=0.2, beta=0.2)
+    result = tournaments.run(factories(), rounds=50, workers=1, sprt=sprt)
+    assert result.hypothesis == sc.Hypothesis.H0
+    assert result.llr is not None and result.llr <= sprt.bounds[0]
+    assert result.standings.games < 100
+
+
+def test_run_needs_two_players():
+    with pytest.raises(ValueError):
+        tournaments.run({"a": functools.partial(sc.EnginePlayer)}, workers=0)
@@ -0,0 +1,51 @@
+import pytest
+
+import supercheckers as sc
+from supercheckers import transpositions
+
+
+@pytest.mark.parametrize("size", [0, 3, 100])
+def test_table_invalid_size(size):
+    with pytest.raises(ValueError):
+        transpositions.TranspositionTable(size)
+
+
+def test_table_probe_counters():
+    table = transpositions.TranspositionTable(4)
+    assert table.probe(1) is None
+    assert table.store(1, depth=2, value=0.5)
+    entry = table.probe(1)
+    assert entry == transpositions.Entry(1, 2, 0.5)
+    assert table.probe(5) is None
+    assert (table.hits, table.misses) == (1, 2)
+    assert table.hit_rate == pytest.approx(1 / 3)
+    assert len(table) == 1
+
+
+def test_table_always_replace():
+    table = transpositions.TranspositionTable(4, sc.Replacement.ALWAYS)
+    table.store(1, depth=5, value=1.0)
+    assert table.store(5, depth=1, value=2.0)
+    assert table.probe(1) is None
+    assert table.probe(5).value == 2.0
+
+
+def test_table_depth_preferred():
+    table = transpositions.TranspositionTable(4, sc.Replacement.DEPTH_PREFERRED)
+    table.store(1, depth=5, value=1.0)
+    assert not table.store(5, depth=1, value=2.0)
+    assert table.probe(1).value == 1.0
+    assert table.store(1, depth=1, value=3.0)
+    assert table.probe(1).value == 3.0
+    table.new_search()
+    assert table.store(5, depth=0, value=4.0)
+    assert table.probe(5).value == 4.0
+
+
+def test_table_clear():
+    table = transpositions.TranspositionTable(4)
+    table.store(1, depth=1, value=1.0)
+    table.probe(1)
+    table.clear()
+    assert len(table) == 0
+    assert (table.hits, table.misses) == (0, 0)
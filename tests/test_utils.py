@@ -64,3 +64,11 @@ def test_to_int_lower(value, expected):
 )
 def test_to_char(value, expected):
     assert utils.to_char(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(15, "P"), (25, "Z"), (26, "AA"), (27, "AB"), (702, "AAA")]
+)
+def test_to_char_to_int_columns(value, expected):
+    assert utils.to_char(value) == expected
+    assert utils.to_int(expected) == utils.to_int(expected.lower()) == value
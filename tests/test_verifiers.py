@@ -1,17 +1,19 @@
-from unittest.mock import Mock, call, sentinel
+from unittest.mock import ANY, Mock, call, sentinel
 
 import pytest
 
 import supercheckers as sc
-from supercheckers import verifiers
+from supercheckers import rules, verifiers
 
 
 @pytest.fixture
 def mock_all_rules():
     rule_1 = Mock(sc.Rule)
-    rule_1.is_valid.return_value = True
+    rule_1.cost = 2
+    rule_1.check.return_value = True
     rule_2 = Mock(sc.Rule)
-    rule_2.is_valid.return_value = False
+    rule_2.cost = 1
+    rule_2.check.return_value = False
     return [rule_1, rule_2]
 
 
@@ -36,5 +38,53 @@ def test_verifier_validate(verifier, mock_all_rules):
     result = verifier.verify(sentinel.journal, sentinel.move)
     assert isinstance(result, verifiers.Result)
     assert result.failed_rules == [rule_2]
-    assert rule_1.mock_calls == [call.is_valid(sentinel.journal, sentinel.move)]
-    assert rule_2.mock_calls == [call.is_valid(sentinel.journal, sentinel.move)]
+    assert rule_1.mock_calls == [call.check(ANY)]
+    assert rule_2.mock_calls == [call.check(ANY)]
+    context = rule_1.check.call_args[0][0]
+    assert isinstance(context, rules.Context)
+    assert context.journal is sentinel.journal
+    assert context.move is sentinel.move
+    assert rule_2.check.call_args[0][0] is context
+
+
+def test_verifier_validate_fail_fast(verifier, mock_all_rules):
+    rule_1, rule_2 = mock_all_rules
+    result = verifier.verify(sentinel.journal, sentinel.move, fail_fast=True)
+    assert result.failed_rules == [rule_2]
+    assert rule_1.mock_calls == []
+    assert rule_2.mock_calls == [call.check(ANY)]
+
+
+@pytest.mark.parametrize(
+    "locations",
+    [
+        [(1, 2), (2, 2)],
+        [(1, 2), (3, 2)],
+        [(1, 3), (2, 3)],
+        [(1, 2)],
+        [(1, 2), (2, 3)],
+        [(0, 0), (-1, 0)],
+        [(2, 2), (1, 2)],
+    ],
+)
+def test_verifier_fail_fast_agrees(locations):
+    verifier = verifiers.Verifier(sc.all_rules())
+    journal = sc.Journal(sc.Board())
+    move = sc.Move(sc.Team.ONE, locations)
+    fast = verifier.verify(journal, move, fail_fast=True)
+    if fast.is_valid:
+        assert verifier.verify(journal, move).is_valid
+    else:
+        (rule,) = fast.failed_rules
+        assert not rule.is_valid(journal, move)
+
+
+@pytest.mark.parametrize("fail_fast, calls", [(False, 2), (True, 1)])
+def test_verifier_metrics(mock_all_rules, fail_fast, calls):
+    metrics = sc.Metrics()
+    verifier = verifiers.Verifier(mock_all_rules, metrics)
+    result = verifier.verify(Mock(sc.Journal), Mock(sc.Move), fail_fast)
+    assert result.failed_rules == [mock_all_rules[1]]
+    assert sum(metrics.rule_calls.values()) == calls
+    assert sum(metrics.rule_failures.values()) == 1
+    assert all(seconds >= 0 for seconds in metrics.rule_seconds.values())